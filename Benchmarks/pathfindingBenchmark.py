@@ -0,0 +1,158 @@
+# @file pathfindingBenchmark.py
+# @brief Benchmark sin pantalla de los algoritmos de pathfinding sobre mapas aleatorios
+# @author Anya Marcano
+# @date 2026/10/18
+
+import argparse
+import os
+import random
+import sys
+import time
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, "Pathfinding"))
+sys.path.append(os.path.join(ROOT, "WorldRepresentation"))
+
+import numpy as np
+from tileGraph import TileGraph
+from graph import Graph
+from aStar import pathfind_astar, pathfind_bidirectional_astar
+from manhattanHeuristic import ManhattanHeuristic
+from hierarchicalPathfinding import HierarchicalPathfinder
+from landmarkHeuristic import LandmarkTables
+from searchStats import SearchStats
+
+def random_walkable(size: int, density: float, seed: int) -> np.ndarray:
+    """
+    Genera una grilla de tiles caminables con paredes aleatorias.
+    Args:
+        size (int): El lado de la grilla en tiles.
+        density (float): La proporción de paredes.
+        seed (int): La semilla del generador.
+    Returns:
+        np.ndarray: Grilla (size, size) con True en los tiles caminables.
+    """
+    return np.random.default_rng(seed).random((size, size)) >= density
+
+class CountingGraph(Graph):
+    """
+    Grafo que delega en otro y cuenta los nodos expandidos (las consultas de conexiones salientes o entrantes).
+    Copia las dimensiones y la conectividad de una grilla de tiles para que las heurísticas usen sus tablas.
+    Attributes:
+        base (Graph): El grafo que se consulta.
+        expanded (int): La cantidad de nodos expandidos desde el último reinicio.
+    """
+    def __init__(self, base: Graph):
+        super().__init__()
+        self.base = base
+        self.expanded = 0
+        for name in ("width", "height", "diagonal"):
+            if hasattr(base, name):
+                setattr(self, name, getattr(base, name))
+
+    def get_connections(self, from_node):
+        self.expanded += 1
+        return self.base.get_connections(from_node)
+
+    def get_incoming_connections(self, to_node):
+        self.expanded += 1
+        return self.base.get_incoming_connections(to_node)
+
+    def is_reachable(self, from_node, to_node):
+        return self.base.is_reachable(from_node, to_node)
+
+def path_cost(path) -> float:
+    return sum(connection.get_cost() for connection in path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de pathfinding sobre un mapa aleatorio")
+    parser.add_argument("--size", type=int, default=128)
+    parser.add_argument("--density", type=float, default=0.25)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--cluster-size", type=int, default=16)
+    parser.add_argument("--landmarks", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph = TileGraph.from_walkable(random_walkable(args.size, args.density, args.seed))
+    tiles = list(graph.nodes.values())
+    rng = random.Random(args.seed)
+
+    # Consultas entre tiles alcanzables, con el costo óptimo de A* como referencia
+    stats = SearchStats()
+    queries = []
+    while len(queries) < args.queries:
+        start, goal = rng.choice(tiles), rng.choice(tiles)
+        if pathfind_astar(graph, start, goal, ManhattanHeuristic(goal), stats):
+            queries.append((start, goal, stats.path_cost))
+
+    # Todas las búsquedas se cronometran igual: perf_counter alrededor de la llamada sin instrumentar. Los nodos
+    # expandidos se cuentan en una segunda pasada, con SearchStats o, si la búsqueda no lo acepta, con CountingGraph
+    astar_time = 0.0
+    astar_expanded = 0
+    for start, goal, optimal_cost in queries:
+        began = time.perf_counter()
+        path = pathfind_astar(graph, start, goal, ManhattanHeuristic(goal))
+        astar_time += time.perf_counter() - began
+        pathfind_astar(graph, start, goal, ManhattanHeuristic(goal), stats)
+        astar_expanded += stats.expanded
+        assert path_cost(path) == optimal_cost
+
+    counting = CountingGraph(graph)
+    bidirectional_time = 0.0
+    bidirectional_expanded = 0
+    for start, goal, optimal_cost in queries:
+        began = time.perf_counter()
+        path = pathfind_bidirectional_astar(graph, start, goal, ManhattanHeuristic(goal))
+        bidirectional_time += time.perf_counter() - began
+        counting.expanded = 0
+        pathfind_bidirectional_astar(counting, start, goal, ManhattanHeuristic(goal))
+        bidirectional_expanded += counting.expanded
+        assert path_cost(path) == optimal_cost
+
+    began = time.perf_counter()
+    landmarks = LandmarkTables.build(graph, args.landmarks)
+    landmark_precompute_time = time.perf_counter() - began
+    landmark_time = 0.0
+    landmark_expanded = 0
+    for start, goal, optimal_cost in queries:
+        began = time.perf_counter()
+        path = pathfind_astar(graph, start, goal, landmarks.heuristic(goal))
+        landmark_time += time.perf_counter() - began
+        pathfind_astar(graph, start, goal, landmarks.heuristic(goal), stats)
+        landmark_expanded += stats.expanded
+        assert path_cost(path) == optimal_cost
+
+    began = time.perf_counter()
+    hierarchical = HierarchicalPathfinder(graph, args.cluster_size)
+    precompute_time = time.perf_counter() - began
+
+    abstract_time = refine_time = 0.0
+    cost_ratio = 0.0
+    for start, goal, optimal_cost in queries:
+        began = time.perf_counter()
+        abstract_path = hierarchical.find_abstract_path(start, goal)
+        abstract_time += time.perf_counter() - began
+        began = time.perf_counter()
+        path = [connection for segment in abstract_path for connection in hierarchical.refine_segment(segment)]
+        refine_time += time.perf_counter() - began
+        cost_ratio += path_cost(path) / optimal_cost
+
+    count = len(queries)
+    print(f"Mapa {args.size}x{args.size}, {len(tiles)} tiles caminables, {count} consultas")
+    print(f"A*                 consulta: {astar_time / count * 1000:8.2f} ms "
+          f"({astar_expanded / count:.0f} nodos expandidos)")
+    print(f"A* bidireccional   consulta: {bidirectional_time / count * 1000:8.2f} ms "
+          f"({bidirectional_expanded / count:.0f} nodos expandidos)")
+    print(f"A* ALT precálculo  total:    {landmark_precompute_time * 1000:8.2f} ms ({len(landmarks.landmarks)} landmarks)")
+    print(f"A* ALT             consulta: {landmark_time / count * 1000:8.2f} ms "
+          f"({landmark_expanded / count:.0f} nodos expandidos)")
+    print(f"HPA* precálculo    total:    {precompute_time * 1000:8.2f} ms "
+          f"({len(hierarchical.abstract.connections)} nodos abstractos, clusters de {args.cluster_size})")
+    print(f"HPA* abstracto     consulta: {abstract_time / count * 1000:8.2f} ms")
+    print(f"HPA* refinamiento  consulta: {refine_time / count * 1000:8.2f} ms")
+    print(f"HPA* costo / óptimo:         {cost_ratio / count:8.3f}")
+
+if __name__ == "__main__":
+    main()
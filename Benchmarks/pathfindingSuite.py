@@ -0,0 +1,349 @@
+# @file pathfindingSuite.py
+# @brief Suite de benchmarks sin pantalla de A* y Dijkstra sobre laberintos y campos abiertos generados con semilla
+# @author Anya Marcano
+# @date 2026/10/18
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, "Pathfinding"))
+sys.path.append(os.path.join(ROOT, "WorldRepresentation"))
+sys.path.append(os.path.join(ROOT, "Benchmarks"))
+
+import numpy as np
+from tileGraph import label_components
+from gridGraph import GridGraph
+from nodes import TileNode
+from aStar import pathfind_astar, pathfind_bidirectional_astar
+from dijkstra import pathfind_dijkstra
+from manhattanHeuristic import ManhattanHeuristic
+from octileHeuristic import OctileHeuristic
+from landmarkHeuristic import LandmarkTables
+from searchStats import SearchStats
+from pathfindingBenchmark import CountingGraph, path_cost
+
+SIZES = (32, 64, 128, 256, 512, 1024)
+QUERY_SETS = ("short", "long", "unreachable")
+
+def maze_walkable(size: int, seed: int, loops: float = 0.02) -> np.ndarray:
+    """
+    Genera un laberinto perfecto (backtracking recursivo) con algunas paredes extra abiertas para crear ciclos.
+    Las celdas del laberinto son los tiles de coordenadas impares; el borde del mapa es pared.
+    Args:
+        size (int): El lado de la grilla en tiles.
+        seed (int): La semilla del generador.
+        loops (float): La proporción de celdas en las que se abre una pared extra.
+    Returns:
+        np.ndarray: Grilla (size, size) con True en los tiles caminables.
+    """
+    rng = random.Random(seed)
+    cells = (size - 1) // 2
+    walkable = np.zeros((size, size), dtype=bool)
+    if cells == 0:
+        return walkable
+    visited = np.zeros((cells, cells), dtype=bool)
+    visited[0, 0] = True
+    walkable[1, 1] = True
+    stack = [(0, 0)]
+    while stack:
+        x, y = stack[-1]
+        options = [(x + dx, y + dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                   if 0 <= x + dx < cells and 0 <= y + dy < cells and not visited[y + dy, x + dx]]
+        if not options:
+            stack.pop()
+            continue
+        nx, ny = rng.choice(options)
+        visited[ny, nx] = True
+        walkable[2 * ny + 1, 2 * nx + 1] = True
+        walkable[y + ny + 1, x + nx + 1] = True  # La pared entre las dos celdas
+        stack.append((nx, ny))
+    # Abrir paredes interiores al azar
+    for _ in range(int(loops * cells * cells)):
+        walkable[rng.randrange(1, 2 * cells), rng.randrange(1, 2 * cells)] = True
+    return walkable
+
+def open_field_walkable(size: int, seed: int, coverage: float = 0.2) -> np.ndarray:
+    """
+    Genera un campo abierto con obstáculos rectangulares de tamaño aleatorio.
+    Args:
+        size (int): El lado de la grilla en tiles.
+        seed (int): La semilla del generador.
+        coverage (float): La proporción aproximada del mapa cubierta por obstáculos.
+    Returns:
+        np.ndarray: Grilla (size, size) con True en los tiles caminables.
+    """
+    rng = np.random.default_rng(seed)
+    walkable = np.ones((size, size), dtype=bool)
+    largest = max(2, size // 16)
+    mean_area = ((1 + largest) / 2) ** 2
+    for _ in range(int(coverage * size * size / mean_area)):
+        w, h = rng.integers(1, largest + 1, size=2)
+        x, y = rng.integers(0, size, size=2)
+        walkable[y:y + h, x:x + w] = False
+    return walkable
+
+def add_vault(walkable: np.ndarray, seed: int) -> Tuple[int, int]:
+    """
+    Encierra una sala de 2x2 tiles entre paredes en una posición aleatoria, para tener siempre tiles inalcanzables.
+    Args:
+        walkable (np.ndarray): La grilla que se modifica.
+        seed (int): La semilla del generador.
+    Returns:
+        Tuple[int, int]: La esquina superior izquierda (x, y) del interior de la sala.
+    """
+    size = walkable.shape[0]
+    rng = random.Random(seed)
+    x, y = rng.randrange(1, size - 3), rng.randrange(1, size - 3)
+    walkable[y - 1:y + 3, x - 1:x + 3] = False
+    walkable[y:y + 2, x:x + 2] = True
+    return x, y
+
+GENERATORS: Dict[str, Callable[[int, int], np.ndarray]] = {
+    "maze": maze_walkable,
+    "open": open_field_walkable,
+}
+
+def make_queries(walkable: np.ndarray, count: int, seed: int) -> Dict[str, List[Tuple[TileNode, TileNode]]]:
+    """
+    Elige los conjuntos fijos de consultas de un mapa: cortas (objetivo a lo sumo a size/16 tiles del inicio),
+    largas (entre esquinas opuestas del mapa) e inalcanzables (objetivo en otra componente conexa).
+    Args:
+        walkable (np.ndarray): La grilla del mapa.
+        count (int): La cantidad de consultas por conjunto.
+        seed (int): La semilla del generador.
+    Returns:
+        Dict[str, List[Tuple[TileNode, TileNode]]]: Los pares (inicio, objetivo) de cada conjunto.
+    """
+    size = walkable.shape[0]
+    rng = np.random.default_rng(seed)
+    labels = label_components(walkable)
+    main = np.bincount(labels[labels >= 0]).argmax()
+    ys, xs = np.nonzero(labels == main)
+    other_ys, other_xs = np.nonzero((labels >= 0) & (labels != main))
+    radius = max(4, size // 16)
+    queries = {name: [] for name in QUERY_SETS}
+
+    near_start = np.flatnonzero(xs + ys < size // 2)
+    near_end = np.flatnonzero(xs + ys > 3 * size // 2)
+    for _ in range(count):
+        # Cortas: un objetivo del mismo componente dentro del radio
+        for _ in range(100):
+            i = rng.integers(len(xs))
+            close = np.flatnonzero((np.abs(xs - xs[i]) <= radius) & (np.abs(ys - ys[i]) <= radius))
+            j = rng.choice(close)
+            if i != j:
+                queries["short"].append((TileNode(int(xs[i]), int(ys[i])), TileNode(int(xs[j]), int(ys[j]))))
+                break
+        # Largas: de la esquina superior izquierda a la inferior derecha
+        if len(near_start) and len(near_end):
+            i, j = rng.choice(near_start), rng.choice(near_end)
+            queries["long"].append((TileNode(int(xs[i]), int(ys[i])), TileNode(int(xs[j]), int(ys[j]))))
+        # Inalcanzables: hacia otro componente
+        if len(other_xs):
+            i, j = rng.integers(len(xs)), rng.integers(len(other_xs))
+            queries["unreachable"].append((TileNode(int(xs[i]), int(ys[i])),
+                                           TileNode(int(other_xs[j]), int(other_ys[j]))))
+    return queries
+
+class Algorithm:
+    """
+    Algoritmo de la suite: una función de búsqueda con su heurística y, opcionalmente, su precálculo por mapa.
+    Attributes:
+        name (str): El nombre del algoritmo.
+        heuristic (Optional[str]): El nombre de la heurística.
+        max_size (Optional[int]): El lado de mapa más grande en el que se mide (None para todos).
+        instrumented (bool): Si la búsqueda acepta un SearchStats; si no, los nodos expandidos se cuentan con un CountingGraph.
+        Methods:
+            prepare(self, graph: GridGraph, seed_node: TileNode) -> object: Precálculo por mapa (por defecto, ninguno).
+            search(self, graph, start: TileNode, goal: TileNode, context: object, stats: Optional[SearchStats]): Resuelve una consulta.
+    """
+    def __init__(self, name: str, heuristic: Optional[str], search: Callable, prepare: Optional[Callable] = None,
+                 max_size: Optional[int] = None, instrumented: bool = True):
+        self.name = name
+        self.heuristic = heuristic
+        self.max_size = max_size
+        self.instrumented = instrumented
+        self._search = search
+        self._prepare = prepare
+
+    def prepare(self, graph: GridGraph, seed_node: TileNode):
+        return self._prepare(graph, seed_node) if self._prepare else None
+
+    def search(self, graph, start: TileNode, goal: TileNode, context, stats: Optional[SearchStats] = None):
+        return self._search(graph, start, goal, context, stats)
+
+def grid_heuristic(graph, goal: TileNode):
+    return OctileHeuristic(goal) if graph.diagonal else ManhattanHeuristic(goal)
+
+ALGORITHMS = [
+    Algorithm("dijkstra", None, lambda graph, start, goal, _, stats: pathfind_dijkstra(graph, start, goal, stats)),
+    Algorithm("astar", "grid", lambda graph, start, goal, _, stats: pathfind_astar(graph, start, goal,
+                                                                                   grid_heuristic(graph, goal), stats)),
+    Algorithm("bidirectional-astar", "grid",
+              lambda graph, start, goal, _, stats: pathfind_bidirectional_astar(graph, start, goal,
+                                                                                grid_heuristic(graph, goal)),
+              instrumented=False),
+    Algorithm("astar", "landmarks", lambda graph, start, goal, tables, stats: pathfind_astar(graph, start, goal,
+                                                                                             tables.heuristic(goal), stats),
+              prepare=lambda graph, seed_node: LandmarkTables.build(graph, 8, seed_node), max_size=256),
+]
+
+def run_queries(algorithm: Algorithm, graph: GridGraph, queries: List[Tuple[TileNode, TileNode]], context,
+                time_limit: float) -> dict:
+    """
+    Mide un conjunto de consultas: el tiempo de cada búsqueda sin instrumentar y, en una segunda pasada con un
+    SearchStats, los nodos expandidos, las conexiones examinadas, el tamaño máximo de la lista abierta y las
+    reaperturas. Los algoritmos que no aceptan SearchStats cuentan solo los nodos expandidos con un CountingGraph.
+    Args:
+        algorithm (Algorithm): El algoritmo a medir.
+        graph (GridGraph): El grafo del mapa.
+        queries (List[Tuple[TileNode, TileNode]]): Los pares (inicio, objetivo).
+        context (object): El precálculo del algoritmo para este mapa.
+        time_limit (float): Segundos tras los cuales se omiten las consultas restantes del conjunto.
+    Returns:
+        dict: Las estadísticas del conjunto.
+    """
+    counting = CountingGraph(graph)
+    stats = SearchStats()
+    times, expanded, touched, peak_open, costs = [], [], [], [], []
+    reopened = 0
+    found = 0
+    began = time.perf_counter()
+    for start, goal in queries:
+        if time.perf_counter() - began > time_limit:
+            break
+        query_began = time.perf_counter()
+        path = algorithm.search(graph, start, goal, context)
+        times.append(time.perf_counter() - query_began)
+        if algorithm.instrumented:
+            algorithm.search(graph, start, goal, context, stats)
+            expanded.append(stats.expanded)
+            touched.append(stats.touched)
+            peak_open.append(stats.peak_open)
+            reopened += stats.reopened
+        else:
+            counting.expanded = 0
+            algorithm.search(counting, start, goal, context)
+            expanded.append(counting.expanded)
+        if path is not None:
+            found += 1
+            costs.append(path_cost(path))
+    return {
+        "queries": len(times),
+        "truncated": len(times) < len(queries),
+        "found": found,
+        "mean_ms": statistics.fmean(times) * 1000 if times else None,
+        "median_ms": statistics.median(times) * 1000 if times else None,
+        "max_ms": max(times) * 1000 if times else None,
+        "mean_expanded": statistics.fmean(expanded) if expanded else None,
+        "mean_touched": statistics.fmean(touched) if touched else None,
+        "max_peak_open": max(peak_open) if peak_open else None,
+        "reopened": reopened if algorithm.instrumented else None,
+        "mean_cost": statistics.fmean(costs) if costs else None,
+    }
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results: List[dict], baseline_path: str):
+    """
+    Imprime la razón entre los tiempos y nodos expandidos de esta corrida y los de un JSON anterior.
+    Args:
+        results (List[dict]): Los resultados de esta corrida.
+        baseline_path (str): El JSON de la corrida de referencia.
+    """
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)
+    # Las consultas dependen de la semilla y de la cantidad pedida, así que solo se comparan filas con las mismas
+    key = lambda row: (row["map"], row["size"], row["diagonal"], row["seed"], row["requested"], row["set"],
+                       row["algorithm"], row["heuristic"])
+    previous = {key(row): row for row in baseline["results"]}
+    print(f"\nComparación con {baseline_path} ({baseline['meta'].get('revision')}):")
+    for row in results:
+        old = previous.get(key(row))
+        if old is None or not row["mean_ms"] or not old["mean_ms"]:
+            continue
+        ratio = row["mean_ms"] / old["mean_ms"]
+        flag = "  <-- más lento" if ratio > 1.1 and row["mean_ms"] >= 0.1 else ""
+        print(f"  {row['map']:5} {row['size']:5} {row['set']:11} {row['algorithm']:20} {row['heuristic'] or '-':9} "
+              f"tiempo x{ratio:5.2f}  expandidos {old['mean_expanded']:.0f} -> {row['mean_expanded']:.0f}{flag}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks de pathfinding sobre mapas generados")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in SIZES),
+                        help="Lados de los mapas en tiles, separados por comas")
+    parser.add_argument("--maps", default=",".join(GENERATORS), help="Generadores de mapas, separados por comas")
+    parser.add_argument("--algorithms", default=None,
+                        help="Algoritmos a medir (nombre o nombre:heurística), separados por comas; todos por defecto")
+    parser.add_argument("--queries", type=int, default=10, help="Consultas por conjunto")
+    parser.add_argument("--diagonal", action="store_true", help="Conectividad de 8 direcciones")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-limit", type=float, default=60.0,
+                        help="Segundos por algoritmo y conjunto de consultas antes de omitir las restantes")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare", default=None, help="JSON de una corrida anterior para comparar")
+    args = parser.parse_args()
+
+    algorithms = ALGORITHMS
+    if args.algorithms:
+        selected = args.algorithms.split(",")
+        algorithms = [algorithm for algorithm in ALGORITHMS
+                      if algorithm.name in selected or f"{algorithm.name}:{algorithm.heuristic}" in selected]
+
+    results = []
+    for map_name in args.maps.split(","):
+        for size in (int(size) for size in args.sizes.split(",")):
+            began = time.perf_counter()
+            walkable = GENERATORS[map_name](size, args.seed)
+            add_vault(walkable, args.seed)
+            graph = GridGraph.from_walkable(walkable, diagonal=args.diagonal)
+            build_time = time.perf_counter() - began
+            queries = make_queries(walkable, args.queries, args.seed)
+            print(f"{map_name} {size}x{size}: {len(graph.xs)} tiles caminables, "
+                  f"generado en {build_time * 1000:.0f} ms")
+
+            for algorithm in algorithms:
+                if algorithm.max_size is not None and size > algorithm.max_size:
+                    continue
+                began = time.perf_counter()
+                context = algorithm.prepare(graph, queries["long"][0][0] if queries["long"] else None)
+                prepare_time = time.perf_counter() - began
+                for set_name in QUERY_SETS:
+                    stats = run_queries(algorithm, graph, queries[set_name], context, args.time_limit)
+                    heuristic = algorithm.heuristic
+                    if heuristic == "grid":
+                        heuristic = "octile" if args.diagonal else "manhattan"
+                    row = {"map": map_name, "size": size, "diagonal": args.diagonal, "seed": args.seed,
+                           "requested": args.queries, "tiles": int(len(graph.xs)), "set": set_name, "algorithm": algorithm.name,
+                           "heuristic": heuristic, "prepare_ms": prepare_time * 1000, **stats}
+                    results.append(row)
+                    if stats["queries"]:
+                        print(f"  {algorithm.name:20} {heuristic or '-':9} {set_name:11} "
+                              f"{stats['mean_ms']:10.2f} ms {stats['mean_expanded']:10.0f} expandidos "
+                              f"({stats['found']}/{stats['queries']} con camino"
+                              f"{', truncado' if stats['truncated'] else ''})")
+
+    meta = {"revision": git_revision(), "python": platform.python_version(), "platform": platform.platform(),
+            "numpy": np.__version__, "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "args": vars(args)}
+    with open(args.output, "w") as output_file:
+        json.dump({"meta": meta, "results": results}, output_file, indent=1)
+    print(f"Resultados en {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
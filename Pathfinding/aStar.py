@@ -3,14 +3,18 @@
 # @author Anya Marcano
 # @date 2024/11/05
 
+import heapq
+import time
 from typing import List, Optional
 from graph import Graph
 from nodes import Node
 from connection import Connection
 from heuristic import Heuristic
-from pathfindingList import NodeRecord, PathfindingList
+from pathfindingList import NodeRecord, PathfindingHeap, PathfindingTable
+from searchStats import SearchStats, ExpandHook, expansion_hook
 
-def pathfind_astar(graph: Graph, start: Node, goal: Node, heuristic: Heuristic) -> Optional[List[Connection]]:
+def pathfind_astar(graph: Graph, start: Node, goal: Node, heuristic: Heuristic, stats: Optional[SearchStats] = None,
+                   on_expand: Optional[ExpandHook] = None) -> Optional[List[Connection]]:
     """
     Implementa el algoritmo A* para encontrar el camino más corto entre dos nodos en un grafo.
     Args:
@@ -18,10 +22,28 @@ def pathfind_astar(graph: Graph, start: Node, goal: Node, heuristic: Heuristic)
         start (Node): El nodo de inicio.
         goal (Node): El nodo objetivo.
         heuristic (Heuristic): La función heurística para estimar el costo desde un nodo hasta el objetivo.
+        stats (Optional[SearchStats]): Si se indica, se llena con las estadísticas de la búsqueda.
+        on_expand (Optional[ExpandHook]): Si se indica, se llama con cada nodo expandido y su costo.
     Returns:
         Optional[List[Connection]]: Una lista de conexiones que representan el camino más corto desde el inicio hasta el objetivo,
                                     o None si no se encuentra ningún camino.
     """
+    # Las estadísticas y on_expand se atienden con un solo gancho por expansión; ver expansion_hook
+    if stats is not None:
+        stats.reset()
+        began = time.perf_counter()
+
+    # Descartar de inmediato los objetivos que están en otra componente conexa
+    if not graph.is_reachable(start, goal):
+        if stats is not None:
+            stats.time = time.perf_counter() - began
+        return None
+
+    # En grafos de tiles las estimaciones se guardan en una tabla por objetivo: cada tile se estima una sola vez
+    # entre todas las consultas hacia el mismo objetivo (las celdas en 0 aún no se calcularon)
+    table = heuristic.estimate_table(graph)
+    width = graph.width if table is not None else 0
+    
     # Inicializar el nodo de inicio
     start_record = NodeRecord(
         node=start,
@@ -30,9 +52,10 @@ def pathfind_astar(graph: Graph, start: Node, goal: Node, heuristic: Heuristic)
     )
     
     # Inicializar las listas abierta y cerrada
-    open_list = PathfindingList()
+    open_list = PathfindingHeap()
     open_list.add(start_record)
-    closed_list = PathfindingList()
+    closed_list = PathfindingTable()
+    expand = expansion_hook(stats, on_expand, open_list)
     
     # Iterar hasta que la lista abierta esté vacía
     while len(open_list) > 0:
@@ -41,9 +64,11 @@ def pathfind_astar(graph: Graph, start: Node, goal: Node, heuristic: Heuristic)
         # Si el nodo actual es el objetivo, terminar
         if current.node == goal:
             break
-            
+        
         # Calcular los costos de los nodos adyacentes   
         connections = graph.get_connections(current.node)
+        if expand is not None:
+            expand(current.node, current.cost_so_far, len(connections))
         
         # Iterar sobre las conexiones
         for connection in connections:
@@ -68,33 +93,156 @@ def pathfind_astar(graph: Graph, start: Node, goal: Node, heuristic: Heuristic)
             # Manekar nodos no visitados
             else:
                 end_node_record = NodeRecord(node=end_node)
-                end_node_heuristic = heuristic.estimate(end_node)
+                if table is not None:
+                    index = end_node.y * width + end_node.x
+                    end_node_heuristic = table[index]
+                    if not end_node_heuristic:
+                        end_node_heuristic = table[index] = heuristic.estimate(end_node)
+                else:
+                    end_node_heuristic = heuristic.estimate(end_node)
             
             # Actualizar el nodo
             end_node_record.cost_so_far = end_node_cost
             end_node_record.connection = connection
             end_node_record.estimated_total_cost = end_node_cost + end_node_heuristic
             
-            # Agregar el nodo a la lista abierta si no está allí
-            if not open_list.contains(end_node):
+            # Agregar el nodo a la lista abierta si no está allí, o reordenarlo si ya estaba
+            if open_list.contains(end_node):
+                open_list.update(end_node_record)
+            else:
                 open_list.add(end_node_record)
                 
         # Mpver el nodo actual a la lista cerrada
         open_list.remove(current)
         closed_list.add(current)
     
+    if stats is not None:
+        stats.peak_open = max(stats.peak_open, len(open_list))
+        # Cada expansión agrega un nodo a la lista cerrada y cada reapertura lo saca
+        stats.reopened = stats.expanded - len(closed_list)
+
     # Retornar None si no se encontró un camino
     if current.node != goal:
+        if stats is not None:
+            stats.time = time.perf_counter() - began
         return None
+    if stats is not None:
+        stats.path_cost = current.cost_so_far
         
     # Reconstruir el camino
     path = []
     
     # Iterar desde el nodo objetivo hasta el nodo de inicio
+    # Un nodo reabierto por una mejora de redondeo (sumas de costos √2 en otro orden) puede seguir en la lista abierta
     while current.node != start:
         path.append(current.connection)
-        current = closed_list.find(current.connection.from_node)
+        from_node = current.connection.from_node
+        current = closed_list.find(from_node) or open_list.find(from_node)
         
     # Invertir el camino
     path.reverse()
-    return path
\ No newline at end of file
+    if stats is not None:
+        stats.time = time.perf_counter() - began
+    return path
+
+def pathfind_bidirectional_astar(graph: Graph, start: Node, goal: Node, heuristic: Heuristic) -> Optional[List[Connection]]:
+    """
+    Implementa A* bidireccional: una búsqueda hacia adelante desde el inicio y otra hacia atrás desde el objetivo
+    (sobre las conexiones entrantes del grafo) que se encuentran en el medio.
+    Se detiene cuando el menor costo estimado de alguna de las dos listas abiertas no es menor que el del mejor
+    camino que ya une ambas búsquedas, por lo que el resultado es óptimo si la heurística es consistente.
+    Args:
+        graph (Graph): El grafo en el cual realizar la búsqueda de caminos.
+        start (Node): El nodo de inicio.
+        goal (Node): El nodo objetivo.
+        heuristic (Heuristic): La heurística; se usa estimate_between(nodo, goal) hacia adelante y
+                               estimate_between(start, nodo) hacia atrás.
+    Returns:
+        Optional[List[Connection]]: Una lista de conexiones que representan el camino más corto desde el inicio hasta el objetivo,
+                                    o None si no se encuentra ningún camino.
+    """
+    if start == goal:
+        return []
+    if not graph.is_reachable(start, goal):
+        return None
+
+    # Estado de cada dirección: costos, conexiones hacia el nodo, nodos cerrados y lista abierta
+    forward_cost, backward_cost = {start: 0.0}, {goal: 0.0}
+    forward_connections, backward_connections = {}, {}
+    forward_closed, backward_closed = set(), set()
+    counter = 0
+    forward_open = [(heuristic.estimate_between(start, goal), counter, start)]
+    backward_open = [(heuristic.estimate_between(start, goal), counter, goal)]
+    best_cost = float('inf')
+    meeting_node = None
+
+    # Iterar mientras ambas listas abiertas tengan nodos
+    while forward_open and backward_open:
+        # Descartar entradas obsoletas antes de consultar el mínimo de cada lista
+        while forward_open and forward_open[0][2] in forward_closed:
+            heapq.heappop(forward_open)
+        while backward_open and backward_open[0][2] in backward_closed:
+            heapq.heappop(backward_open)
+        if not forward_open or not backward_open:
+            break
+
+        # Ningún camino pendiente puede mejorar el mejor encuentro
+        if max(forward_open[0][0], backward_open[0][0]) >= best_cost:
+            break
+
+        # Expandir la dirección con menos nodos abiertos
+        forward = len(forward_open) <= len(backward_open)
+        if forward:
+            _, _, current = heapq.heappop(forward_open)
+            forward_closed.add(current)
+            cost = forward_cost[current]
+            for connection in graph.get_connections(current):
+                end_node = connection.to_node
+                end_node_cost = cost + connection.get_cost()
+                if end_node in forward_closed or end_node_cost >= forward_cost.get(end_node, float('inf')):
+                    continue
+                forward_cost[end_node] = end_node_cost
+                forward_connections[end_node] = connection
+                counter += 1
+                heapq.heappush(forward_open, (end_node_cost + heuristic.estimate_between(end_node, goal), counter, end_node))
+                # Si la otra búsqueda ya alcanzó el nodo, hay un camino completo
+                if end_node in backward_cost and end_node_cost + backward_cost[end_node] < best_cost:
+                    best_cost = end_node_cost + backward_cost[end_node]
+                    meeting_node = end_node
+        else:
+            _, _, current = heapq.heappop(backward_open)
+            backward_closed.add(current)
+            cost = backward_cost[current]
+            for connection in graph.get_incoming_connections(current):
+                end_node = connection.from_node
+                end_node_cost = cost + connection.get_cost()
+                if end_node in backward_closed or end_node_cost >= backward_cost.get(end_node, float('inf')):
+                    continue
+                backward_cost[end_node] = end_node_cost
+                backward_connections[end_node] = connection
+                counter += 1
+                heapq.heappush(backward_open, (end_node_cost + heuristic.estimate_between(start, end_node), counter, end_node))
+                if end_node in forward_cost and end_node_cost + forward_cost[end_node] < best_cost:
+                    best_cost = end_node_cost + forward_cost[end_node]
+                    meeting_node = end_node
+
+    # Retornar None si las búsquedas no se encontraron
+    if meeting_node is None:
+        return None
+
+    # Reconstruir la mitad hacia adelante desde el punto de encuentro hasta el inicio
+    path = []
+    node = meeting_node
+    while node != start:
+        connection = forward_connections[node]
+        path.append(connection)
+        node = connection.from_node
+    path.reverse()
+
+    # Agregar la mitad hacia atrás desde el punto de encuentro hasta el objetivo
+    node = meeting_node
+    while node != goal:
+        connection = backward_connections[node]
+        path.append(connection)
+        node = connection.to_node
+    return path
@@ -0,0 +1,173 @@
+# @file dStarLite.py
+# @brief Implementación de D* Lite, un planificador incremental que repara su búsqueda cuando cambia el grafo
+# @author Anya Marcano
+# @date 2026/10/18
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+from graph import Graph
+from nodes import Node
+from connection import Connection
+from heuristic import Heuristic
+
+INFINITY = float('inf')
+KEY_DIGITS = 9  # Decimales de las claves: absorben los errores de redondeo de las sumas de costos √2
+
+class DStarLite:
+    """
+    Clase que implementa D* Lite para un par agente-objetivo.
+    La búsqueda se hace desde el objetivo hacia el agente y su estado (g, rhs y la lista abierta) se conserva
+    entre frames. Cuando el agente se mueve, cambian costos de conexiones o el objetivo se desplaza, solo se
+    reparan los nodos afectados, así que el costo de replanificar depende del tamaño del cambio y no del mapa.
+    Attributes:
+        graph (Graph): El grafo en el que se planifica.
+        start (Node): La posición actual del agente.
+        goal (Node): El nodo objetivo.
+        heuristic (Heuristic): Heurística consistente; se usa estimate_between(start, nodo).
+        g (Dict[Node, float]): El costo hasta el objetivo de cada nodo, ya consolidado.
+        rhs (Dict[Node, float]): El costo hasta el objetivo calculado a partir de los sucesores.
+        km (float): La corrección acumulada de las claves por los movimientos del agente.
+        Methods:
+            compute_shortest_path(self): Expande nodos hasta que el camino del agente sea consistente.
+            update_start(self, start: Node): Mueve el agente.
+            update_goal(self, goal: Node): Mueve el objetivo.
+            update_nodes(self, nodes: Iterable[Node]): Notifica nodos cuyas conexiones salientes cambiaron.
+            path(self) -> Optional[List[Connection]]: Devuelve el camino actual del agente al objetivo.
+            replan(self, start: Node, goal: Node) -> Optional[List[Connection]]: Actualiza ambos extremos y devuelve el camino.
+    """
+    def __init__(self, graph: Graph, start: Node, goal: Node, heuristic: Heuristic):
+        self.graph = graph
+        self.start = start
+        self.goal = goal
+        self.heuristic = heuristic
+        self.g: Dict[Node, float] = {}
+        self.rhs: Dict[Node, float] = {goal: 0.0}
+        self.km = 0.0
+        self.expanded = 0
+        self._last_start = start
+        self._open_heap: List[tuple] = []
+        self._open_keys: Dict[Node, Tuple[float, float]] = {}
+        self._counter = 0
+        self._push(goal)
+
+    def compute_shortest_path(self):
+        start = self.start
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            key_old, u = top
+            start_key = self._key(start)
+            if not (key_old < start_key or self.rhs.get(start, INFINITY) > self.g.get(start, INFINITY)):
+                break
+            heapq.heappop(self._open_heap)
+            del self._open_keys[u]
+            self.expanded += 1
+            key_new = self._key(u)
+            if key_old < key_new:
+                # La clave quedó desactualizada por un movimiento del agente
+                self._push(u, key_new)
+            elif self.g.get(u, INFINITY) > self.rhs.get(u, INFINITY):
+                # Nodo sobreconsistente: consolidar su costo
+                self.g[u] = self.rhs[u]
+                self._remove(u)
+                for connection in self.graph.get_incoming_connections(u):
+                    self._update_vertex(connection.from_node)
+            else:
+                # Nodo subconsistente: invalidar su costo y recalcular él y sus predecesores
+                self.g[u] = INFINITY
+                self._update_vertex(u)
+                for connection in self.graph.get_incoming_connections(u):
+                    self._update_vertex(connection.from_node)
+
+    def update_start(self, start: Node):
+        if start == self.start:
+            return
+        self.km += self.heuristic.estimate_between(self._last_start, start)
+        self._last_start = start
+        self.start = start
+
+    def update_goal(self, goal: Node):
+        # Mover el objetivo equivale a cambiar las conexiones de un objetivo virtual hacia el viejo y el nuevo
+        # objetivo, así que basta con actualizar esos dos nodos
+        if goal == self.goal:
+            return
+        old_goal = self.goal
+        self.goal = goal
+        self.rhs[goal] = 0.0
+        self._update_vertex(goal)
+        self._update_vertex(old_goal)
+
+    def update_nodes(self, nodes: Iterable[Node]):
+        # Se debe llamar con todos los nodos cuyas conexiones salientes cambiaron (agregadas, quitadas o con otro costo)
+        for node in nodes:
+            self._update_vertex(node)
+
+    def path(self) -> Optional[List[Connection]]:
+        self.compute_shortest_path()
+        if self.g.get(self.start, INFINITY) == INFINITY and self.rhs.get(self.start, INFINITY) == INFINITY:
+            return None
+
+        # Seguir desde el agente el sucesor que minimiza costo de la conexión + g
+        path = []
+        node = self.start
+        visited = {node}
+        while node != self.goal:
+            best, best_cost = None, INFINITY
+            for connection in self.graph.get_connections(node):
+                cost = connection.get_cost() + self.g.get(connection.to_node, INFINITY)
+                if cost < best_cost:
+                    best, best_cost = connection, cost
+            if best is None or best.to_node in visited:
+                return None
+            path.append(best)
+            node = best.to_node
+            visited.add(node)
+        return path
+
+    def replan(self, start: Node, goal: Node) -> Optional[List[Connection]]:
+        self.update_start(start)
+        self.update_goal(goal)
+        return self.path()
+
+    def _key(self, node: Node) -> Tuple[float, float]:
+        # Con 8 direcciones la estimación octil y la suma de costos √2 de un camino igual de largo pueden diferir en
+        # el último bit; sin redondear, una clave empatada quedaría apenas por encima de la del agente y la
+        # búsqueda se detendría antes de reparar los nodos que cambian su camino
+        cost = min(self.g.get(node, INFINITY), self.rhs.get(node, INFINITY))
+        if cost == INFINITY:
+            return (INFINITY, INFINITY)
+        return (round(cost + self.heuristic.estimate_between(self.start, node) + self.km, KEY_DIGITS),
+                round(cost, KEY_DIGITS))
+
+    def _update_vertex(self, node: Node):
+        if node != self.goal:
+            rhs = INFINITY
+            for connection in self.graph.get_connections(node):
+                cost = connection.get_cost() + self.g.get(connection.to_node, INFINITY)
+                if cost < rhs:
+                    rhs = cost
+            self.rhs[node] = rhs
+        if self.g.get(node, INFINITY) != self.rhs.get(node, INFINITY):
+            self._push(node)
+        else:
+            self._remove(node)
+
+    def _push(self, node: Node, key: Optional[Tuple[float, float]] = None):
+        key = self._key(node) if key is None else key
+        self._open_keys[node] = key
+        self._counter += 1
+        heapq.heappush(self._open_heap, (key, self._counter, node))
+
+    def _remove(self, node: Node):
+        self._open_keys.pop(node, None)
+
+    def _top(self) -> Optional[Tuple[Tuple[float, float], Node]]:
+        # Descartar entradas eliminadas o con clave desactualizada (borrado perezoso) y consultar la menor
+        heap = self._open_heap
+        while heap:
+            key, _, node = heap[0]
+            if self._open_keys.get(node) == key:
+                return key, node
+            heapq.heappop(heap)
+        return None
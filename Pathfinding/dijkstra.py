@@ -2,11 +2,15 @@
 # @brief Implementación del algoritmo de búsqueda de caminos de Dijkstra
 # @author Anya Marcano
 # @date 2024/11/05
-from typing import List, Optional
+import heapq
+import time
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from graph import Graph
 from nodes import Node
 from connection import Connection
+from pathfindingList import PathfindingHeap, PathfindingTable
+from searchStats import SearchStats, ExpandHook, expansion_hook
 
 @dataclass
 class NodeRecord:
@@ -61,23 +65,39 @@ class PathfindingList:
     def smallest_element(self) -> NodeRecord:
         return min(self.records, key=lambda x: x.cost_so_far)
 
-def pathfind_dijkstra(graph: Graph, start: Node, goal: Node) -> Optional[List[Connection]]:
+def pathfind_dijkstra(graph: Graph, start: Node, goal: Node, stats: Optional[SearchStats] = None,
+                      on_expand: Optional[ExpandHook] = None) -> Optional[List[Connection]]:
     """
     Encuentra el camino más corto entre dos nodos en un grafo utilizando el algoritmo de Dijkstra.
     Args:
         graph (Graph): El grafo en el que se realizará la búsqueda.
         start (Node): El nodo de inicio del camino.
         goal (Node): El nodo de destino del camino.
+        stats (Optional[SearchStats]): Si se indica, se llena con las estadísticas de la búsqueda.
+        on_expand (Optional[ExpandHook]): Si se indica, se llama con cada nodo expandido y su costo.
         Returns:
         Optional[List[Connection]]: La lista de conexiones que forman el camino más corto, o None si no se encontró un camino.
     """
+    # Las estadísticas y on_expand se atienden con un solo gancho por expansión; ver expansion_hook.
+    # Dijkstra nunca reabre nodos cerrados, así que stats.reopened queda en cero
+    if stats is not None:
+        stats.reset()
+        began = time.perf_counter()
+    
+    # Descartar de inmediato los objetivos que están en otra componente conexa
+    if not graph.is_reachable(start, goal):
+        if stats is not None:
+            stats.time = time.perf_counter() - began
+        return None
+    
     # Inicializar el nodo de inicio
     start_record = NodeRecord(node=start, cost_so_far=0)
     
     # Inicializar las listas abierta y cerrada
-    open_list = PathfindingList()
+    open_list = PathfindingHeap(key=lambda x: x.cost_so_far)
     open_list.add(start_record)
-    closed_list = PathfindingList()
+    closed_list = PathfindingTable()
+    expand = expansion_hook(stats, on_expand, open_list)
     
     # Iterar hasta que la lista abierta esté vacía
     while len(open_list) > 0:
@@ -86,9 +106,11 @@ def pathfind_dijkstra(graph: Graph, start: Node, goal: Node) -> Optional[List[Co
         # Si el nodo actual es el nodo de destino, detener la búsqueda
         if current.node == goal:
             break
-            
+        
         # Conseguir las conexiones del nodo actual
         connections = graph.get_connections(current.node)
+        if expand is not None:
+            expand(current.node, current.cost_so_far, len(connections))
         
         # Iterar sobre las conexiones
         for connection in connections:
@@ -111,17 +133,26 @@ def pathfind_dijkstra(graph: Graph, start: Node, goal: Node) -> Optional[List[Co
             end_node_record.cost_so_far = end_node_cost
             end_node_record.connection = connection
             
-            # Agregar el nodo a la lista abierta si no está allí
-            if not open_list.contains(end_node):
+            # Agregar el nodo a la lista abierta si no está allí, o reordenarlo si ya estaba
+            if open_list.contains(end_node):
+                open_list.update(end_node_record)
+            else:
                 open_list.add(end_node_record)
                 
         # Mover el nodo actual a la lista cerrada
         open_list.remove(current)
         closed_list.add(current)
     
+    if stats is not None:
+        stats.peak_open = max(stats.peak_open, len(open_list))
+
     # Retornar None si no se encontró un camino
     if current.node != goal:
+        if stats is not None:
+            stats.time = time.perf_counter() - began
         return None
+    if stats is not None:
+        stats.path_cost = current.cost_so_far
         
     # Reconstruir el camino
     path = []
@@ -133,4 +164,45 @@ def pathfind_dijkstra(graph: Graph, start: Node, goal: Node) -> Optional[List[Co
         
     # Devolver el camino en orden inverso
     path.reverse()
-    return path
\ No newline at end of file
+    if stats is not None:
+        stats.time = time.perf_counter() - began
+    return path
+
+def dijkstra_all(graph: Graph, source: Node, reverse: bool = False) -> Tuple[Dict[Node, float], Dict[Node, Connection]]:
+    """
+    Calcula el costo mínimo desde un nodo a todos los nodos alcanzables del grafo (Dijkstra sin nodo objetivo).
+    Con reverse=True recorre las conexiones entrantes, es decir, calcula el costo desde cada nodo hasta source.
+    Args:
+        graph (Graph): El grafo en el que se realizará la búsqueda.
+        source (Node): El nodo desde (o hacia, si reverse=True) el que se miden los costos.
+        reverse (bool): Si es True, la búsqueda se hace sobre las conexiones invertidas.
+    Returns:
+        Tuple[Dict[Node, float], Dict[Node, Connection]]: El costo de cada nodo alcanzable y la conexión por la que se llegó a él.
+            Con reverse=True, la conexión de cada nodo es el primer paso de su camino más corto hacia source.
+    """
+    cost_so_far = {source: 0.0}
+    connections = {}
+    closed = set()
+    counter = 0
+    open_heap = [(0.0, counter, source)]
+    get_connections = graph.get_incoming_connections if reverse else graph.get_connections
+    
+    # Iterar hasta que la lista abierta esté vacía
+    while open_heap:
+        cost, _, current = heapq.heappop(open_heap)
+        # Descartar entradas obsoletas
+        if current in closed:
+            continue
+        closed.add(current)
+        
+        for connection in get_connections(current):
+            end_node = connection.from_node if reverse else connection.to_node
+            end_node_cost = cost + connection.get_cost()
+            if end_node in closed or end_node_cost >= cost_so_far.get(end_node, float('inf')):
+                continue
+            cost_so_far[end_node] = end_node_cost
+            connections[end_node] = connection
+            counter += 1
+            heapq.heappush(open_heap, (end_node_cost, counter, end_node))
+    
+    return cost_so_far, connections
@@ -0,0 +1,59 @@
+# @file flowField.py
+# @brief Implementación de un campo de flujo compartido hacia un nodo objetivo
+# @author Anya Marcano
+# @date 2026/10/18
+
+from typing import Dict, List, Optional
+from graph import Graph
+from nodes import Node
+from connection import Connection
+from dijkstra import dijkstra_all
+
+class FlowField:
+    """
+    Clase que representa un campo de flujo hacia un nodo objetivo.
+    Un único Dijkstra inverso desde el objetivo calcula, para cada nodo alcanzable, el costo restante y
+    la conexión del siguiente paso, de modo que cualquier cantidad de agentes puede consultar su siguiente
+    paso en O(1). El campo solo se recalcula cuando cambia el nodo objetivo o la versión del grafo.
+    Attributes:
+        graph (Graph): El grafo sobre el que se calcula el campo.
+        goal (Optional[Node]): El nodo objetivo actual.
+        cost_to_goal (Dict[Node, float]): El costo mínimo desde cada nodo hasta el objetivo.
+        next_hop (Dict[Node, Connection]): La conexión del primer paso del camino más corto de cada nodo.
+        Methods:
+            update(self, goal: Node) -> bool: Recalcula el campo si el objetivo o el grafo cambiaron.
+            next_step(self, node: Node) -> Optional[Connection]: Devuelve la conexión del siguiente paso desde un nodo.
+            distance(self, node: Node) -> float: Devuelve el costo restante desde un nodo hasta el objetivo.
+            path_from(self, node: Node) -> Optional[List[Connection]]: Devuelve el camino completo desde un nodo.
+    """
+    def __init__(self, graph: Graph):
+        self.graph = graph
+        self.goal: Optional[Node] = None
+        self.cost_to_goal: Dict[Node, float] = {}
+        self.next_hop: Dict[Node, Connection] = {}
+        self._version = None
+
+    def update(self, goal: Node) -> bool:
+        if goal == self.goal and self.graph.version == self._version:
+            return False
+        self.goal = goal
+        self._version = self.graph.version
+        self.cost_to_goal, self.next_hop = dijkstra_all(self.graph, goal, reverse=True)
+        return True
+
+    def next_step(self, node: Node) -> Optional[Connection]:
+        return self.next_hop.get(node)
+
+    def distance(self, node: Node) -> float:
+        return self.cost_to_goal.get(node, float('inf'))
+
+    def path_from(self, node: Node) -> Optional[List[Connection]]:
+        if node not in self.cost_to_goal:
+            return None
+        path = []
+        # Seguir los siguientes pasos hasta llegar al objetivo
+        while node != self.goal:
+            connection = self.next_hop[node]
+            path.append(connection)
+            node = connection.to_node
+        return path
@@ -14,18 +14,50 @@ class Graph:
     Incluye un diccionario de conexiones con nodos de inicio como claves y una lista de conexiones como valores.
     Attributes:
         connections (dict): Un diccionario que mapea nodos de inicio a una lista de conexiones.
+        version (int): Un contador que aumenta con cada cambio del grafo, para invalidar lo calculado sobre versiones anteriores.
         Methods:
             __init__(self): Inicializa un nuevo grafo sin conexiones.
             add_connection(self, from_node: Node, to_node: Node, cost: float): Agrega una nueva conexión al grafo.
+            remove_connection(self, from_node: Node, to_node: Node): Elimina las conexiones entre dos nodos.
             get_connections(self, from_node: Node) -> list[Connection]: Devuelve una lista de conexiones para un nodo de inicio dado.
+            get_incoming_connections(self, to_node: Node) -> list[Connection]: Devuelve las conexiones que llegan a un nodo dado.
+            is_reachable(self, from_node: Node, to_node: Node) -> bool: Indica si puede existir un camino entre dos nodos.
     """
     def __init__(self):
         self.connections = {}
+        self.version = 0
+        self._incoming = None
 
     def add_connection(self, from_node: Node, to_node: Node, cost: float):
         if from_node not in self.connections:
             self.connections[from_node] = []
         self.connections[from_node].append(Connection(from_node, to_node, cost))
+        self.version += 1
+        self._incoming = None
+
+    def remove_connection(self, from_node: Node, to_node: Node):
+        kept = [connection for connection in self.connections.get(from_node, []) if connection.to_node != to_node]
+        if kept:
+            self.connections[from_node] = kept
+        else:
+            self.connections.pop(from_node, None)
+        self.version += 1
+        self._incoming = None
 
     def get_connections(self, from_node: Node) -> list[Connection]:
-        return self.connections.get(from_node, [])
\ No newline at end of file
+        return self.connections.get(from_node, [])
+
+    def get_incoming_connections(self, to_node: Node) -> list[Connection]:
+        # La adyacencia inversa se construye a partir de connections la primera vez que se necesita
+        if self._incoming is None:
+            incoming = {}
+            for connections in self.connections.values():
+                for connection in connections:
+                    incoming.setdefault(connection.to_node, []).append(connection)
+            self._incoming = incoming
+        return self._incoming.get(to_node, [])
+
+    def is_reachable(self, from_node: Node, to_node: Node) -> bool:
+        # Un grafo genérico no sabe de antemano si hay camino; los grafos de tiles lo responden en O(1)
+        # con sus etiquetas de componentes conexas, y las búsquedas lo usan para descartar consultas imposibles
+        return True
@@ -3,9 +3,21 @@
 # @author Anya Marcano
 # @date 2024/11/05
 
-from nodes import Node
+import threading
+import weakref
+import numpy as np
+from collections import OrderedDict
+from typing import Optional
+from nodes import Node, TileNode
 from abc import ABC, abstractmethod
 
+TABLE_CACHE_SIZE = 8  # Cantidad de tablas de estimaciones que se conservan (una por grafo, versión y objetivo)
+TABLE_CACHE_BYTES = 16 * 1024 * 1024  # Memoria máxima de las tablas conservadas (dos mapas de 1024x1024)
+_table_cache: "OrderedDict[tuple, memoryview]" = OrderedDict()
+SEEN_GOALS_SIZE = 512  # Cantidad de objetivos pedidos una sola vez que se recuerdan para detectar repeticiones
+_seen_goals: "OrderedDict[tuple, None]" = OrderedDict()  # Objetivos pedidos una vez, todavía sin tabla
+_table_lock = threading.Lock()  # Las búsquedas pueden correr en varios hilos (PathPlanner)
+
 class Heuristic(ABC):
     """
     Clase abstracta que representa una heurística para estimar el costo de un camino entre dos nodos.
@@ -15,15 +27,59 @@ class Heuristic(ABC):
         __init__(self, goal_node: Node): Inicializa una nueva heurística con el nodo de destino dado.
         estimate(self, from_node: Node) -> float: Estima el costo de un camino desde un nodo dado al nodo de destino.
         estimate_between(self, from_node: Node, to_node: Node) -> float: Calcula el costo estimado entre dos nodos.
+        estimate_table(self, graph) -> Optional[memoryview]: Devuelve la tabla de estimaciones de los tiles del grafo hasta el objetivo.
+        build_table(self, width: int, height: int) -> Optional[np.ndarray]: Calcula la tabla de estimaciones de un mapa.
+        table_key(self, graph) -> tuple: Identifica la tabla en la caché; dos heurísticas con la misma clave comparten tabla.
     """
     def __init__(self, goal_node: Node):
         self.goal_node = goal_node
-    
+
     def estimate(self, from_node: Node) -> float:
         return self.estimate_between(from_node, self.goal_node)
-    
+
     @abstractmethod
     def estimate_between(self, from_node: Node, to_node: Node) -> float:
         dx = abs(to_node.x - from_node.x)
         dy = abs(to_node.y - from_node.y)
-        return dx + dy
\ No newline at end of file
+        return dx + dy
+
+    def estimate_table(self, graph) -> Optional[memoryview]:
+        # La tabla se indexa con y * graph.width + x y se reutiliza entre consultas hacia el mismo objetivo.
+        # Solo vale la pena para objetivos repetidos: la primera consulta hacia un objetivo recibe None y estima
+        # nodo por nodo, y la tabla se crea a partir de la segunda, completa con build_table si la heurística se
+        # puede vectorizar o en ceros si no. Quien la lee calcula con estimate las celdas que siguen en 0 y
+        # guarda el resultado. Devuelve None si el grafo no es una grilla de tiles
+        width, height = getattr(graph, "width", None), getattr(graph, "height", None)
+        if width is None or height is None or not isinstance(self.goal_node, TileNode):
+            return None
+        key = self.table_key(graph) + (width, height)
+        with _table_lock:
+            table = _table_cache.get(key)
+            if table is not None:
+                _table_cache.move_to_end(key)
+                return table
+            if _seen_goals.pop(key, False) is False:
+                _seen_goals[key] = None
+                if len(_seen_goals) > SEEN_GOALS_SIZE:
+                    _seen_goals.popitem(last=False)
+                return None
+        values = self.build_table(width, height)
+        values = np.zeros(width * height) if values is None else np.asarray(values, dtype=np.float64).ravel()
+        table = memoryview(np.ascontiguousarray(values))
+        with _table_lock:
+            _table_cache[key] = table
+            while len(_table_cache) > 1 and (len(_table_cache) > TABLE_CACHE_SIZE or
+                                             sum(t.nbytes for t in _table_cache.values()) > TABLE_CACHE_BYTES):
+                _table_cache.popitem(last=False)
+        return table
+
+    def build_table(self, width: int, height: int) -> Optional[np.ndarray]:
+        return None
+
+    def table_key(self, graph) -> tuple:
+        # El grafo (por referencia débil, para no mantenerlo vivo ni confundirlo con otro que reuse su id) y su
+        # versión, los parámetros de la heurística (sus atributos además del objetivo) y el objetivo. Las
+        # subclases con atributos que no se pueden hashear la redefinen con sus parámetros, como LandmarkHeuristic
+        params = tuple(sorted((name, value) for name, value in vars(self).items() if name != "goal_node"))
+        return (type(self), weakref.ref(graph), getattr(graph, "version", None), params,
+                self.goal_node.x, self.goal_node.y)
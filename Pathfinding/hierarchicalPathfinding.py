@@ -0,0 +1,281 @@
+# @file hierarchicalPathfinding.py
+# @brief Implementación de pathfinding jerárquico (HPA*) sobre clusters de un grafo de tiles
+# @author Anya Marcano
+# @date 2026/10/18
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+from graph import Graph
+from nodes import Node, TileNode
+from connection import Connection
+from aStar import pathfind_astar
+from manhattanHeuristic import ManhattanHeuristic
+from octileHeuristic import OctileHeuristic
+
+MAX_SINGLE_ENTRANCE = 6  # Las entradas más largas que esto se representan con dos transiciones, una en cada extremo
+
+class _OverlayGraph(Graph):
+    """
+    Grafo que agrega conexiones temporales (las del inicio y el objetivo de una consulta) a un grafo base
+    sin modificarlo.
+    Attributes:
+        base (Graph): El grafo base.
+        connections (dict): Las conexiones temporales por nodo de inicio.
+    """
+    def __init__(self, base: Graph):
+        super().__init__()
+        self.base = base
+
+    def get_connections(self, from_node: Node) -> list[Connection]:
+        extra = self.connections.get(from_node)
+        if extra is None:
+            return self.base.get_connections(from_node)
+        return self.base.get_connections(from_node) + extra
+
+class HierarchicalPathfinder:
+    """
+    Clase que implementa HPA* sobre un grafo de tiles (TileGraph o GridGraph).
+    El mapa se divide en clusters de cluster_size x cluster_size tiles. Se precalculan las transiciones entre
+    clusters vecinos y las distancias entre las entradas de cada cluster, formando un grafo abstracto pequeño.
+    Las consultas buscan primero en el grafo abstracto y luego refinan a tiles solo los tramos que se necesiten.
+    En grafos de 8 direcciones cada transición elegida agrega también los pasos diagonales que cruzan el borde
+    desde su tile interior. Los pasos diagonales que llegan al cluster de la esquina no se agregan: como un paso
+    diagonal nunca corta una esquina, los dos tiles ortogonales que rodea son caminables y el camino por el
+    cluster vecino existe siempre.
+    Attributes:
+        graph (Graph): El grafo de tiles de resolución completa.
+        cluster_size (int): El lado de cada cluster en tiles.
+        clusters_x (int): La cantidad de clusters en horizontal.
+        clusters_y (int): La cantidad de clusters en vertical.
+        abstract (Graph): El grafo abstracto entre las entradas de los clusters.
+        transitions (Dict[tuple, List[Connection]]): Las conexiones entre clusters de cada borde, por (cx, cy, lado).
+        intra_edges (Dict[Tuple[int, int], List[Connection]]): Las conexiones abstractas dentro de cada cluster.
+        Methods:
+            find_abstract_path(self, start: Node, goal: Node) -> Optional[List[Connection]]: Camino en el grafo abstracto.
+            refine_segment(self, connection: Connection) -> Optional[List[Connection]]: Refina un tramo abstracto a tiles.
+            find_path(self, start: Node, goal: Node) -> Optional[List[Connection]]: Camino completo refinado.
+            rebuild_tiles(self, tiles: Iterable[Tuple[int, int]]): Reconstruye localmente los clusters de tiles modificados.
+    """
+    def __init__(self, graph: Graph, cluster_size: int = 10):
+        self.graph = graph
+        self.cluster_size = cluster_size
+        self.clusters_x = -(-graph.width // cluster_size)
+        self.clusters_y = -(-graph.height // cluster_size)
+        self.abstract = Graph()
+        self.transitions: Dict[tuple, List[Connection]] = {}
+        self.intra_edges: Dict[Tuple[int, int], List[Connection]] = {}
+        self.build()
+
+    def build(self):
+        for cy in range(self.clusters_y):
+            for cx in range(self.clusters_x):
+                self._build_transitions(cx, cy, "east")
+                self._build_transitions(cx, cy, "south")
+        for cy in range(self.clusters_y):
+            for cx in range(self.clusters_x):
+                self._build_intra_edges(cx, cy)
+        self._assemble_abstract_graph()
+
+    def cluster_of(self, node: TileNode) -> Tuple[int, int]:
+        return (int(node.x) // self.cluster_size, int(node.y) // self.cluster_size)
+
+    def cluster_bounds(self, cluster: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        cx, cy = cluster
+        size = self.cluster_size
+        return (cx * size, cy * size, min((cx + 1) * size, self.graph.width), min((cy + 1) * size, self.graph.height))
+
+    def entrances(self, cluster: Tuple[int, int]) -> List[TileNode]:
+        # Los tiles del cluster que son extremo de alguna transición hacia un cluster vecino
+        cx, cy = cluster
+        nodes = {}
+        for key in [(cx, cy, "east"), (cx - 1, cy, "east"), (cx, cy, "south"), (cx, cy - 1, "south")]:
+            for connection in self.transitions.get(key, []):
+                for node in (connection.from_node, connection.to_node):
+                    if self.cluster_of(node) == cluster:
+                        nodes[node] = node
+        return list(nodes)
+
+    def find_abstract_path(self, start: TileNode, goal: TileNode) -> Optional[List[Connection]]:
+        start, goal = self.graph.get_node(start.x, start.y), self.graph.get_node(goal.x, goal.y)
+        if start is None or goal is None:
+            return None
+        if start == goal:
+            return []
+
+        # Conectar temporalmente el inicio y el objetivo con las entradas de sus clusters
+        overlay = _OverlayGraph(self.abstract)
+        start_cluster, goal_cluster = self.cluster_of(start), self.cluster_of(goal)
+        start_targets = self.entrances(start_cluster) + ([goal] if goal_cluster == start_cluster else [])
+        costs, _ = self._cluster_dijkstra(start, start_cluster, start_targets)
+        for node in start_targets:
+            if node in costs and node != start:
+                overlay.add_connection(start, node, costs[node])
+        goal_sources = self.entrances(goal_cluster)
+        costs, _ = self._cluster_dijkstra(goal, goal_cluster, goal_sources, reverse=True)
+        for node in goal_sources:
+            if node in costs and node != goal:
+                overlay.add_connection(node, goal, costs[node])
+
+        heuristic = OctileHeuristic(goal) if getattr(self.graph, "diagonal", False) else ManhattanHeuristic(goal)
+        return pathfind_astar(overlay, start, goal, heuristic)
+
+    def refine_segment(self, connection: Connection) -> Optional[List[Connection]]:
+        from_node, to_node = connection.from_node, connection.to_node
+        cluster = self.cluster_of(from_node)
+        # Una transición entre clusters ya es una conexión del grafo de tiles
+        if self.cluster_of(to_node) != cluster:
+            return [connection]
+        _, connections = self._cluster_dijkstra(from_node, cluster, [to_node])
+        if to_node not in connections:
+            return None
+        path = []
+        node = to_node
+        while node != from_node:
+            path.append(connections[node])
+            node = connections[node].from_node
+        path.reverse()
+        return path
+
+    def find_path(self, start: TileNode, goal: TileNode) -> Optional[List[Connection]]:
+        abstract_path = self.find_abstract_path(start, goal)
+        if abstract_path is None:
+            return None
+        path = []
+        for connection in abstract_path:
+            segment = self.refine_segment(connection)
+            if segment is None:
+                return None
+            path.extend(segment)
+        return path
+
+    def rebuild_tiles(self, tiles: Iterable[Tuple[int, int]]):
+        # Reconstruye solo los bordes y las distancias de los clusters afectados por los tiles modificados
+        # y reemplaza en el grafo abstracto solo sus conexiones
+        changed = {(int(x) // self.cluster_size, int(y) // self.cluster_size) for x, y in tiles}
+        if not changed:
+            return
+        keys, affected = set(), set()
+        for cx, cy in changed:
+            keys.update([(cx, cy, "east"), (cx - 1, cy, "east"), (cx, cy, "south"), (cx, cy - 1, "south")])
+            affected.update([(cx, cy), (cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)])
+        keys = [key for key in keys if 0 <= key[0] < self.clusters_x and 0 <= key[1] < self.clusters_y]
+        affected = [cluster for cluster in affected if 0 <= cluster[0] < self.clusters_x and 0 <= cluster[1] < self.clusters_y]
+
+        old = [connection for key in keys for connection in self.transitions.get(key, [])]
+        old += [connection for cluster in affected for connection in self.intra_edges.get(cluster, [])]
+        for key in keys:
+            self._build_transitions(*key)
+        for cluster in affected:
+            self._build_intra_edges(*cluster)
+        for connection in old:
+            self.abstract.remove_connection(connection.from_node, connection.to_node)
+        for connection in [connection for key in keys for connection in self.transitions.get(key, [])] + \
+                          [connection for cluster in affected for connection in self.intra_edges[cluster]]:
+            self.abstract.add_connection(connection.from_node, connection.to_node, connection.get_cost())
+
+    def _build_transitions(self, cx: int, cy: int, side: str):
+        # Busca los tramos contiguos de tiles conectados a través del borde y elige sus transiciones
+        x0, y0, x1, y1 = self.cluster_bounds((cx, cy))
+        if side == "east":
+            if x1 >= self.graph.width:
+                return
+            pairs = [((x1 - 1, y), (x1, y)) for y in range(y0, y1)]
+            along, low, high = (0, 1), y0, y1
+        else:
+            if y1 >= self.graph.height:
+                return
+            pairs = [((x, y1 - 1), (x, y1)) for x in range(x0, x1)]
+            along, low, high = (1, 0), x0, x1
+
+        runs, run = [], []
+        for inside, outside in pairs:
+            crossing = self._find_connection(inside, outside)
+            back = self._find_connection(outside, inside)
+            if crossing is not None and back is not None:
+                run.append((crossing, back))
+            elif run:
+                runs.append(run)
+                run = []
+        if run:
+            runs.append(run)
+
+        transitions = []
+        for run in runs:
+            chosen = [run[len(run) // 2]] if len(run) < MAX_SINGLE_ENTRANCE else [run[0], run[-1]]
+            for crossing, back in chosen:
+                transitions.extend([crossing, back])
+                if getattr(self.graph, "diagonal", False):
+                    transitions.extend(self._diagonal_crossings(crossing, along, low, high))
+        self.transitions[(cx, cy, side)] = transitions
+
+    def _diagonal_crossings(self, crossing: Connection, along: Tuple[int, int], low: int, high: int) -> List[Connection]:
+        # Los pasos diagonales (ida y vuelta) desde el tile interior de una transición hacia los tiles exteriores
+        # contiguos a lo largo del mismo borde, sin salir del tramo del borde entre low y high
+        inside, outside = crossing.from_node, crossing.to_node
+        crossings = []
+        for step in (-1, 1):
+            target = (outside.x + step * along[0], outside.y + step * along[1])
+            if not low <= target[0] * along[0] + target[1] * along[1] < high:
+                continue
+            diagonal = self._find_connection((inside.x, inside.y), target)
+            back = self._find_connection(target, (inside.x, inside.y))
+            if diagonal is not None and back is not None:
+                crossings.extend([diagonal, back])
+        return crossings
+
+    def _build_intra_edges(self, cx: int, cy: int):
+        cluster = (cx, cy)
+        entrances = self.entrances(cluster)
+        edges = []
+        for entrance in entrances:
+            costs, _ = self._cluster_dijkstra(entrance, cluster, entrances)
+            for node in entrances:
+                if node != entrance and node in costs:
+                    edges.append(Connection(entrance, node, costs[node]))
+        self.intra_edges[cluster] = edges
+
+    def _assemble_abstract_graph(self):
+        abstract = Graph()
+        for connections in list(self.transitions.values()) + list(self.intra_edges.values()):
+            for connection in connections:
+                abstract.add_connection(connection.from_node, connection.to_node, connection.get_cost())
+        self.abstract = abstract
+
+    def _find_connection(self, from_xy: Tuple[int, int], to_xy: Tuple[int, int]) -> Optional[Connection]:
+        from_node = self.graph.get_node(*from_xy)
+        if from_node is None:
+            return None
+        for connection in self.graph.get_connections(from_node):
+            if connection.to_node.x == to_xy[0] and connection.to_node.y == to_xy[1]:
+                return connection
+        return None
+
+    def _cluster_dijkstra(self, source: TileNode, cluster: Tuple[int, int], targets: List[TileNode], reverse: bool = False):
+        # Dijkstra restringido a los tiles del cluster, que se detiene al cerrar todos los objetivos.
+        # Con reverse=True recorre las conexiones entrantes y calcula el costo desde cada objetivo hasta source
+        x0, y0, x1, y1 = self.cluster_bounds(cluster)
+        get_connections = self.graph.get_incoming_connections if reverse else self.graph.get_connections
+        pending = set(targets)
+        pending.discard(source)
+        cost_so_far = {source: 0.0}
+        connections = {}
+        closed = set()
+        counter = 0
+        open_heap = [(0.0, counter, source)]
+        while open_heap and pending:
+            cost, _, current = heapq.heappop(open_heap)
+            if current in closed:
+                continue
+            closed.add(current)
+            pending.discard(current)
+            for connection in get_connections(current):
+                end_node = connection.from_node if reverse else connection.to_node
+                if not (x0 <= end_node.x < x1 and y0 <= end_node.y < y1) or end_node in closed:
+                    continue
+                end_node_cost = cost + connection.get_cost()
+                if end_node_cost < cost_so_far.get(end_node, float('inf')):
+                    cost_so_far[end_node] = end_node_cost
+                    connections[end_node] = connection
+                    counter += 1
+                    heapq.heappush(open_heap, (end_node_cost, counter, end_node))
+        return {node: cost for node, cost in cost_so_far.items() if node in closed or node == source}, connections
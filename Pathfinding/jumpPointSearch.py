@@ -0,0 +1,259 @@
+# @file jumpPointSearch.py
+# @brief Implementación de Jump Point Search (JPS) para grillas de tiles de costo uniforme
+# @author Anya Marcano
+# @date 2026/10/18
+
+import heapq
+import math
+import weakref
+import numpy as np
+from typing import List, Optional, Tuple
+from graph import Graph
+from nodes import TileNode
+from connection import Connection
+
+SQRT2 = math.sqrt(2)
+
+class _JumpGrid:
+    """
+    Grilla de tiles caminables con un borde de paredes, para consultar vecinos sin comprobar límites.
+    Las celdas se comparten entre todas las consultas de la misma versión del grafo (ver _cells_for).
+    Attributes:
+        cells (bytes): 1 para tiles caminables y 0 para paredes, con un tile de borde alrededor del mapa.
+        stride (int): El ancho de la grilla con borde.
+        goal (Tuple[int, int]): El tile objetivo, donde siempre termina un salto.
+    """
+    def __init__(self, cells: bytes, stride: int, goal: Tuple[int, int]):
+        self.stride = stride
+        self.cells = cells
+        self.goal = goal
+
+    def walkable(self, x: int, y: int) -> bool:
+        return self.cells[(y + 1) * self.stride + x + 1] == 1
+
+    def jump_4(self, x: int, y: int, dx: int, dy: int) -> Optional[Tuple[int, int]]:
+        # Avanza en línea recta desde (x - dx, y - dy) hasta el siguiente punto de salto
+        walkable = self.walkable
+        while True:
+            if not walkable(x, y):
+                return None
+            if (x, y) == self.goal:
+                return (x, y)
+            if dx != 0:
+                # Vecinos forzados al moverse en horizontal
+                if (walkable(x, y - 1) and not walkable(x - dx, y - 1)) or (walkable(x, y + 1) and not walkable(x - dx, y + 1)):
+                    return (x, y)
+            else:
+                # Vecinos forzados al moverse en vertical
+                if (walkable(x - 1, y) and not walkable(x - 1, y - dy)) or (walkable(x + 1, y) and not walkable(x + 1, y - dy)):
+                    return (x, y)
+                # Al moverse en vertical se deben buscar puntos de salto horizontales
+                if self.jump_4(x + 1, y, 1, 0) is not None or self.jump_4(x - 1, y, -1, 0) is not None:
+                    return (x, y)
+            x += dx
+            y += dy
+
+    def jump_8(self, x: int, y: int, dx: int, dy: int) -> Optional[Tuple[int, int]]:
+        # Igual que jump_4, pero con movimientos diagonales que no cortan esquinas de paredes
+        walkable = self.walkable
+        while True:
+            if not walkable(x, y):
+                return None
+            if (x, y) == self.goal:
+                return (x, y)
+            if dx != 0 and dy != 0:
+                # Al moverse en diagonal se deben buscar puntos de salto horizontales y verticales
+                if self.jump_8(x + dx, y, dx, 0) is not None or self.jump_8(x, y + dy, 0, dy) is not None:
+                    return (x, y)
+            elif dx != 0:
+                if (walkable(x, y - 1) and not walkable(x - dx, y - 1)) or (walkable(x, y + 1) and not walkable(x - dx, y + 1)):
+                    return (x, y)
+            else:
+                if (walkable(x - 1, y) and not walkable(x - 1, y - dy)) or (walkable(x + 1, y) and not walkable(x + 1, y - dy)):
+                    return (x, y)
+            # Un paso diagonal solo es válido si los dos tiles ortogonales son caminables
+            if not (walkable(x + dx, y) and walkable(x, y + dy)):
+                return None
+            x += dx
+            y += dy
+
+    def neighbours_4(self, x: int, y: int, dx: int, dy: int) -> List[Tuple[int, int]]:
+        # Vecinos podados según la dirección de llegada (dx, dy)
+        if dx != 0:
+            candidates = [(x, y - 1), (x, y + 1), (x + dx, y)]
+        elif dy != 0:
+            candidates = [(x - 1, y), (x + 1, y), (x, y + dy)]
+        else:
+            candidates = [(x, y + 1), (x + 1, y), (x, y - 1), (x - 1, y)]
+        return [(nx, ny) for nx, ny in candidates if self.walkable(nx, ny)]
+
+    def neighbours_8(self, x: int, y: int, dx: int, dy: int) -> List[Tuple[int, int]]:
+        walkable = self.walkable
+        neighbours = []
+        if dx != 0 and dy != 0:
+            vertical, horizontal = walkable(x, y + dy), walkable(x + dx, y)
+            if vertical:
+                neighbours.append((x, y + dy))
+            if horizontal:
+                neighbours.append((x + dx, y))
+            if vertical and horizontal:
+                neighbours.append((x + dx, y + dy))
+        elif dx != 0:
+            top, bottom = walkable(x, y - 1), walkable(x, y + 1)
+            if walkable(x + dx, y):
+                neighbours.append((x + dx, y))
+                if top:
+                    neighbours.append((x + dx, y - 1))
+                if bottom:
+                    neighbours.append((x + dx, y + 1))
+            if top:
+                neighbours.append((x, y - 1))
+            if bottom:
+                neighbours.append((x, y + 1))
+        elif dy != 0:
+            left, right = walkable(x - 1, y), walkable(x + 1, y)
+            if walkable(x, y + dy):
+                neighbours.append((x, y + dy))
+                if left:
+                    neighbours.append((x - 1, y + dy))
+                if right:
+                    neighbours.append((x + 1, y + dy))
+            if left:
+                neighbours.append((x - 1, y))
+            if right:
+                neighbours.append((x + 1, y))
+        else:
+            for ndx, ndy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+                if walkable(x + ndx, y + ndy):
+                    neighbours.append((x + ndx, y + ndy))
+            for ndx, ndy in [(1, 1), (1, -1), (-1, 1), (-1, -1)]:
+                if walkable(x + ndx, y + ndy) and walkable(x + ndx, y) and walkable(x, y + ndy):
+                    neighbours.append((x + ndx, y + ndy))
+        return neighbours
+
+_grid_cache = weakref.WeakKeyDictionary()  # Grafo -> (versión, celdas con borde, ancho con borde, costos uniformes)
+
+def _cells_for(graph: Graph) -> Tuple[bytes, int, bool]:
+    # Copiar la grilla con borde y revisar los costos es O(ancho·alto): se hace una vez por versión del grafo
+    # y no en cada consulta
+    cached = _grid_cache.get(graph)
+    if cached is None or cached[0] != graph.version:
+        walkable = graph.walkable
+        cells = np.pad(walkable, 1, constant_values=False).astype(np.uint8).tobytes()
+        cached = (graph.version, cells, walkable.shape[1] + 2, graph.has_uniform_costs())
+        _grid_cache[graph] = cached
+    return cached[1], cached[2], cached[3]
+
+def _sign(value: int) -> int:
+    return (value > 0) - (value < 0)
+
+def _distance(x0: int, y0: int, x1: int, y1: int, diagonal: bool) -> float:
+    dx, dy = abs(x1 - x0), abs(y1 - y0)
+    if diagonal:
+        return (SQRT2 - 1) * min(dx, dy) + max(dx, dy)
+    return dx + dy
+
+def pathfind_jps(graph: Graph, start: TileNode, goal: TileNode, diagonal: Optional[bool] = None) -> Optional[List[Connection]]:
+    """
+    Implementa Jump Point Search sobre la grilla de tiles caminables de un TileGraph.
+    Solo expande los puntos de salto, saltando las regiones abiertas simétricas que A* expandiría tile por tile.
+    Supone que todos los pasos ortogonales cuestan 1 (y los diagonales √2); los diagonales no cortan esquinas de paredes.
+    Un grafo con capa de terreno o costos de conexión propios se rechaza con ValueError: sus caminos óptimos no son
+    simétricos y los saltos podrían pasar por alto un camino más barato, así que hay que usar pathfind_astar.
+    Args:
+        graph (Graph): Un grafo de tiles con el atributo walkable (TileGraph o GridGraph).
+        start (TileNode): El nodo de inicio.
+        goal (TileNode): El nodo objetivo.
+        diagonal (Optional[bool]): Si es True usa conectividad de 8 direcciones; si es False, de 4. Por defecto toma la
+                                   del grafo (graph.diagonal); si se indica y no coincide con ella se lanza ValueError.
+    Returns:
+        Optional[List[Connection]]: Las conexiones tile a tile del camino más corto, igual que pathfind_astar,
+                                    o None si no se encuentra ningún camino.
+    """
+    cells, stride, uniform = _cells_for(graph)
+    if not uniform:
+        raise ValueError("Jump Point Search needs uniform step costs, use pathfind_astar on graphs with terrain costs")
+    # Saltar con otra conectividad que la del grafo daría caminos subóptimos o pasos que el grafo no tiene
+    graph_diagonal = getattr(graph, "diagonal", False)
+    if diagonal is None:
+        diagonal = graph_diagonal
+    elif diagonal != graph_diagonal:
+        raise ValueError(f"diagonal={diagonal} doesn't match the graph connectivity (graph.diagonal={graph_diagonal})")
+    start_xy, goal_xy = (int(start.x), int(start.y)), (int(goal.x), int(goal.y))
+    grid = _JumpGrid(cells, stride, goal_xy)
+    if not grid.walkable(*start_xy) or not grid.walkable(*goal_xy) or not graph.is_reachable(start, goal):
+        return None
+    jump = grid.jump_8 if diagonal else grid.jump_4
+    neighbours = grid.neighbours_8 if diagonal else grid.neighbours_4
+
+    cost_so_far = {start_xy: 0.0}
+    parents = {start_xy: None}
+    closed = set()
+    counter = 0
+    # Las entradas son (f, contador, tile, origen): con origen None el tile es un punto de salto; si no, es un
+    # vecino podado de origen cuyo salto todavía no se calculó
+    open_heap = [(_distance(*start_xy, *goal_xy, diagonal), counter, start_xy, None)]
+
+    # Iterar hasta que la lista abierta esté vacía
+    while open_heap:
+        _, _, current, origin = heapq.heappop(open_heap)
+        if origin is not None:
+            # Saltar de forma perezosa: la clave del vecino es una cota inferior de la f de cualquier punto de
+            # salto que se alcance por él, así que los saltos que no pueden mejorar el camino nunca se calculan
+            # (en un mapa abierto, un salto vertical recorre una fila entera por cada paso)
+            x, y = origin
+            nx, ny = current
+            jump_point = jump(nx, ny, nx - x, ny - y)
+            if jump_point is None or jump_point in closed:
+                continue
+            jump_cost = cost_so_far[origin] + _distance(x, y, *jump_point, diagonal)
+            if jump_cost < cost_so_far.get(jump_point, float('inf')):
+                cost_so_far[jump_point] = jump_cost
+                parents[jump_point] = origin
+                counter += 1
+                heapq.heappush(open_heap, (jump_cost + _distance(*jump_point, *goal_xy, diagonal), counter,
+                                           jump_point, None))
+            continue
+        if current in closed:
+            continue
+        if current == goal_xy:
+            break
+        closed.add(current)
+
+        x, y = current
+        parent = parents[current]
+        dx, dy = (0, 0) if parent is None else (_sign(x - parent[0]), _sign(y - parent[1]))
+
+        # Encolar cada vecino podado; su salto hasta el siguiente punto de salto se calcula al sacarlo
+        cost = cost_so_far[current]
+        for nx, ny in neighbours(x, y, dx, dy):
+            counter += 1
+            heapq.heappush(open_heap, (cost + _distance(x, y, nx, ny, diagonal) + _distance(nx, ny, *goal_xy, diagonal),
+                                       counter, (nx, ny), current))
+
+    # Retornar None si no se encontró un camino
+    if goal_xy not in parents:
+        return None
+
+    # Reconstruir los puntos de salto desde el objetivo hasta el inicio
+    jump_points = []
+    point = goal_xy
+    while point is not None:
+        jump_points.append(point)
+        point = parents[point]
+    jump_points.reverse()
+
+    # Expandir cada tramo recto o diagonal en conexiones tile a tile
+    path = []
+    from_node = graph.get_node(*start_xy)
+    for (x0, y0), (x1, y1) in zip(jump_points, jump_points[1:]):
+        step_x, step_y = _sign(x1 - x0), _sign(y1 - y0)
+        step_cost = SQRT2 if step_x and step_y else 1.0
+        x, y = x0, y0
+        while (x, y) != (x1, y1):
+            x += step_x
+            y += step_y
+            to_node = graph.get_node(x, y)
+            path.append(Connection(from_node, to_node, step_cost))
+            from_node = to_node
+    return path
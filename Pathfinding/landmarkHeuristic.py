@@ -0,0 +1,207 @@
+# @file landmarkHeuristic.py
+# @brief Implementación de la heurística ALT (A*, landmarks y desigualdad triangular) con tablas de distancias precalculadas
+# @author Anya Marcano
+# @date 2026/10/18
+
+import hashlib
+import weakref
+import numpy as np
+from typing import List, Optional, Tuple
+from graph import Graph
+from nodes import Node, TileNode
+from heuristic import Heuristic
+from dijkstra import dijkstra_all
+
+BOUND_MARGIN = 1e-9  # Fracción de la mayor distancia de las tablas que se resta a cada cota, por el redondeo de las restas
+
+class LandmarkTables:
+    """
+    Clase que guarda las distancias exactas desde y hacia un conjunto de landmarks de un grafo de tiles.
+    Los landmarks se eligen por el método del punto más lejano: cada nuevo landmark es el tile alcanzable
+    más alejado de los ya elegidos, de modo que quedan repartidos por los extremos del mapa.
+    Las tablas son arreglos float64 de forma (K, alto * ancho), con infinito en las paredes y en los tiles
+    inalcanzables: guardan las mismas distancias que calcula Dijkstra, sin redondear, para que las cotas sigan
+    siendo admisibles con costos de terreno y pasos diagonales (a las cotas se les resta además un margen
+    proporcional a la mayor distancia, que cubre el redondeo de las restas). Junto a ellas se guarda la huella del grafo
+    (tiles, costos y conectividad) con la que se calcularon, y matches rechaza las tablas de un grafo editado.
+    Attributes:
+        width (int): El ancho del mapa en tiles.
+        height (int): El alto del mapa en tiles.
+        landmarks (np.ndarray): Las coordenadas (x, y) de los K landmarks, de forma (K, 2).
+        from_landmark (np.ndarray): El costo desde cada landmark hasta cada tile.
+        to_landmark (np.ndarray): El costo desde cada tile hasta cada landmark.
+        fingerprint (Optional[str]): La huella del grafo del que se calcularon las tablas.
+        margin (float): Lo que se resta a cada cota para que el redondeo no la haga sobreestimar.
+        Methods:
+            build(cls, graph: Graph, count: int) -> LandmarkTables: Elige los landmarks y calcula las tablas.
+            save(self, path: str): Guarda las tablas en un archivo .npz.
+            load(cls, path: str) -> LandmarkTables: Carga las tablas guardadas con save.
+            matches(self, graph: Graph) -> bool: Indica si las tablas se calcularon sobre el estado actual del grafo.
+            heuristic(self, goal_node: Node, graph: Optional[Graph] = None) -> LandmarkHeuristic: Crea la heurística
+                                                                                                hacia un nodo objetivo.
+    """
+    def __init__(self, width: int, height: int, landmarks: np.ndarray, from_landmark: np.ndarray, to_landmark: np.ndarray,
+                 fingerprint: Optional[str] = None):
+        self.width = width
+        self.height = height
+        self.landmarks = landmarks
+        self.from_landmark = from_landmark
+        self.to_landmark = to_landmark
+        self.fingerprint = fingerprint
+        finite = from_landmark[np.isfinite(from_landmark)]
+        self.margin = BOUND_MARGIN * float(finite.max()) if finite.size else 0.0
+
+    @classmethod
+    def build(cls, graph: Graph, count: int = 8, seed_node: Optional[TileNode] = None) -> "LandmarkTables":
+        width, height = graph.width, graph.height
+        if seed_node is None:
+            seed_node = next(iter(graph.nodes.values()))
+
+        # El primer landmark es el tile más lejano a un tile cualquiera; los siguientes, el más lejano a todos los elegidos
+        nearest = cls._distances(graph, seed_node, reverse=False)
+        landmarks: List[Tuple[int, int]] = []
+        from_rows, to_rows = [], []
+        for _ in range(count):
+            reachable = np.isfinite(nearest)
+            if not reachable.any():
+                break
+            index = int(np.argmax(np.where(reachable, nearest, -1.0)))
+            if landmarks and nearest[index] == 0:
+                break
+            landmark = graph.get_node(index % width, index // width)
+            landmarks.append((landmark.x, landmark.y))
+            from_rows.append(cls._distances(graph, landmark, reverse=False))
+            to_rows.append(cls._distances(graph, landmark, reverse=True))
+            nearest = from_rows[-1] if len(landmarks) == 1 else np.minimum(nearest, from_rows[-1])
+
+        return cls(width, height, np.array(landmarks, dtype=np.int32).reshape(-1, 2),
+                   np.array(from_rows, dtype=np.float64).reshape(-1, height * width),
+                   np.array(to_rows, dtype=np.float64).reshape(-1, height * width),
+                   graph_fingerprint(graph))
+
+    def save(self, path: str):
+        np.savez(path, shape=np.array([self.height, self.width]), landmarks=self.landmarks,
+                 from_landmark=self.from_landmark, to_landmark=self.to_landmark,
+                 fingerprint=np.array(self.fingerprint or ""))
+
+    @classmethod
+    def load(cls, path: str) -> "LandmarkTables":
+        # Las tablas guardadas sin huella (o en float32) no se pueden comprobar y no coinciden con ningún grafo
+        with np.load(path) as data:
+            height, width = (int(value) for value in data["shape"])
+            fingerprint = str(data["fingerprint"]) if "fingerprint" in data.files else None
+            return cls(width, height, data["landmarks"], data["from_landmark"], data["to_landmark"],
+                       fingerprint if data["from_landmark"].dtype == np.float64 else None)
+
+    def matches(self, graph: Graph) -> bool:
+        return (self.width, self.height) == (graph.width, graph.height) and self.fingerprint is not None and \
+            self.fingerprint == graph_fingerprint(graph)
+
+    def heuristic(self, goal_node: Node, graph: Optional[Graph] = None) -> "LandmarkHeuristic":
+        # Con graph se comprueba antes que las tablas sigan siendo del grafo: unas tablas viejas sobreestiman
+        if graph is not None and not self.matches(graph):
+            raise ValueError("Las tablas de landmarks no corresponden al estado actual del grafo")
+        return LandmarkHeuristic(goal_node, self)
+
+    @staticmethod
+    def _distances(graph: Graph, source: TileNode, reverse: bool) -> np.ndarray:
+        row = np.full(graph.height * graph.width, np.inf)
+        cost_so_far, _ = dijkstra_all(graph, source, reverse=reverse)
+        for node, cost in cost_so_far.items():
+            row[node.y * graph.width + node.x] = cost
+        return row
+
+_fingerprint_cache = weakref.WeakKeyDictionary()  # Grafo -> (versión, huella)
+
+def graph_fingerprint(graph: Graph) -> str:
+    """
+    Calcula la huella de un grafo de tiles: un hash de sus tiles caminables, de su capa de terreno, de su
+    conectividad y de los costos de conexión propios. Se calcula una vez por versión del grafo.
+    Args:
+        graph (Graph): Un grafo de tiles (TileGraph o GridGraph).
+    Returns:
+        str: El hash SHA-256 en hexadecimal.
+    """
+    cached = _fingerprint_cache.get(graph)
+    if cached is not None and cached[0] == graph.version:
+        return cached[1]
+    digest = hashlib.sha256()
+    digest.update(repr((graph.width, graph.height, bool(getattr(graph, "diagonal", False)))).encode())
+    digest.update(np.ascontiguousarray(graph.walkable, dtype=bool).tobytes())
+    tile_costs = getattr(graph, "tile_costs", None)
+    if tile_costs is not None:
+        digest.update(np.ascontiguousarray(tile_costs, dtype=np.float64).tobytes())
+    if getattr(graph, "costs", None) is not None:
+        # Grafo compilado (GridGraph): los costos propios están en el arreglo de costos de las conexiones
+        digest.update(np.ascontiguousarray(graph.costs, dtype=np.float64).tobytes())
+    else:
+        digest.update(repr(sorted(getattr(graph, "edge_costs", {}).items())).encode())
+    fingerprint = digest.hexdigest()
+    _fingerprint_cache[graph] = (graph.version, fingerprint)
+    return fingerprint
+
+class LandmarkHeuristic(Heuristic):
+    """
+    Clase que representa la heurística ALT para estimar el costo de un camino entre dos tiles.
+    Por la desigualdad triangular, para cada landmark L se cumple d(a, b) >= d(L, b) - d(L, a) y
+    d(a, b) >= d(a, L) - d(b, L); la estimación es el máximo de esas cotas, así que es admisible y
+    consistente, y a diferencia de la distancia de Manhattan tiene en cuenta las paredes.
+    Attributes:
+        goal_node (Node): El nodo de destino al que se desea llegar.
+        tables (LandmarkTables): Las tablas de distancias de los landmarks.
+        Methods:
+            estimate(self, from_node: Node) -> float: Estima el costo desde un nodo hasta el objetivo.
+            estimate_between(self, from_node: Node, to_node: Node) -> float: Calcula el costo estimado entre dos nodos.
+            build_table(self, width: int, height: int) -> Optional[np.ndarray]: Calcula la estimación de todos los tiles.
+    """
+    def __init__(self, goal_node: Node, tables: LandmarkTables):
+        super().__init__(goal_node)
+        self.tables = tables
+        # Filas como memoryviews para leer escalares de Python sin el costo de indexar numpy
+        self._from_rows = [memoryview(row) for row in np.ascontiguousarray(tables.from_landmark)]
+        self._to_rows = [memoryview(row) for row in np.ascontiguousarray(tables.to_landmark)]
+        self._goal = self._column(goal_node)
+
+    def estimate(self, from_node: Node) -> float:
+        if self._goal is None:
+            return 0
+        return self._bound(self._column(from_node), self._goal, self.tables.margin)
+
+    def estimate_between(self, from_node: Node, to_node: Node) -> float:
+        return self._bound(self._column(from_node), self._column(to_node), self.tables.margin)
+
+    def build_table(self, width: int, height: int) -> Optional[np.ndarray]:
+        if self._goal is None or (width, height) != (self.tables.width, self.tables.height):
+            return None
+        goal_from = np.array(self._goal[0])[:, None]
+        goal_to = np.array(self._goal[1])[:, None]
+        with np.errstate(invalid="ignore"):
+            bounds = np.concatenate([goal_from - self.tables.from_landmark, self.tables.to_landmark - goal_to])
+        # Las diferencias entre dos infinitos (nan) no acotan nada
+        bounds[np.isnan(bounds)] = 0
+        return np.maximum(bounds.max(axis=0, initial=0) - self.tables.margin, 0)
+
+    def table_key(self, graph) -> tuple:
+        return (type(self), weakref.ref(graph), getattr(graph, "version", None), self.tables,
+                self.goal_node.x, self.goal_node.y)
+
+    def _column(self, node: Node) -> Optional[Tuple[list, list]]:
+        # Las distancias de un tile desde y hacia cada landmark
+        if not isinstance(node, TileNode) or not (0 <= node.x < self.tables.width and 0 <= node.y < self.tables.height):
+            return None
+        index = int(node.y) * self.tables.width + int(node.x)
+        return [row[index] for row in self._from_rows], [row[index] for row in self._to_rows]
+
+    @staticmethod
+    def _bound(source: Optional[Tuple[list, list]], target: Optional[Tuple[list, list]], margin: float) -> float:
+        if source is None or target is None:
+            return 0
+        best = 0
+        # Las diferencias entre dos infinitos dan nan y se descartan solas en la comparación
+        for from_source, from_target in zip(source[0], target[0]):
+            if from_target - from_source > best:
+                best = from_target - from_source
+        for to_source, to_target in zip(source[1], target[1]):
+            if to_source - to_target > best:
+                best = to_source - to_target
+        return best - margin if best > margin else 0
@@ -2,6 +2,7 @@
 # @brief Implementación de la clase ManhattanHeuristic, que representa una heurística de distancia de Manhattan
 # @author Anya Marcano
 # @date 2024/11/05
+import numpy as np
 from heuristic import Heuristic
 from nodes import TileNode
 from nodes import Node
@@ -13,10 +14,16 @@ class ManhattanHeuristic(Heuristic):
         goal_node (Node): El nodo de destino al que se desea llegar.
         Methods:
             estimate_between(self, from_node: Node, to_node: Node) -> float: Calcula el costo estimado entre dos nodos.
+            build_table(self, width: int, height: int) -> np.ndarray: Calcula la distancia de todos los tiles al objetivo.
     """
     def estimate_between(self, from_node: Node, to_node: Node) -> float:
         from_tile = from_node
         to_tile = to_node
         if isinstance(from_node, TileNode) and isinstance(to_node, TileNode):
             return abs(from_tile.x - to_tile.x) + abs(from_tile.y - to_tile.y)
-        return 0
\ No newline at end of file
+        return 0
+
+    def build_table(self, width: int, height: int) -> np.ndarray:
+        dx = np.abs(np.arange(width) - self.goal_node.x)
+        dy = np.abs(np.arange(height) - self.goal_node.y)
+        return dy[:, None] + dx[None, :]
@@ -0,0 +1,83 @@
+# @file multiGoalSearch.py
+# @brief Búsqueda de los objetivos más cercanos a un nodo con una sola expansión de Dijkstra
+# @author Anya Marcano
+# @date 2026/10/18
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+from graph import Graph
+from nodes import Node
+from connection import Connection
+
+def pathfind_k_nearest(graph: Graph, start: Node, goals: Iterable[Node], k: int) -> List[Tuple[List[Connection], Node]]:
+    """
+    Encuentra los k objetivos más cercanos a un nodo con una única búsqueda de Dijkstra desde el inicio,
+    que se detiene en cuanto se cierran k nodos objetivo.
+    Args:
+        graph (Graph): El grafo en el que se realizará la búsqueda.
+        start (Node): El nodo de inicio.
+        goals (Iterable[Node]): Los nodos objetivo candidatos.
+        k (int): La cantidad de objetivos a encontrar.
+    Returns:
+        List[Tuple[List[Connection], Node]]: Hasta k pares (camino, objetivo) ordenados del más cercano al más lejano.
+                                             Los objetivos inalcanzables no aparecen.
+    """
+    pending = {goal for goal in goals if graph.is_reachable(start, goal)}
+    found = []
+    cost_so_far: Dict[Node, float] = {start: 0.0}
+    connections: Dict[Node, Connection] = {}
+    closed = set()
+    counter = 0
+    open_heap = [(0.0, counter, start)]
+
+    # Iterar hasta que la lista abierta esté vacía o se hayan encontrado k objetivos
+    while open_heap and pending and len(found) < k:
+        cost, _, current = heapq.heappop(open_heap)
+        # Descartar entradas obsoletas
+        if current in closed:
+            continue
+        closed.add(current)
+
+        # Si el nodo actual es un objetivo, reconstruir su camino y seguir expandiéndolo:
+        # puede ser el único paso hacia otros objetivos
+        if current in pending:
+            pending.discard(current)
+            found.append((_reconstruct_path(connections, start, current), current))
+            if not pending or len(found) == k:
+                break
+
+        for connection in graph.get_connections(current):
+            end_node = connection.to_node
+            end_node_cost = cost + connection.get_cost()
+            if end_node in closed or end_node_cost >= cost_so_far.get(end_node, float('inf')):
+                continue
+            cost_so_far[end_node] = end_node_cost
+            connections[end_node] = connection
+            counter += 1
+            heapq.heappush(open_heap, (end_node_cost, counter, end_node))
+
+    return found
+
+def pathfind_nearest(graph: Graph, start: Node, goals: Iterable[Node]) -> Optional[Tuple[List[Connection], Node]]:
+    """
+    Encuentra el objetivo más cercano a un nodo y el camino hasta él con una sola búsqueda.
+    Args:
+        graph (Graph): El grafo en el que se realizará la búsqueda.
+        start (Node): El nodo de inicio.
+        goals (Iterable[Node]): Los nodos objetivo candidatos.
+    Returns:
+        Optional[Tuple[List[Connection], Node]]: El camino y el objetivo alcanzado, o None si ninguno es alcanzable.
+    """
+    found = pathfind_k_nearest(graph, start, goals, 1)
+    return found[0] if found else None
+
+def _reconstruct_path(connections: Dict[Node, Connection], start: Node, goal: Node) -> List[Connection]:
+    path = []
+    node = goal
+    # Iterar desde el objetivo hasta el nodo de inicio
+    while node != start:
+        connection = connections[node]
+        path.append(connection)
+        node = connection.from_node
+    path.reverse()
+    return path
@@ -11,6 +11,8 @@ class Node:
         Methods:
             __init__(self, name: str): Inicializa un nuevo nodo con el nombre dado.
     """
+    __slots__ = ("name",)
+
     def __init__(self, name):
         self.name = name
 
@@ -22,8 +24,23 @@ class TileNode(Node):
         y (int): La coordenada y del nodo.
         Methods:
             __init__(self, x: int, y: int): Inicializa un nuevo nodo de mosaico con las coordenadas dadas.
+            __eq__(self, other) -> bool: Dos nodos de mosaico son iguales si tienen las mismas coordenadas.
+            __hash__(self) -> int: Hash basado en las coordenadas, para usar el nodo como clave de diccionario.
     """
+    __slots__ = ("x", "y")
+
     def __init__(self, x: int, y: int):
         super().__init__(f"tile_{x}_{y}")
         self.x = x
-        self.y = y
\ No newline at end of file
+        self.y = y
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TileNode):
+            return self.x == other.x and self.y == other.y
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+    def __repr__(self) -> str:
+        return f"TileNode({self.x}, {self.y})"
\ No newline at end of file
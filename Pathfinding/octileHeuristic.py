@@ -0,0 +1,33 @@
+# @file octileHeuristic.py
+# @brief Implementación de la clase OctileHeuristic, que representa una heurística de distancia octil para grillas de 8 direcciones
+# @author Anya Marcano
+# @date 2026/10/18
+import math
+import numpy as np
+from heuristic import Heuristic
+from nodes import TileNode
+from nodes import Node
+
+DIAGONAL_EXTRA = math.sqrt(2) - 1  # Lo que cuesta de más un paso diagonal respecto a uno ortogonal
+
+class OctileHeuristic(Heuristic):
+    """
+    Clase que representa una heurística de distancia octil para estimar el costo de un camino entre dos nodos
+    cuando el grafo permite pasos diagonales de costo √2 además de los ortogonales de costo 1.
+    Attributes:
+        goal_node (Node): El nodo de destino al que se desea llegar.
+        Methods:
+            estimate_between(self, from_node: Node, to_node: Node) -> float: Calcula el costo estimado entre dos nodos.
+            build_table(self, width: int, height: int) -> np.ndarray: Calcula la distancia de todos los tiles al objetivo.
+    """
+    def estimate_between(self, from_node: Node, to_node: Node) -> float:
+        if isinstance(from_node, TileNode) and isinstance(to_node, TileNode):
+            dx = abs(from_node.x - to_node.x)
+            dy = abs(from_node.y - to_node.y)
+            return max(dx, dy) + DIAGONAL_EXTRA * min(dx, dy)
+        return 0
+
+    def build_table(self, width: int, height: int) -> np.ndarray:
+        dx = np.abs(np.arange(width) - self.goal_node.x)[None, :]
+        dy = np.abs(np.arange(height) - self.goal_node.y)[:, None]
+        return np.maximum(dx, dy) + DIAGONAL_EXTRA * np.minimum(dx, dy)
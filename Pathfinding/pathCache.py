@@ -0,0 +1,59 @@
+# @file pathCache.py
+# @brief Implementación de una caché LRU de caminos que se invalida cuando cambia la versión del grafo
+# @author Anya Marcano
+# @date 2026/10/18
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+from graph import Graph
+
+class PathCache:
+    """
+    Clase que guarda los resultados de las búsquedas de caminos más recientes.
+    Cada entrada se identifica por (inicio, objetivo, algoritmo), donde el algoritmo es cualquier valor hashable que
+    distinga la búsqueda (por ejemplo la función y la clase de heurística). Cuando se llena se descarta la entrada
+    usada hace más tiempo, y toda la caché se vacía si se consulta con otro grafo o si cambió graph.version.
+    Los caminos devueltos se comparten entre consultas, así que no se deben modificar.
+    Attributes:
+        capacity (int): La cantidad máxima de entradas.
+        hits (int): La cantidad de consultas resueltas desde la caché.
+        misses (int): La cantidad de consultas que necesitaron una búsqueda.
+        Methods:
+            find(self, graph: Graph, start: Hashable, goal: Hashable, algorithm: Hashable, search: Callable[[], Any]) -> Any:
+                Devuelve el resultado guardado o ejecuta search y guarda su resultado.
+            invalidate(self): Vacía la caché.
+    """
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._graph: Optional[Graph] = None
+        self._version = None
+
+    def find(self, graph: Graph, start: Hashable, goal: Hashable, algorithm: Hashable, search: Callable[[], Any]) -> Any:
+        # Los caminos calculados sobre otro grafo o sobre una versión anterior ya no son válidos
+        if graph is not self._graph or graph.version != self._version:
+            self.invalidate()
+            self._graph = graph
+            self._version = graph.version
+
+        key = (start, goal, algorithm)
+        entries = self._entries
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+
+        self.misses += 1
+        result = search()
+        entries[key] = result
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+        return result
+
+    def invalidate(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
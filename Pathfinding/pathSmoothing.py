@@ -0,0 +1,150 @@
+# @file pathSmoothing.py
+# @brief Suavizado de caminos por línea de visión (string pulling) sobre un mapa de bits de paredes
+# @author Anya Marcano
+# @date 2026/10/18
+
+import math
+import weakref
+import numpy as np
+from typing import List, Optional
+from graph import Graph
+from connection import Connection
+
+class LineOfSight:
+    """
+    Clase que responde si hay línea de visión entre los centros de dos tiles de una grilla por la que se pueda
+    atajar sin cambiar el costo del camino.
+    Cada tile guarda su clase de costo (un entero por cada costo de terreno distinto), con un tile de borde alrededor
+    del mapa para consultar sin comprobar límites; las paredes y los tiles con costos de conexión propios tienen
+    clase 0. La línea recorre todos los tiles que toca (supercover) y solo está libre si todos son de la misma clase
+    que el tile de partida; cuando pasa justo por la esquina entre cuatro tiles, exige lo mismo de los dos tiles
+    laterales, igual que un paso diagonal.
+    Attributes:
+        cells (memoryview): La clase de costo de cada tile, con el borde incluido.
+        stride (int): El ancho de la grilla con borde.
+        class_costs (List[float]): El costo de entrar a un tile de cada clase (el índice 0 no se usa).
+        Methods:
+            clear(self, x0: int, y0: int, x1: int, y1: int) -> bool: Indica si la línea entre dos tiles no cruza
+                                                                     paredes ni tiles de otro costo.
+            cost(self, x: int, y: int) -> float: Devuelve el costo de entrar a un tile.
+    """
+    def __init__(self, walkable: np.ndarray, tile_costs: Optional[np.ndarray] = None,
+                 irregular: Optional[np.ndarray] = None):
+        walkable = np.asarray(walkable, dtype=bool)
+        tile_costs = np.ones(walkable.shape) if tile_costs is None else np.asarray(tile_costs, dtype=np.float64)
+        values, classes = np.unique(tile_costs, return_inverse=True)
+        classes = classes.reshape(walkable.shape).astype(np.int32) + 1
+        classes[~walkable] = 0
+        if irregular is not None:
+            classes[irregular] = 0
+        self.stride = walkable.shape[1] + 2
+        self.cells = memoryview(np.pad(classes, 1, constant_values=0).ravel())
+        self.class_costs = [0.0] + values.tolist()
+
+    def clear(self, x0: int, y0: int, x1: int, y1: int) -> bool:
+        cells, stride = self.cells, self.stride
+        cost_class = cells[(y0 + 1) * stride + x0 + 1]
+        if not cost_class:
+            return False
+        dx, dy = abs(x1 - x0), abs(y1 - y0)
+        step_x, step_y = (1 if x1 > x0 else -1), (1 if y1 > y0 else -1)
+        x, y = x0, y0
+        error = dx - dy
+        dx, dy = dx * 2, dy * 2
+        remaining = dx // 2 + dy // 2
+        while True:
+            if cells[(y + 1) * stride + x + 1] != cost_class:
+                return False
+            if remaining <= 0:
+                return True
+            if error > 0:
+                x += step_x
+                error -= dy
+            elif error < 0:
+                y += step_y
+                error += dx
+            else:
+                # La línea pasa exactamente por una esquina: no se puede pasar entre dos paredes que se tocan
+                if cells[(y + 1) * stride + x + step_x + 1] != cost_class or \
+                        cells[(y + step_y + 1) * stride + x + 1] != cost_class:
+                    return False
+                x += step_x
+                y += step_y
+                error += dx - dy
+                remaining -= 1
+            remaining -= 1
+
+    def cost(self, x: int, y: int) -> float:
+        return self.class_costs[self.cells[(y + 1) * self.stride + x + 1]]
+
+_line_of_sight_cache = weakref.WeakKeyDictionary()  # Grafo -> (versión, LineOfSight)
+
+def line_of_sight_for(graph: Graph) -> LineOfSight:
+    """
+    Devuelve el LineOfSight de un grafo de tiles, reutilizando el mapa de clases mientras no cambie graph.version.
+    Args:
+        graph (Graph): Un grafo de tiles con el atributo walkable (TileGraph o GridGraph).
+    Returns:
+        LineOfSight: El mapa de clases de costo del grafo.
+    """
+    cached = _line_of_sight_cache.get(graph)
+    if cached is None or cached[0] != graph.version:
+        tile_costs = getattr(graph, "tile_costs", None)
+        cached = (graph.version, LineOfSight(graph.walkable, tile_costs, _irregular_tiles(graph, tile_costs)))
+        _line_of_sight_cache[graph] = cached
+    return cached[1]
+
+def _irregular_tiles(graph: Graph, tile_costs: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    # Tiles con alguna conexión cuyo costo no es la longitud del paso por el costo del tile al que entra
+    # (costos propios de set_edge_cost): un atajo que los cruce no tendría el costo del camino original
+    irregular = np.zeros(np.shape(graph.walkable), dtype=bool)
+    if getattr(graph, "costs", None) is not None:
+        # Grafo compilado (GridGraph): comparar el costo de cada conexión con el esperado
+        xs, ys, targets = graph.xs, graph.ys, graph.targets
+        sources = np.repeat(np.arange(len(xs)), np.diff(graph.offsets))
+        expected = np.hypot(xs[targets] - xs[sources], ys[targets] - ys[sources])
+        if tile_costs is not None:
+            expected = expected * np.asarray(tile_costs, dtype=np.float64)[ys[targets], xs[targets]]
+        mismatched = ~np.isclose(graph.costs, expected)
+        irregular[ys[sources[mismatched]], xs[sources[mismatched]]] = True
+        irregular[ys[targets[mismatched]], xs[targets[mismatched]]] = True
+    else:
+        for (x0, y0), (x1, y1) in getattr(graph, "edge_costs", {}):
+            irregular[y0, x0] = irregular[y1, x1] = True
+    return irregular
+
+def smooth_path(graph: Graph, path: Optional[List[Connection]]) -> Optional[List[Connection]]:
+    """
+    Quita los puntos intermedios redundantes de un camino de tiles: desde cada punto de paso se avanza hasta el
+    último tile del camino que todavía se ve en línea recta, y ese tile es el siguiente punto de paso.
+    Solo se ataja por tiles del mismo costo de terreno que el punto de paso, así que un atajo nunca cruza un
+    terreno más caro que el que el camino original rodeaba.
+    Args:
+        graph (Graph): El grafo de tiles sobre el que se calculó el camino.
+        path (Optional[List[Connection]]): El camino tile a tile, como lo devuelve pathfind_astar.
+    Returns:
+        Optional[List[Connection]]: El camino con un tramo recto por conexión, o None si path es None. Los tramos
+                                    de un solo paso conservan la conexión original y los demás cuestan su longitud
+                                    euclidiana por el costo del terreno que cruzan.
+    """
+    if not path:
+        return path
+    line_of_sight = line_of_sight_for(graph)
+    nodes = [path[0].from_node] + [connection.to_node for connection in path]
+
+    smoothed = []
+    anchor = 0
+    for i in range(2, len(nodes)):
+        if not line_of_sight.clear(nodes[anchor].x, nodes[anchor].y, nodes[i].x, nodes[i].y):
+            smoothed.append(_segment(line_of_sight, path, anchor, i - 1))
+            anchor = i - 1
+    smoothed.append(_segment(line_of_sight, path, anchor, len(nodes) - 1))
+    return smoothed
+
+def _segment(line_of_sight: LineOfSight, path: List[Connection], first: int, last: int) -> Connection:
+    # Conexión entre el nodo first y el nodo last del camino (el nodo i es path[i].from_node)
+    if last == first + 1:
+        return path[first]
+    start, end = path[first].from_node, path[last - 1].to_node
+    length = math.hypot(end.x - start.x, end.y - start.y)
+    return Connection(start, end, length * line_of_sight.cost(start.x, start.y))
@@ -3,10 +3,11 @@
 # @author Anya Marcano
 # @date 2024/11/05
 
+import heapq
 from dataclasses import dataclass
 from nodes import Node
 from connection import Connection
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 @dataclass
 class NodeRecord:
     """
@@ -31,9 +32,11 @@ class PathfindingList:
             __len__(self): Devuelve la cantidad de registros en la lista.
             add(self, record: NodeRecord): Agrega un nuevo registro a la lista.
             remove(self, record: NodeRecord): Elimina un registro de la lista.
+            update(self, record: NodeRecord): No hace nada, el orden se calcula en cada consulta.
             contains(self, node: Node) -> bool: Devuelve si la lista contiene un nodo dado.
             find(self, node: Node) -> Optional[NodeRecord]: Encuentra un registro en la lista dado un nodo.
             smallest_element(self) -> NodeRecord: Devuelve el registro con el menor costo total estimado.
+    Se conserva como implementación de referencia de PathfindingHeap y PathfindingTable.
     """
     def __init__(self):
         self.records: List[NodeRecord] = []
@@ -47,6 +50,9 @@ class PathfindingList:
     def remove(self, record: NodeRecord):
         self.records.remove(record)
     
+    def update(self, record: NodeRecord):
+        pass
+    
     def contains(self, node: Node) -> bool:
         return any(record.node == node for record in self.records)
     
@@ -58,3 +64,78 @@ class PathfindingList:
     
     def smallest_element(self) -> NodeRecord:
         return min(self.records, key=lambda x: x.estimated_total_cost)
+
+class PathfindingTable:
+    """
+    Clase que representa un conjunto de registros indexado por nodo (lista cerrada).
+    Ofrece la misma interfaz que PathfindingList, pero todas las operaciones son O(1).
+    Atributos:
+        records (Dict[Node, NodeRecord]): Diccionario que mapea cada nodo a su registro
+        Métodos:
+            __init__(self): Inicializa una nueva tabla sin registros.
+            __len__(self): Devuelve la cantidad de registros en la tabla.
+            add(self, record: NodeRecord): Agrega un nuevo registro a la tabla.
+            remove(self, record: NodeRecord): Elimina un registro de la tabla.
+            contains(self, node: Node) -> bool: Devuelve si la tabla contiene un nodo dado.
+            find(self, node: Node) -> Optional[NodeRecord]: Encuentra un registro en la tabla dado un nodo.
+    """
+    def __init__(self):
+        self.records: Dict[Node, NodeRecord] = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def add(self, record: NodeRecord):
+        self.records[record.node] = record
+
+    def remove(self, record: NodeRecord):
+        del self.records[record.node]
+
+    def contains(self, node: Node) -> bool:
+        return node in self.records
+
+    def find(self, node: Node) -> Optional[NodeRecord]:
+        return self.records.get(node)
+
+class PathfindingHeap(PathfindingTable):
+    """
+    Clase que representa una lista abierta respaldada por un montículo binario.
+    Los registros se indexan por nodo como en PathfindingTable y se ordenan en un montículo
+    con borrado perezoso: actualizar o eliminar un registro no reordena el montículo, las
+    entradas obsoletas se descartan al consultar el menor elemento.
+    Atributos:
+        records (Dict[Node, NodeRecord]): Diccionario que mapea cada nodo abierto a su registro
+        heap (List[tuple]): Montículo de tuplas (prioridad, orden de inserción, registro)
+        key (Callable[[NodeRecord], float]): Función que devuelve la prioridad de un registro
+        Métodos:
+            __init__(self, key): Inicializa una nueva lista abierta vacía.
+            add(self, record: NodeRecord): Agrega un nuevo registro a la lista.
+            update(self, record: NodeRecord): Reordena un registro cuya prioridad disminuyó.
+            smallest_element(self) -> NodeRecord: Devuelve el registro con la menor prioridad.
+    """
+    def __init__(self, key: Callable[[NodeRecord], float] = lambda x: x.estimated_total_cost):
+        super().__init__()
+        self.heap: List[tuple] = []
+        self.key = key
+        self._counter = 0
+
+    def add(self, record: NodeRecord):
+        self.records[record.node] = record
+        self._push(record)
+
+    def update(self, record: NodeRecord):
+        self._push(record)
+
+    def smallest_element(self) -> NodeRecord:
+        heap = self.heap
+        while heap:
+            priority, _, record = heap[0]
+            # Descartar entradas de registros eliminados o con prioridad desactualizada
+            if self.records.get(record.node) is record and priority == self.key(record):
+                return record
+            heapq.heappop(heap)
+        raise ValueError("smallest_element() sobre una lista vacía")
+
+    def _push(self, record: NodeRecord):
+        self._counter += 1
+        heapq.heappush(self.heap, (self.key(record), self._counter, record))
@@ -0,0 +1,135 @@
+# @file timeSlicedAStar.py
+# @brief Implementación de una búsqueda A* reanudable que se reparte entre frames con un presupuesto por llamada
+# @author Anya Marcano
+# @date 2026/10/18
+
+import heapq
+import time
+from typing import Dict, List, Optional
+from graph import Graph
+from nodes import Node
+from connection import Connection
+from heuristic import Heuristic
+
+class TimeSlicedAStar:
+    """
+    Clase que implementa A* como una búsqueda reanudable.
+    Cada llamada a step expande como máximo max_nodes nodos o durante max_time_us microsegundos y conserva la lista
+    abierta, los costos y las conexiones para la siguiente llamada, de modo que una búsqueda larga se reparte entre
+    varios frames. Mientras no termina, partial_path devuelve el camino hasta el nodo expandido que la heurística
+    estima más cerca del objetivo, para que el agente pueda empezar a moverse.
+    Attributes:
+        graph (Graph): El grafo en el cual se realiza la búsqueda.
+        start (Node): El nodo de inicio.
+        goal (Node): El nodo objetivo.
+        heuristic (Heuristic): La heurística hacia el objetivo.
+        expanded (int): La cantidad de nodos expandidos hasta ahora.
+        finished (bool): Si la búsqueda terminó.
+        found (bool): Si la búsqueda terminó encontrando el objetivo.
+        best_node (Node): El nodo expandido con menor estimación hasta el objetivo.
+        Methods:
+            step(self, max_nodes: Optional[int], max_time_us: Optional[float]) -> bool: Continúa la búsqueda; devuelve True si terminó.
+            run(self) -> Optional[List[Connection]]: Termina la búsqueda sin presupuesto y devuelve el camino.
+            path(self) -> Optional[List[Connection]]: El camino al objetivo, si ya se encontró.
+            partial_path(self) -> List[Connection]: El mejor camino parcial encontrado hasta ahora.
+    """
+    def __init__(self, graph: Graph, start: Node, goal: Node, heuristic: Heuristic):
+        self.graph = graph
+        self.start = start
+        self.goal = goal
+        self.heuristic = heuristic
+        self.expanded = 0
+        self.finished = False
+        self.found = False
+        self.cost_so_far: Dict[Node, float] = {start: 0.0}
+        self.connections: Dict[Node, Connection] = {}
+        self.closed = set()
+        self._table = heuristic.estimate_table(graph)
+        self._width = graph.width if self._table is not None else 0
+        start_estimate = heuristic.estimate(start)
+        self.best_node = start
+        self._best_estimate = start_estimate
+        self._counter = 0
+        self._open = [(start_estimate, self._counter, 0.0, start)]
+        # Un objetivo en otra componente conexa termina la búsqueda sin expandir nada
+        if not graph.is_reachable(start, goal):
+            self._open = []
+            self.finished = True
+
+    def step(self, max_nodes: Optional[int] = None, max_time_us: Optional[float] = None) -> bool:
+        if self.finished:
+            return True
+        deadline = None if max_time_us is None else time.perf_counter() + max_time_us / 1e6
+        open_heap, closed, cost_so_far, connections = self._open, self.closed, self.cost_so_far, self.connections
+        table, width, heuristic = self._table, self._width, self.heuristic
+        expanded = 0
+
+        # Iterar hasta que la lista abierta esté vacía o se agote el presupuesto. Siempre se expande al menos
+        # un nodo por llamada, así que la búsqueda avanza aunque el presupuesto de tiempo sea muy pequeño
+        while open_heap:
+            if max_nodes is not None and expanded >= max_nodes:
+                return False
+            if deadline is not None and expanded > 0 and time.perf_counter() >= deadline:
+                return False
+            estimate, _, cost, current = heapq.heappop(open_heap)
+            # Descartar entradas obsoletas
+            if current in closed or cost > cost_so_far[current]:
+                continue
+
+            # Si el nodo actual es el objetivo, terminar
+            if current == self.goal:
+                self.finished = self.found = True
+                self.best_node = current
+                return True
+
+            closed.add(current)
+            expanded += 1
+            self.expanded += 1
+            remaining = estimate - cost
+            if remaining < self._best_estimate:
+                self.best_node, self._best_estimate = current, remaining
+
+            for connection in self.graph.get_connections(current):
+                end_node = connection.to_node
+                end_node_cost = cost + connection.get_cost()
+                if end_node_cost >= cost_so_far.get(end_node, float('inf')):
+                    continue
+                # Un nodo cerrado que mejora su costo se vuelve a abrir (heurísticas no consistentes)
+                closed.discard(end_node)
+                cost_so_far[end_node] = end_node_cost
+                connections[end_node] = connection
+                if table is not None:
+                    index = end_node.y * width + end_node.x
+                    end_node_heuristic = table[index]
+                    if not end_node_heuristic:
+                        end_node_heuristic = table[index] = heuristic.estimate(end_node)
+                else:
+                    end_node_heuristic = heuristic.estimate(end_node)
+                self._counter += 1
+                heapq.heappush(open_heap, (end_node_cost + end_node_heuristic, self._counter, end_node_cost, end_node))
+
+        # La lista abierta se vació sin llegar al objetivo
+        self.finished = True
+        return True
+
+    def run(self) -> Optional[List[Connection]]:
+        self.step()
+        return self.path()
+
+    def path(self) -> Optional[List[Connection]]:
+        if not self.found:
+            return None
+        return self._reconstruct(self.goal)
+
+    def partial_path(self) -> List[Connection]:
+        return self._reconstruct(self.best_node)
+
+    def _reconstruct(self, node: Node) -> List[Connection]:
+        path = []
+        # Iterar desde el nodo hasta el nodo de inicio
+        while node != self.start:
+            connection = self.connections[node]
+            path.append(connection)
+            node = connection.from_node
+        path.reverse()
+        return path
@@ -6,8 +6,15 @@
 import pygame
 from Pathfinding.aStar import pathfind_astar
 from Pathfinding.manhattanHeuristic import ManhattanHeuristic
+from Pathfinding.octileHeuristic import OctileHeuristic
+from Pathfinding.multiGoalSearch import pathfind_nearest
+from Pathfinding.pathCache import PathCache
+from Pathfinding.pathSmoothing import smooth_path
 from WorldRepresentation.tileGraph import TileGraph
 
+# Caché compartida por get_path y encontrar_NPC_cercano; se vacía sola cuando cambia la versión del grafo
+path_cache = PathCache()
+
 #  Funcion para cargar y escalar imágenes de los personajes
 def load_and_scale_image(path, scale_factor=1):
     """
@@ -47,7 +54,7 @@ def check_collision(x, y, scaled_maze):
         return True
     
 # Función para obtener el camino entre dos puntos
-def get_path(start_x: int, start_y: int, end_x: int, end_y: int, tile_graph: TileGraph, tile_size: int):
+def get_path(start_x: int, start_y: int, end_x: int, end_y: int, tile_graph: TileGraph, tile_size: int, path_database=None):
     """
     Obtiene el camino entre dos puntos
     :param start_x: int
@@ -62,20 +69,25 @@ def get_path(start_x: int, start_y: int, end_x: int, end_y: int, tile_graph: Til
     El grafo de nodos
     :param tile_size: int
     El tamaño de los nodos
+    :param path_database: PathDatabase
+    Tabla precalculada de primeros movimientos del mapa (opcional); si corresponde al grafo, el camino se lee de ella sin buscar
     :return: list
     La lista de nodos que representan el camino
     """
     start_node = tile_graph.nodes.get((start_x // tile_size, start_y // tile_size))
     end_node = tile_graph.nodes.get((end_x // tile_size, end_y // tile_size))
     
-    if start_node and end_node:
-        heuristic = ManhattanHeuristic(end_node)
-        path = pathfind_astar(tile_graph, start_node, end_node, heuristic)
-        return path
+    # Las etiquetas de componentes conexas descartan los destinos inalcanzables sin buscar
+    if start_node and end_node and tile_graph.is_reachable(start_node, end_node):
+        if path_database is not None and path_database.matches(tile_graph):
+            return path_database.find_path(start_node, end_node)
+        heuristic = OctileHeuristic(end_node) if tile_graph.diagonal else ManhattanHeuristic(end_node)
+        return path_cache.find(tile_graph, start_node, end_node, (pathfind_astar, type(heuristic)),
+                               lambda: pathfind_astar(tile_graph, start_node, end_node, heuristic))
     return None
 
 # Función para encontrar el npc más cercano en base al path finding
-def encontrar_NPC_cercano(player_x, player_y, NPC_positions, tile_graph, tile_size):
+def encontrar_NPC_cercano(player_x, player_y, NPC_positions, tile_graph, tile_size, suavizar=False):
     """
     Encuentra el NPC más cercano al jugador
     :param player_x: int
@@ -88,24 +100,37 @@ def encontrar_NPC_cercano(player_x, player_y, NPC_positions, tile_graph, tile_si
     El grafo de nodos
     :param tile_size: int
     El tamaño de los nodos
+    :param suavizar: bool
+    Si es True, el camino se devuelve suavizado por línea de visión (pocos tramos rectos largos)
     :return: list, dict
     La lista de nodos que representan el camino y el NPC objetivo
     """
-    mejor_distancia = float('inf')
-    mejor_camino = None
-    objetivo = None
+    start_node = tile_graph.nodes.get((player_x // tile_size, player_y // tile_size))
+    if not start_node:
+        return None, None
 
+    # Tiles objetivo de cada NPC (el primero de la lista si dos comparten tile).
+    # Un NPC en el mismo tile que el jugador no da un camino válido, así que se descarta
+    objetivos = {}
     for NPC in NPC_positions:
-        camino = get_path(player_x, player_y, NPC["x"], NPC["y"], tile_graph, tile_size)
-        if camino:
-            # Calculamos la longitud del camino
-            distancia = len(camino)
-            if distancia < mejor_distancia:
-                mejor_distancia = distancia
-                mejor_camino = camino
-                objetivo = NPC
+        nodo = tile_graph.nodes.get((NPC["x"] // tile_size, NPC["y"] // tile_size))
+        if nodo and nodo != start_node and nodo not in objetivos:
+            objetivos[nodo] = NPC
+
+    # Una sola búsqueda desde el jugador que se detiene en el primer NPC alcanzado.
+    # Mientras nadie cambie de tile, la consulta se repite igual en cada frame y se resuelve desde la caché
+    def buscar():
+        resultado = pathfind_nearest(tile_graph, start_node, objetivos)
+        if resultado is not None and suavizar:
+            resultado = (smooth_path(tile_graph, resultado[0]), resultado[1])
+        return resultado
 
-    return mejor_camino, objetivo
+    algoritmo = (pathfind_nearest, smooth_path) if suavizar else pathfind_nearest
+    resultado = path_cache.find(tile_graph, start_node, tuple(objetivos), algoritmo, buscar)
+    if resultado is None:
+        return None, None
+    mejor_camino, nodo_objetivo = resultado
+    return mejor_camino, objetivos[nodo_objetivo]
 
 # Función para dibujar el camino
 def draw_path(screen, path, camera_x, camera_y, tile_size):
@@ -123,14 +148,15 @@ def draw_path(screen, path, camera_x, camera_y, tile_size):
     El tamaño de los nodos
     """
     if path:
-        # Se dibujan los nodos
-        for i in range(len(path)-1):
+        # Se dibujan los tramos, incluido el último (un camino suavizado puede tener uno solo), entre los centros
+        # de los tiles, que son los puntos que sigue el jugador
+        for i in range(len(path)):
             start = path[i].from_node
             end = path[i].to_node
             
-            start_pos = (start.x * tile_size - camera_x, 
-                        start.y * tile_size - camera_y)
-            end_pos = (end.x * tile_size - camera_x,
-                      end.y * tile_size - camera_y)
+            start_pos = ((start.x + 0.5) * tile_size - camera_x, 
+                        (start.y + 0.5) * tile_size - camera_y)
+            end_pos = ((end.x + 0.5) * tile_size - camera_x,
+                      (end.y + 0.5) * tile_size - camera_y)
             
             pygame.draw.line(screen, (255, 255, 0), start_pos, end_pos, 2)
\ No newline at end of file
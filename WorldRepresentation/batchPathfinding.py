@@ -0,0 +1,243 @@
+# @file batchPathfinding.py
+# @brief Resolución de muchas consultas de caminos sobre la grilla compilada, en procesos que la comparten por memoria compartida
+# @author Anya Marcano
+# @date 2026/10/18
+
+import heapq
+import math
+import os
+import sys
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Iterable, Optional, Tuple
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from tileGraph import TileGraph
+from gridGraph import GridGraph
+
+GRAPH_ARRAYS = ("walkable", "ys", "xs", "offsets", "targets", "costs", "index")
+# Lote mínimo que justifica un pool de procesos: iniciar el pool y compartir la grilla cuesta ~40 ms en Linux (fork),
+# unas diez consultas en un laberinto de 128², así que los lotes más chicos se resuelven en serie
+MIN_PARALLEL_PAIRS = 64
+
+_worker_solver: Optional["_ArraySolver"] = None  # Buscador de cada proceso sobre los arreglos compartidos
+_worker_memory: Optional[shared_memory.SharedMemory] = None
+
+
+class PathBatch:
+    """
+    Clase que guarda de forma compacta el resultado de pathfind_many: los caminos de todos los pares concatenados
+    en un único arreglo (total, 2) de tiles (x, y).
+    El camino del par i es tiles[offsets[i]:offsets[i + 1]], desde el tile de inicio hasta el objetivo, ambos
+    incluidos, y está vacío si el objetivo es inalcanzable.
+    Attributes:
+        offsets (np.ndarray): El comienzo del camino de cada par en tiles, más el total al final.
+        tiles (np.ndarray): Los tiles (x, y) de todos los caminos.
+        costs (np.ndarray): El costo total de cada camino (inf si el objetivo es inalcanzable).
+        Methods:
+            path(self, i: int) -> Optional[np.ndarray]: Devuelve los tiles del camino del par i, o None si no hay camino.
+            reachable(self) -> np.ndarray: Devuelve una máscara con los pares que tienen camino.
+    """
+    def __init__(self, offsets: np.ndarray, tiles: np.ndarray, costs: np.ndarray):
+        self.offsets = offsets
+        self.tiles = tiles
+        self.costs = costs
+
+    def __len__(self) -> int:
+        return len(self.costs)
+
+    def path(self, i: int) -> Optional[np.ndarray]:
+        if not math.isfinite(self.costs[i]):
+            return None
+        return self.tiles[self.offsets[i]:self.offsets[i + 1]]
+
+    def reachable(self) -> np.ndarray:
+        return np.isfinite(self.costs)
+
+
+class _ArraySolver:
+    # A* directamente sobre los arreglos CSR con índices enteros de tiles: no se crean objetos TileNode ni Connection.
+    # Con las etiquetas de componentes conexas ("labels") los pares en regiones distintas se descartan sin buscar
+    def __init__(self, arrays: dict, heuristic_weight: float, diagonal: bool):
+        self.width = arrays["walkable"].shape[1]
+        self.labels = memoryview(np.ascontiguousarray(arrays["labels"]).ravel()) if "labels" in arrays else None
+        self.index = memoryview(np.ascontiguousarray(arrays["index"]))
+        self.xs = memoryview(np.ascontiguousarray(arrays["xs"]))
+        self.ys = memoryview(np.ascontiguousarray(arrays["ys"]))
+        self.offsets = memoryview(np.ascontiguousarray(arrays["offsets"]))
+        self.targets = memoryview(np.ascontiguousarray(arrays["targets"]))
+        self.costs = memoryview(np.ascontiguousarray(arrays["costs"]))
+        self.heuristic_weight = heuristic_weight
+        self.diagonal = diagonal
+
+    def solve(self, pairs: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        lengths, tiles, costs = [], [], []
+        for sx, sy, gx, gy in pairs.tolist():
+            path, cost = self.astar(sx, sy, gx, gy)
+            lengths.append(len(path))
+            tiles.extend(path)
+            costs.append(cost)
+        return (np.array(lengths, dtype=np.int64), np.array(tiles, dtype=np.int32).reshape(-1, 2),
+                np.array(costs, dtype=np.float64))
+
+    def astar(self, sx: int, sy: int, gx: int, gy: int) -> Tuple[list, float]:
+        source, goal = self.tile_index(sx, sy), self.tile_index(gx, gy)
+        if source < 0 or goal < 0:
+            return [], math.inf
+        if self.labels is not None and self.labels[sy * self.width + sx] != self.labels[gy * self.width + gx]:
+            return [], math.inf
+        xs, ys, offsets, targets, costs = self.xs, self.ys, self.offsets, self.targets, self.costs
+        weight, diagonal, extra = self.heuristic_weight, self.diagonal, math.sqrt(2) - 1
+        cost_so_far = {source: 0.0}
+        parents = {source: -1}
+        open_heap = [(0.0, 0.0, source)]
+        while open_heap:
+            _, cost, current = heapq.heappop(open_heap)
+            if current == goal:
+                break
+            if cost > cost_so_far[current]:
+                continue
+            for k in range(offsets[current], offsets[current + 1]):
+                end = targets[k]
+                end_cost = cost + costs[k]
+                if end_cost < cost_so_far.get(end, math.inf):
+                    cost_so_far[end] = end_cost
+                    parents[end] = current
+                    dx, dy = abs(xs[end] - gx), abs(ys[end] - gy)
+                    estimate = max(dx, dy) + extra * min(dx, dy) if diagonal else dx + dy
+                    heapq.heappush(open_heap, (end_cost + weight * estimate, end_cost, end))
+        if goal not in parents:
+            return [], math.inf
+        path = []
+        node = goal
+        while node != -1:
+            path.append((xs[node], ys[node]))
+            node = parents[node]
+        path.reverse()
+        return path, cost_so_far[goal]
+
+    def tile_index(self, x: int, y: int) -> int:
+        if 0 <= x < self.width and 0 <= y < len(self.index) // self.width:
+            return self.index[y * self.width + x]
+        return -1
+
+
+def heuristic_weight(arrays: dict, diagonal: bool) -> float:
+    """
+    Calcula la escala que mantiene admisible la estimación Manhattan u octil cuando algunas conexiones cuestan
+    menos que un paso simple (1 para movimientos ortogonales y √2 para los diagonales).
+    Args:
+        arrays (dict): Los arreglos de la grilla compilada (GRAPH_ARRAYS).
+        diagonal (bool): Si la grilla tiene movimiento en 8 direcciones.
+    Returns:
+        float: El factor por el que se multiplica la estimación, como máximo 1.
+    """
+    if len(arrays["costs"]) == 0:
+        return 1.0
+    sources = np.repeat(np.arange(len(arrays["xs"])), np.diff(arrays["offsets"]))
+    is_diagonal = (arrays["xs"][sources] != arrays["xs"][arrays["targets"]]) & \
+                  (arrays["ys"][sources] != arrays["ys"][arrays["targets"]])
+    unit_costs = np.where(is_diagonal, arrays["costs"] / math.sqrt(2), arrays["costs"])
+    return float(min(1.0, unit_costs.min()))
+
+
+def share_arrays(arrays: dict) -> Tuple[shared_memory.SharedMemory, list]:
+    """
+    Empaqueta los arreglos de la grilla en un bloque de memoria compartida nuevo; con el layout, los procesos
+    reconstruyen vistas sin copiar (attach_arrays). Quien crea el bloque debe cerrarlo y liberarlo (unlink).
+    Args:
+        arrays (dict): Los arreglos a compartir por nombre, como los de la grilla compilada (GRAPH_ARRAYS).
+    Returns:
+        Tuple[shared_memory.SharedMemory, list]: El bloque y el layout (nombre, dtype, forma, offset) de cada arreglo.
+    """
+    layout, size = [], 0
+    for name in arrays:
+        array = np.ascontiguousarray(arrays[name])
+        size = -(-size // 8) * 8  # Cada arreglo alineado a 8 bytes
+        layout.append((name, array.dtype.str, array.shape, size))
+        size += array.nbytes
+    memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for name, dtype, shape, offset in layout:
+        view = np.ndarray(shape, dtype=dtype, buffer=memory.buf, offset=offset)
+        view[...] = arrays[name]
+    return memory, layout
+
+
+def attach_arrays(memory: shared_memory.SharedMemory, layout: list) -> dict:
+    """
+    Crea vistas de solo lectura de los arreglos guardados con share_arrays en un bloque de memoria compartida.
+    Args:
+        memory (shared_memory.SharedMemory): El bloque abierto.
+        layout (list): El layout que devolvió share_arrays.
+    Returns:
+        dict: Los arreglos por nombre, que dependen del bloque mientras estén vivos.
+    """
+    arrays = {}
+    for name, dtype, shape, offset in layout:
+        arrays[name] = np.ndarray(shape, dtype=dtype, buffer=memory.buf, offset=offset)
+        arrays[name].flags.writeable = False
+    return arrays
+
+
+def _init_worker(memory_name: str, layout: list, weight: float, diagonal: bool):
+    global _worker_solver, _worker_memory
+    # Los procesos del pool comparten el resource tracker del padre, así que abrir el bloque no lo adueña:
+    # el padre lo libera cuando todos terminan
+    _worker_memory = shared_memory.SharedMemory(name=memory_name)
+    _worker_solver = _ArraySolver(attach_arrays(_worker_memory, layout), weight, diagonal)
+
+
+def _solve_in_worker(pairs: np.ndarray):
+    return _worker_solver.solve(pairs)
+
+
+def pathfind_many(graph: TileGraph, pairs: Iterable[Tuple[int, int, int, int]], workers: Optional[int] = None,
+                  chunk_size: Optional[int] = None) -> PathBatch:
+    """
+    Resuelve muchas consultas (inicio_x, inicio_y, objetivo_x, objetivo_y) sobre el mismo mapa. La grilla compilada
+    se escribe una vez en memoria compartida y cada proceso la mapea, así que solo se serializan los pares y los
+    resultados compactos.
+    workers se limita a os.cpu_count(): más procesos que núcleos solo agregan costo de inicio y serialización.
+    Los pares cuyo inicio y objetivo están en componentes conexas distintas se responden sin buscar.
+    Con un solo proceso útil o menos de MIN_PARALLEL_PAIRS pares todo corre en el proceso que llama. La ganancia
+    del camino paralelo solo se midió en una máquina de un núcleo, donde siempre se resuelve en serie; en varios
+    núcleos el script que llama debe estar protegido con if __name__ == "__main__" en plataformas con spawn.
+    Args:
+        graph (TileGraph): El grafo de tiles (o un GridGraph ya compilado).
+        pairs (Iterable[Tuple[int, int, int, int]]): Las consultas, como tuplas o un arreglo (n, 4).
+        workers (Optional[int]): La cantidad de procesos; por defecto, la cantidad de núcleos.
+        chunk_size (Optional[int]): Los pares que se envían juntos a un proceso.
+    Returns:
+        PathBatch: Los caminos y costos de todas las consultas, en el orden de pairs.
+    """
+    snapshot = graph if isinstance(graph, GridGraph) else GridGraph.from_graph(graph)
+    arrays = {name: getattr(snapshot, name) for name in GRAPH_ARRAYS}
+    weight = heuristic_weight(arrays, snapshot.diagonal)
+    # Las etiquetas del grafo original (que un TileGraph mantiene al editarse), copiadas para que no cambien mientras
+    # se resuelve el lote; con ellas los objetivos inalcanzables se descartan en O(1), igual que en get_path
+    arrays["labels"] = np.array(graph.component_labels(), dtype=np.int32)
+    pairs = np.asarray(list(pairs) if not isinstance(pairs, np.ndarray) else pairs, dtype=np.int64).reshape(-1, 4)
+    cpus = os.cpu_count() or 1
+    workers = min(workers or cpus, cpus)
+    chunk_size = chunk_size or max(1, -(-len(pairs) // (workers * 4)))
+
+    if workers <= 1 or len(pairs) < MIN_PARALLEL_PAIRS or len(pairs) <= chunk_size:
+        results = [_ArraySolver(arrays, weight, snapshot.diagonal).solve(pairs)]
+    else:
+        memory, layout = share_arrays(arrays)
+        try:
+            with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                     initargs=(memory.name, layout, weight, snapshot.diagonal)) as executor:
+                chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+                results = list(executor.map(_solve_in_worker, chunks))
+        finally:
+            memory.close()
+            memory.unlink()
+
+    lengths = np.concatenate([result[0] for result in results]) if results else np.zeros(0, dtype=np.int64)
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    tiles = np.concatenate([result[1] for result in results]) if results else np.zeros((0, 2), dtype=np.int32)
+    costs = np.concatenate([result[2] for result in results]) if results else np.zeros(0)
+    return PathBatch(offsets, tiles, costs)
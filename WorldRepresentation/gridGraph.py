@@ -0,0 +1,268 @@
+# @file gridGraph.py
+# @brief Variante compacta y de solo lectura del grafo de tiles respaldada por arreglos (máscara caminable y adyacencia CSR)
+# @author Anya Marcano
+# @date 2026/10/18
+
+import numpy as np
+import sys
+import os
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Optional
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from tileGraph import TileGraph, WALL_THRESHOLD, DIAGONAL_COST, build_adjacency
+from graph import Graph
+from nodes import TileNode
+from connection import Connection
+
+TILE_CACHE_SIZE = 65536  # Tiles cuyos nodos y listas de conexiones se conservan (los usados más recientemente); 0 no conserva ninguno
+
+class GridNodeView(Mapping):
+    """
+    Clase que expone los tiles caminables de un GridGraph como un mapeo de solo lectura (x, y) -> TileNode.
+    Los nodos se crean a partir de los arreglos la primera vez que se consultan y se conservan en la caché del grafo.
+    Attributes:
+        graph (GridGraph): El grafo cuyos tiles se exponen.
+    """
+    def __init__(self, graph: "GridGraph"):
+        self.graph = graph
+
+    def __getitem__(self, key) -> TileNode:
+        try:
+            x, y = int(key[0]), int(key[1])
+        except (TypeError, ValueError, IndexError):
+            raise KeyError(key)
+        i = self.graph.tile_index(x, y)
+        if i < 0:
+            raise KeyError(key)
+        return self.graph.node_at(i)
+
+    def __iter__(self):
+        for x, y in zip(self.graph.xs.tolist(), self.graph.ys.tolist()):
+            yield (x, y)
+
+    def __len__(self) -> int:
+        return len(self.graph.xs)
+
+
+class GridConnectionView(Mapping):
+    """
+    Clase que expone las conexiones de un GridGraph como un mapeo de solo lectura nodo -> [Connection], con la
+    misma forma que Graph.connections.
+    Attributes:
+        graph (GridGraph): El grafo cuyas conexiones se exponen.
+    """
+    def __init__(self, graph: "GridGraph"):
+        self.graph = graph
+
+    def __getitem__(self, node) -> list:
+        connections = self.graph.get_connections(node)
+        if not connections:
+            raise KeyError(node)
+        return connections
+
+    def __iter__(self):
+        offsets = self.graph.offsets
+        has_edges = (offsets[1:] != offsets[:-1]).tolist()
+        for (x, y), is_connected in zip(zip(self.graph.xs.tolist(), self.graph.ys.tolist()), has_edges):
+            if is_connected:
+                yield self.graph.get_node(x, y)
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.graph.offsets[1:] != self.graph.offsets[:-1]))
+
+
+class GridGraph(TileGraph):
+    """
+    Clase que representa un TileGraph respaldado por arreglos: la máscara de tiles caminables y la adyacencia CSR
+    viven en arreglos planos con tipo, y los objetos TileNode y Connection de un tile se crean al consultarlo con
+    get_connections o con las vistas. Los nodos y las listas de conexiones de los últimos cache_size tiles
+    consultados se reutilizan (igual que las listas de un TileGraph, no se deben modificar; devolver el mismo nodo
+    hace que las búsquedas lo encuentren por identidad en sus diccionarios) y los demás se descartan, así que
+    recorrer un mapa grande no deja el grafo de objetos completo en memoria.
+    El grafo es de solo lectura: add_connection y la API de edición lanzan TypeError.
+    Attributes:
+        walkable (np.ndarray): La máscara (alto, ancho) de tiles caminables.
+        ys, xs (np.ndarray): Las coordenadas de cada tile caminable, en orden de filas.
+        offsets (np.ndarray): El comienzo de las conexiones de cada tile en targets y costs.
+        targets (np.ndarray): El índice del tile de destino de cada conexión.
+        costs (np.ndarray): El costo de cada conexión.
+        index (np.ndarray): El índice de cada tile del mapa en los arreglos CSR, -1 para las paredes.
+        cache_size (int): La cantidad de tiles cuyos nodos y listas de conexiones salientes y entrantes se conservan.
+        Methods:
+            from_arrays(cls, walkable, ys, xs, offsets, targets, ...) -> GridGraph: Crea el grafo desde arreglos ya compilados.
+            from_graph(cls, graph: TileGraph) -> GridGraph: Crea una copia de solo lectura de un TileGraph.
+            tile_index(self, x: int, y: int) -> int: Devuelve el índice CSR de un tile.
+            node_at(self, i: int) -> TileNode: Devuelve el nodo del tile con índice CSR i.
+            reverse_edges(self) -> np.ndarray: Devuelve el índice de la conexión inversa de cada conexión.
+            nbytes(self) -> int: Devuelve la memoria ocupada por los arreglos.
+    """
+    cache_size = TILE_CACHE_SIZE
+
+    def create_graph_from_walkable(self, walkable: np.ndarray, tile_costs: Optional[np.ndarray] = None):
+        self.tile_costs = np.ones(walkable.shape) if tile_costs is None else np.array(tile_costs, dtype=np.float64)
+        self.set_arrays(walkable, *build_adjacency(walkable, self.diagonal, tile_costs))
+
+    @classmethod
+    def from_arrays(cls, walkable: np.ndarray, ys: np.ndarray, xs: np.ndarray, offsets: np.ndarray, targets: np.ndarray,
+                    costs: Optional[np.ndarray] = None, index: Optional[np.ndarray] = None,
+                    tile_size: int = 32, wall_threshold: int = WALL_THRESHOLD, diagonal: bool = False,
+                    tile_costs: Optional[np.ndarray] = None) -> "GridGraph":
+        # Crea el grafo desde arreglos ya compilados (por ejemplo, mapeados desde la caché de navegación) sin
+        # superficie. diagonal y tile_costs solo registran cómo se construyeron los arreglos (por ejemplo, para
+        # reconstruir un TileGraph editable con TileGraph.from_walkable); la adyacencia y sus costos salen de los arreglos
+        graph = cls.__new__(cls)
+        Graph.__init__(graph)
+        graph.tile_size = tile_size
+        graph.maze_surface = None
+        graph.wall_threshold = wall_threshold
+        graph.diagonal = diagonal
+        graph.terrain_bands = ()
+        graph.tile_costs = np.ones(walkable.shape) if tile_costs is None else tile_costs
+        graph._init_edits()
+        graph.set_arrays(walkable, ys, xs, offsets, targets, costs, index)
+        return graph
+
+    @classmethod
+    def from_graph(cls, graph: TileGraph) -> "GridGraph":
+        # Copia de solo lectura de un TileGraph, con sus ediciones y costos de conexión propios, en la que se puede
+        # buscar desde otros hilos o que se puede enviar a otros procesos mientras el original sigue cambiando
+        walkable = np.array(graph.walkable, dtype=bool)
+        height, width = walkable.shape
+        ys, xs = np.nonzero(walkable)
+        index = np.full(height * width, -1, dtype=np.int32)
+        index[ys * width + xs] = np.arange(len(ys), dtype=np.int32)
+        offsets, targets, costs = [0], [], []
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            for connection in graph.get_connections(graph.get_node(x, y)):
+                targets.append(index[connection.to_node.y * width + connection.to_node.x])
+                costs.append(connection.get_cost())
+            offsets.append(len(targets))
+        return cls.from_arrays(walkable, ys, xs, np.array(offsets), np.array(targets, dtype=np.int32), np.array(costs),
+                               index, tile_size=graph.tile_size, wall_threshold=graph.wall_threshold,
+                               diagonal=graph.diagonal, tile_costs=np.array(graph.tile_costs))
+
+    def set_arrays(self, walkable: np.ndarray, ys: np.ndarray, xs: np.ndarray, offsets: np.ndarray,
+                   targets: np.ndarray, costs: Optional[np.ndarray] = None, index: Optional[np.ndarray] = None):
+        self.walkable = walkable
+        self.height, self.width = walkable.shape
+        self.ys = ys.astype(np.int32, copy=False)
+        self.xs = xs.astype(np.int32, copy=False)
+        self.offsets = offsets.astype(np.int32, copy=False)
+        self.targets = targets.astype(np.int32, copy=False)
+        self.costs = np.ones(len(targets), dtype=np.float64) if costs is None else costs.astype(np.float64, copy=False)
+
+        # Tabla plana tile -> índice caminable, -1 para las paredes
+        if index is None:
+            index = np.full(self.height * self.width, -1, dtype=np.int32)
+            index[self.ys.astype(np.int64) * self.width + self.xs] = np.arange(len(self.xs), dtype=np.int32)
+        self.index = index.astype(np.int32, copy=False)
+
+        # Indexar memoryviews devuelve escalares de Python, mucho más barato que acceder a escalares de numpy
+        self._index = memoryview(self.index)
+        self._xs = memoryview(self.xs)
+        self._ys = memoryview(self.ys)
+        self._offsets = memoryview(self.offsets)
+        self._targets = memoryview(self.targets)
+        self._costs = memoryview(self.costs)
+        self._reverse = None
+        self._uniform = None
+
+        # Cachés LRU índice CSR -> nodo y -> lista de conexiones, limitadas a cache_size tiles
+        self._tile_nodes = OrderedDict()
+        self._outgoing = OrderedDict()
+        self._incoming_lists = OrderedDict()
+
+        self.nodes = GridNodeView(self)
+        self.connections = GridConnectionView(self)
+
+    def tile_index(self, x: int, y: int) -> int:
+        # Índice de un tile caminable en los arreglos CSR, -1 para las paredes y los tiles fuera del mapa
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self._index[int(y) * self.width + int(x)]
+        return -1
+
+    def node_at(self, i: int) -> TileNode:
+        # Nodo del tile caminable con índice CSR i
+        node = self._tile_nodes.get(i)
+        if node is None:
+            node = TileNode(self._xs[i], self._ys[i])
+            self._remember(self._tile_nodes, i, node)
+        else:
+            self._tile_nodes.move_to_end(i)
+        return node
+
+    def add_connection(self, from_node, to_node, cost: float):
+        raise TypeError("GridGraph is read-only")
+
+    def block_tile(self, x: int, y: int):
+        raise TypeError("GridGraph is read-only, edit a TileGraph instead")
+
+    def unblock_tile(self, x: int, y: int):
+        raise TypeError("GridGraph is read-only, edit a TileGraph instead")
+
+    def set_edge_cost(self, from_node, to_node, cost: float):
+        raise TypeError("GridGraph is read-only, edit a TileGraph instead")
+
+    def get_connections(self, from_node) -> list[Connection]:
+        if not isinstance(from_node, TileNode):
+            return []
+        i = self.tile_index(from_node.x, from_node.y)
+        if i < 0:
+            return []
+        connections = self._outgoing.get(i)
+        if connections is None:
+            node, node_at, targets, costs = self.node_at(i), self.node_at, self._targets, self._costs
+            connections = [Connection(node, node_at(targets[k]), costs[k]) for k in range(self._offsets[i], self._offsets[i + 1])]
+            self._remember(self._outgoing, i, connections)
+        else:
+            self._outgoing.move_to_end(i)
+        return connections
+
+    def get_incoming_connections(self, to_node) -> list[Connection]:
+        # La adyacencia de la grilla es simétrica: la conexión que llega a to_node desde un vecino es la inversa de
+        # la que va de to_node a ese vecino, que se busca en una tabla de conexiones inversas creada en el primer uso
+        if not isinstance(to_node, TileNode):
+            return []
+        i = self.tile_index(to_node.x, to_node.y)
+        if i < 0:
+            return []
+        incoming = self._incoming_lists.get(i)
+        if incoming is None:
+            if self._reverse is None:
+                self._reverse = memoryview(self.reverse_edges())
+            node, node_at, targets, costs, reverse = self.node_at(i), self.node_at, self._targets, self._costs, self._reverse
+            incoming = [Connection(node_at(targets[k]), node, costs[reverse[k]])
+                        for k in range(self._offsets[i], self._offsets[i + 1])]
+            self._remember(self._incoming_lists, i, incoming)
+        else:
+            self._incoming_lists.move_to_end(i)
+        return incoming
+
+    def _remember(self, cache: OrderedDict, i: int, value):
+        # Guarda el nodo o la lista de un tile y descarta la del tile usado hace más tiempo si se supera cache_size
+        if self.cache_size > 0:
+            cache[i] = value
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+    def reverse_edges(self) -> np.ndarray:
+        # Para cada conexión k (u -> v), el índice de la conexión v -> u
+        sources = np.repeat(np.arange(len(self.xs), dtype=np.int64), np.diff(self.offsets))
+        edge_keys = sources * len(self.xs) + self.targets
+        reverse_keys = self.targets.astype(np.int64) * len(self.xs) + sources
+        order = np.argsort(edge_keys, kind="stable")
+        return order[np.searchsorted(edge_keys[order], reverse_keys)].astype(np.int32)
+
+    def has_uniform_costs(self) -> bool:
+        # La capa de terreno y los costos propios ya están en el arreglo de costos: compararlo con las longitudes de los pasos
+        if self._uniform is None:
+            sources = np.repeat(np.arange(len(self.xs)), np.diff(self.offsets))
+            is_diagonal = (self.xs[sources] != self.xs[self.targets]) & (self.ys[sources] != self.ys[self.targets])
+            self._uniform = bool(np.allclose(self.costs, np.where(is_diagonal, DIAGONAL_COST, 1.0), rtol=0, atol=1e-12))
+        return self._uniform
+
+    def nbytes(self) -> int:
+        # Memoria ocupada por los arreglos del grafo
+        return sum(a.nbytes for a in (self.walkable, self.ys, self.xs, self.offsets, self.targets, self.costs, self.index))
@@ -5,6 +5,9 @@
 
 import pygame, sys, math
 from tileGraph import *
+from navigationCache import load_navigation_grid
+from flowField import FlowField
+from pathPlanner import PathPlanner
 from Movements.dynamicArriveDecision import *
 from Movements.dynamicFleeDecision import *
 from pygame.locals import *
@@ -19,7 +22,8 @@ pygame.display.set_caption("🌸🌸🌸🌸🌸🌸🌸🌸🌸🌸🌸🌸🌸
 # Configuración de la pantalla
 screen_width, screen_height = 1270, 700
 SCREEN = pygame.display.set_mode((screen_width,screen_height))
-background = pygame.image.load(".\Assets\disenoFondo.png").convert()
+BACKGROUND_PATH = ".\Assets\disenoFondo.png"
+background = pygame.image.load(BACKGROUND_PATH).convert()
 
 # Configuración del zoom en el mapa
 ZOOM = 3
@@ -31,8 +35,17 @@ scaled_maze = pygame.transform.scale(
 SCREEN.blit(background, (0,0))
 
 # Configuracion para el World Representation (Tile Graph)
+# El grafo compilado se guarda en disco y se reutiliza mientras no cambien la imagen, ZOOM o tile_size.
+# La grilla en caché es de solo lectura: el juego usa un TileGraph editable construido a partir de ella, para poder
+# abrir y cerrar tiles (puertas, trampas) con block_tile/unblock_tile y avisar a los listeners
 tile_size = 66
-tile_graph = TileGraph(scaled_maze, tile_size)
+diagonal_movement = False  # True para conectar también los tiles en diagonal (costo √2, sin cortar esquinas)
+# Capa de terreno: (nombre, color RGB mínimo, color RGB máximo, costo >= 1) según el color del centro de cada tile,
+# p. ej. ("barro", (90, 60, 20), (150, 110, 70), 3.0), ("pasto", (40, 120, 30), (110, 200, 90), 1.5)
+terrain_bands = ()
+navigation_grid = load_navigation_grid(BACKGROUND_PATH, ZOOM, tile_size, diagonal=diagonal_movement, terrain_bands=terrain_bands)
+tile_graph = TileGraph.from_walkable(navigation_grid.walkable, tile_size, diagonal=diagonal_movement,
+                                     tile_costs=navigation_grid.tile_costs)
 maze_mask = pygame.mask.from_surface(scaled_maze)
 show_path = False
 
@@ -173,6 +186,14 @@ BOOK_OF_CLOW_POSITION = {"x": 1000, "y": 1000}
 # PATHFINDING-------------------------------------------------------------------------------------------------------------------------
 # Variables para Pathfinding
 current_path = None
+# Campo de flujo hacia el tile del jugador, compartido por todos los NPC que lo persiguen.
+# Solo se recalcula cuando el jugador cambia de tile.
+player_flow_field = FlowField(tile_graph)
+# Las búsquedas con A* corren en un hilo de fondo y sus resultados se reciben una vez por frame. Se usan hilos y
+# no procesos porque este script no está protegido con if __name__ == "__main__" (los procesos iniciados con
+# spawn lo volverían a ejecutar); el hilo no acorta la búsqueda, solo la saca del frame, y los pedidos repetidos
+# de Yue mientras su búsqueda sigue en curso reciben el mismo future en lugar de encolar otra búsqueda
+path_planner = PathPlanner(tile_graph, workers=1, use_processes=False)
 target_exp = None
 current_sprite = PLAYER_sakura
 
@@ -212,9 +233,13 @@ while True:
     clock.tick(60)
     for event in pygame.event.get():
         if event.type == QUIT:
+            path_planner.shutdown(wait=False)
             pygame.quit()
             sys.exit()
     
+    # Punto seguro del frame para recibir los caminos calculados en segundo plano
+    planned_paths = path_planner.poll()
+    
     # Movimiento del jugador
     keys = pygame.key.get_pressed()
     new_x = PLAYER_x
@@ -254,12 +279,14 @@ while True:
     #  Barra espaciadora
     elif keys[pygame.K_SPACE]:
         show_path = True
-        current_path, target_exp = encontrar_NPC_cercano(PLAYER_x, PLAYER_y, NPC_positions, tile_graph, tile_size)
+        # El camino se suaviza por línea de visión: el jugador sigue pocos tramos rectos en vez de cada tile
+        current_path, target_exp = encontrar_NPC_cercano(PLAYER_x, PLAYER_y, NPC_positions, tile_graph, tile_size, suavizar=True)
         # Si se utilizó path finding
         if current_path:
+            # Se apunta al centro del tile, que es desde donde se comprobó la línea de visión al suavizar
             next_node = current_path[0].to_node
-            target_x = next_node.x * tile_size
-            target_y = next_node.y * tile_size
+            target_x = (next_node.x + 0.5) * tile_size
+            target_y = (next_node.y + 0.5) * tile_size
             
             # Se calcula la dirección de movimiento
             dx = target_x - PLAYER_x
@@ -494,15 +521,16 @@ while True:
                                 NPC["y"] += tile_size if NPC["y"] % tile_size == 0 else -tile_size
                                 yue_stuck_counter = 0  # Resetear el contador después de la lógica de escape
                             else:
-                                # Usar pathfinding para encontrar una ruta alrededor del obstáculo
-                                start = TileNode(NPC["x"] // tile_size, NPC["y"] // tile_size)
-                                goal = TileNode(PLAYER_x // tile_size, PLAYER_y // tile_size)
-                                heuristic = ManhattanHeuristic(goal)
-                                yue_path = pathfind_astar(tile_graph, start, goal, heuristic)
-                                if yue_path:
-                                    next_step = yue_path[0].to_node
-                                    NPC["x"] = next_step.x * tile_size
-                                    NPC["y"] = next_step.y * tile_size
+                                # Usar el campo de flujo hacia el jugador para rodear el obstáculo
+                                start = tile_graph.get_node(int(NPC["x"] // tile_size), int(NPC["y"] // tile_size))
+                                goal = tile_graph.get_node(int(PLAYER_x // tile_size), int(PLAYER_y // tile_size))
+                                if start and goal:
+                                    player_flow_field.update(goal)
+                                    next_connection = player_flow_field.next_step(start)
+                                    if next_connection:
+                                        next_step = next_connection.to_node
+                                        NPC["x"] = next_step.x * tile_size
+                                        NPC["y"] = next_step.y * tile_size
                     # else:
                     #     print("Yue se encuentra en el borde del grafo, recalculando el camino")
                     #     # Usar pathfinding para encontrar una ruta alrededor del obstáculo
@@ -539,15 +567,22 @@ while True:
                                 NPC["y"] += tile_size if NPC["y"] % tile_size == 0 else -tile_size
                                 yue_stuck_counter = 0  # Resetear el contador después de la lógica de escape
                             else:
-                                # Usar pathfinding para encontrar una ruta alrededor del obstáculo
-                                start = TileNode(NPC["x"] // tile_size, NPC["y"] // tile_size)
-                                goal = TileNode(NPC_YUE_ORIGINAL_POSITION["x"] // tile_size, NPC_YUE_ORIGINAL_POSITION["y"] // tile_size)
-                                heuristic = ManhattanHeuristic(goal)
-                                yue_path = pathfind_astar(tile_graph, start, goal, heuristic)
-                                if yue_path:
-                                    next_step = yue_path[0].to_node
-                                    NPC["x"] = next_step.x * tile_size
-                                    NPC["y"] = next_step.y * tile_size
+                                # Usar pathfinding para encontrar una ruta alrededor del obstáculo. La búsqueda se pide
+                                # al planificador y se usa el camino que llegó en este frame (pedido en uno anterior)
+                                start = tile_graph.get_node(int(NPC["x"] // tile_size), int(NPC["y"] // tile_size))
+                                goal = tile_graph.get_node(NPC_YUE_ORIGINAL_POSITION["x"] // tile_size, NPC_YUE_ORIGINAL_POSITION["y"] // tile_size)
+                                if start and goal and not tile_graph.is_reachable(start, goal):
+                                    # La posición original quedó aislada: ir al tile alcanzable más cercano a ella
+                                    goal = tile_graph.closest_reachable(start, goal.x, goal.y)
+                                if start and goal:
+                                    path_planner.request("Yue", start, goal)
+                                yue_path = planned_paths.get("Yue")
+                                if yue_path and start:
+                                    # Seguir el camino desde el tile en el que Yue está ahora
+                                    next_step = next((connection.to_node for connection in yue_path if connection.from_node == start), None)
+                                    if next_step:
+                                        NPC["x"] = next_step.x * tile_size
+                                        NPC["y"] = next_step.y * tile_size
 
         # DIBUJAR EL RADIO DE DETECCIÓN DE YUE---------------------------------------------------------------------------------------------------------------------
         for NPC in NPC_positions:
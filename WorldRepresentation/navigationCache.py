@@ -0,0 +1,139 @@
+# @file navigationCache.py
+# @brief Caché en disco del grafo de tiles compilado y de su capa de terreno, indexada por la imagen de fondo y los parámetros
+# @author Anya Marcano
+# @date 2026/10/18
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import numpy as np
+import pygame
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from tileGraph import WALL_THRESHOLD, DEFAULT_TERRAIN_BANDS, sample_walkable_grid, build_cost_layer, build_adjacency
+from gridGraph import GridGraph
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".navcache")
+CACHE_FORMAT = 2  # Se incrementa cuando cambia el formato de los arreglos compilados
+ARRAY_NAMES = ("walkable", "ys", "xs", "offsets", "targets", "costs", "index")
+CACHE_ARRAYS = ARRAY_NAMES + ("tile_costs",)  # La capa de terreno se guarda para reconstruir un TileGraph editable
+
+
+def navigation_cache_key(image_path: str, zoom: float, tile_size: int, wall_threshold: int = WALL_THRESHOLD,
+                         diagonal: bool = False, terrain_bands=DEFAULT_TERRAIN_BANDS) -> str:
+    """
+    Calcula la clave de la caché: la grilla compilada solo depende del contenido de la imagen y de los parámetros
+    de construcción, capa de terreno incluida.
+    Args:
+        image_path (str): La ruta de la imagen de fondo.
+        zoom (float): La escala con la que se dibuja el fondo.
+        tile_size (int): El tamaño de los tiles en píxeles.
+        wall_threshold (int): El umbral del canal rojo a partir del cual un tile es pared.
+        diagonal (bool): Si el grafo tiene movimiento en 8 direcciones.
+        terrain_bands: Las bandas de color de la capa de terreno.
+    Returns:
+        str: El hash SHA-256 en hexadecimal.
+    """
+    digest = hashlib.sha256()
+    with open(image_path, "rb") as image_file:
+        for chunk in iter(lambda: image_file.read(1 << 20), b""):
+            digest.update(chunk)
+    digest.update(f"|zoom={zoom}|tile_size={tile_size}|wall_threshold={wall_threshold}|diagonal={diagonal}"
+                  f"|terrain={json.dumps(terrain_bands_metadata(terrain_bands))}|format={CACHE_FORMAT}".encode())
+    return digest.hexdigest()
+
+
+def terrain_bands_metadata(terrain_bands) -> list:
+    # Forma JSON canónica de las bandas de terreno (tuplas y listas con los mismos valores dan la misma clave)
+    return [[name, [int(c) for c in low], [int(c) for c in high], float(cost)]
+            for name, low, high, cost in terrain_bands]
+
+
+def compile_navigation_grid(image_path: str, zoom: float, tile_size: int, wall_threshold: int = WALL_THRESHOLD,
+                            diagonal: bool = False, terrain_bands=DEFAULT_TERRAIN_BANDS) -> dict:
+    """
+    Carga y escala el fondo igual que main.py y compila los arreglos de la grilla. No necesita pantalla, así que
+    también corre en máquinas sin display.
+    Args:
+        image_path (str): La ruta de la imagen de fondo.
+        zoom (float): La escala con la que se dibuja el fondo.
+        tile_size (int): El tamaño de los tiles en píxeles.
+        wall_threshold (int): El umbral del canal rojo a partir del cual un tile es pared.
+        diagonal (bool): Si el grafo tiene movimiento en 8 direcciones.
+        terrain_bands: Las bandas de color de la capa de terreno.
+    Returns:
+        dict: Los arreglos CACHE_ARRAYS por nombre.
+    """
+    background = pygame.image.load(image_path)
+    scaled_maze = pygame.transform.scale(
+        background,
+        (int(background.get_width() * zoom),
+         int(background.get_height() * zoom))
+    )
+    walkable = sample_walkable_grid(scaled_maze, tile_size, wall_threshold)
+    tile_costs = build_cost_layer(scaled_maze, tile_size, terrain_bands)
+    graph = GridGraph.from_arrays(walkable, *build_adjacency(walkable, diagonal, tile_costs), tile_size=tile_size,
+                                  wall_threshold=wall_threshold, diagonal=diagonal, tile_costs=tile_costs)
+    return {name: getattr(graph, name) for name in CACHE_ARRAYS}
+
+
+def save_navigation_grid(directory: str, arrays: dict, metadata: dict, names: tuple = CACHE_ARRAYS):
+    """
+    Guarda los arreglos de una entrada de la caché. Se escriben primero en un directorio temporal que luego se
+    renombra, así que una construcción interrumpida nunca deja una entrada a medias.
+    Args:
+        directory (str): El directorio de la entrada.
+        arrays (dict): Los arreglos por nombre.
+        metadata (dict): Los datos que se guardan en meta.json.
+        names (tuple): Los arreglos que se guardan; otras tablas precalculadas (como pathDatabase) lo usan para
+                       guardar sus propios arreglos con el mismo formato.
+    """
+    parent = os.path.dirname(directory)
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix=".tmp-", dir=parent)
+    try:
+        for name in names:
+            np.save(os.path.join(staging, f"{name}.npy"), np.ascontiguousarray(arrays[name]))
+        with open(os.path.join(staging, "meta.json"), "w") as meta_file:
+            json.dump(metadata, meta_file)
+        os.replace(staging, directory)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+        if not os.path.isdir(directory):  # Otro proceso pudo haber creado la misma entrada primero
+            raise
+
+
+def load_navigation_grid(image_path: str, zoom: float, tile_size: int, wall_threshold: int = WALL_THRESHOLD,
+                         cache_dir: str = CACHE_DIR, diagonal: bool = False,
+                         terrain_bands=DEFAULT_TERRAIN_BANDS) -> GridGraph:
+    """
+    Devuelve el GridGraph de un fondo, compilándolo y guardándolo en la caché la primera vez. Las ejecuciones
+    siguientes mapean en memoria los arreglos guardados (sin copias; las páginas se leen al primer acceso).
+    La capa de terreno ya está incluida en los costos de las conexiones y además se conserva en graph.tile_costs.
+    El GridGraph es de solo lectura; para un grafo con la API de edición (puertas, trampas, listeners de HPA*)
+    se construye TileGraph.from_walkable(grid.walkable, ..., tile_costs=grid.tile_costs) a partir de él, como
+    hace main.py.
+    Args:
+        image_path (str): La ruta de la imagen de fondo.
+        zoom (float): La escala con la que se dibuja el fondo.
+        tile_size (int): El tamaño de los tiles en píxeles.
+        wall_threshold (int): El umbral del canal rojo a partir del cual un tile es pared.
+        cache_dir (str): El directorio de la caché.
+        diagonal (bool): Si el grafo tiene movimiento en 8 direcciones.
+        terrain_bands: Las bandas de color de la capa de terreno.
+    Returns:
+        GridGraph: El grafo compilado, de solo lectura.
+    """
+    key = navigation_cache_key(image_path, zoom, tile_size, wall_threshold, diagonal, terrain_bands)
+    directory = os.path.join(cache_dir, key)
+    if not os.path.isdir(directory):
+        arrays = compile_navigation_grid(image_path, zoom, tile_size, wall_threshold, diagonal, terrain_bands)
+        metadata = {"image": os.path.basename(image_path), "zoom": zoom, "tile_size": tile_size,
+                    "wall_threshold": wall_threshold, "diagonal": diagonal,
+                    "terrain_bands": terrain_bands_metadata(terrain_bands), "format": CACHE_FORMAT}
+        save_navigation_grid(directory, arrays, metadata)
+    arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r") for name in CACHE_ARRAYS}
+    return GridGraph.from_arrays(tile_size=tile_size, wall_threshold=wall_threshold, diagonal=diagonal, **arrays)
@@ -0,0 +1,328 @@
+# @file pathDatabase.py
+# @brief Tabla precalculada con el primer movimiento de cada tile hacia cada otro, comprimida por filas con run-length encoding
+# @author Anya Marcano
+# @date 2026/10/18
+
+import argparse
+import bisect
+import heapq
+import json
+import math
+import os
+import random
+import shutil
+import sys
+import weakref
+import numpy as np
+from typing import List, Optional
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from tileGraph import WALL_THRESHOLD, DEFAULT_TERRAIN_BANDS, DIRECTIONS, DIAGONAL_DIRECTIONS, TileGraph
+from gridGraph import GridGraph
+from batchPathfinding import GRAPH_ARRAYS, heuristic_weight
+from navigationCache import (CACHE_DIR, ARRAY_NAMES, navigation_cache_key, compile_navigation_grid,
+                             save_navigation_grid, terrain_bands_metadata)
+from nodes import TileNode
+from connection import Connection
+from aStar import pathfind_astar
+from dijkstra import pathfind_dijkstra
+from manhattanHeuristic import ManhattanHeuristic
+from octileHeuristic import OctileHeuristic
+
+MOVES = DIRECTIONS + DIAGONAL_DIRECTIONS  # Un primer movimiento se guarda como su índice en esta lista
+NO_MOVE = 255  # Primer movimiento de un tile hacia sí mismo o hacia un tile inalcanzable
+TABLE_NAMES = ("row_offsets", "run_starts", "run_moves")
+
+
+def edge_moves(xs: np.ndarray, ys: np.ndarray, offsets: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    # Índice en MOVES de cada conexión CSR
+    sources = np.repeat(np.arange(len(xs)), np.diff(offsets))
+    move_table = np.full(9, NO_MOVE, dtype=np.uint8)
+    for move, (dx, dy) in enumerate(MOVES):
+        move_table[(dy + 1) * 3 + dx + 1] = move
+    dx = xs[targets].astype(np.int64) - xs[sources]
+    dy = ys[targets].astype(np.int64) - ys[sources]
+    return move_table[(dy + 1) * 3 + dx + 1]
+
+
+def first_moves_from(source: int, offsets, targets, costs, moves, count: int) -> np.ndarray:
+    # Dijkstra desde un tile; el primer movimiento hacia cada tile se hereda a lo largo del árbol de caminos más cortos
+    first = np.full(count, NO_MOVE, dtype=np.uint8)
+    cost_so_far = {source: 0.0}
+    first_move = {source: NO_MOVE}
+    open_heap = [(0.0, source)]
+    while open_heap:
+        cost, current = heapq.heappop(open_heap)
+        if cost > cost_so_far[current]:
+            continue
+        for k in range(offsets[current], offsets[current + 1]):
+            end = targets[k]
+            end_cost = cost + costs[k]
+            if end_cost < cost_so_far.get(end, math.inf):
+                cost_so_far[end] = end_cost
+                first_move[end] = moves[k] if current == source else first_move[current]
+                heapq.heappush(open_heap, (end_cost, end))
+    del first_move[source]
+    first[list(first_move)] = list(first_move.values())
+    return first
+
+
+def build_path_tables(graph: GridGraph) -> dict:
+    """
+    Calcula el primer movimiento desde cada tile caminable (origen) hacia cada otro (destino), con los tiles
+    numerados como en los arreglos CSR. Cada fila de un origen se comprime con run-length encoding: la racha r
+    cubre los destinos desde run_starts[r] hasta el comienzo de la siguiente y hacia todos ellos se mueve con
+    run_moves[r]; las rachas del origen i son row_offsets[i]:row_offsets[i + 1]. Los destinos vecinos suelen
+    compartir el primer movimiento, así que la tabla es mucho más chica que count² bytes.
+    Args:
+        graph (GridGraph): La grilla compilada, con costos de conexión positivos.
+    Returns:
+        dict: Los arreglos row_offsets, run_starts y run_moves.
+    """
+    count = len(graph.xs)
+    if len(graph.costs) and graph.costs.min() <= 0:
+        raise ValueError("Path tables need positive edge costs, zero-cost cycles make the move chains loop")
+    moves = memoryview(edge_moves(graph.xs, graph.ys, graph.offsets, graph.targets))
+    offsets, targets, costs = memoryview(graph.offsets), memoryview(graph.targets), memoryview(graph.costs)
+    start_type = np.uint16 if count <= np.iinfo(np.uint16).max + 1 else np.int32
+    row_offsets = np.zeros(count + 1, dtype=np.int64)
+    run_starts, run_moves = [], []
+    for source in range(count):
+        row = first_moves_from(source, offsets, targets, costs, moves, count)
+        starts = np.flatnonzero(np.diff(row)) + 1
+        starts = np.concatenate(([0], starts)) if count else starts
+        run_starts.append(starts.astype(start_type))
+        run_moves.append(row[starts])
+        row_offsets[source + 1] = row_offsets[source] + len(starts)
+    return {"row_offsets": row_offsets,
+            "run_starts": np.concatenate(run_starts) if run_starts else np.zeros(0, dtype=start_type),
+            "run_moves": np.concatenate(run_moves) if run_moves else np.zeros(0, dtype=np.uint8)}
+
+
+class PathDatabase:
+    """
+    Clase que representa la tabla precalculada de primeros movimientos de un mapa: una consulta de camino es una
+    cadena de búsquedas en la tabla, sin A*.
+    Attributes:
+        graph (GridGraph): La grilla compilada con la que se construyó la tabla.
+        tables (dict): Las filas comprimidas (row_offsets, run_starts y run_moves).
+        Methods:
+            build(cls, graph: TileGraph) -> PathDatabase: Construye la tabla de un grafo.
+            save(self, directory: str, metadata: Optional[dict] = None): Guarda la tabla y la grilla en un directorio.
+            load(cls, directory: str) -> PathDatabase: Carga una tabla guardada con memory-map.
+            nbytes(self) -> int: Devuelve la memoria ocupada por la tabla.
+            matches(self, graph: TileGraph) -> bool: Indica si un grafo es el mapa de la tabla.
+            next_move(self, source: int, target: int) -> int: Devuelve el primer movimiento entre dos tiles.
+            find_path(self, start: TileNode, goal: TileNode) -> Optional[List[Connection]]: Devuelve el camino entre dos tiles.
+    """
+    def __init__(self, graph: GridGraph, tables: dict):
+        self.graph = graph
+        self.tables = tables
+        self._row_offsets = memoryview(np.ascontiguousarray(tables["row_offsets"]))
+        self._run_starts = memoryview(np.ascontiguousarray(tables["run_starts"]))
+        self._run_moves = memoryview(np.ascontiguousarray(tables["run_moves"]))
+        self._matched = weakref.WeakKeyDictionary()  # Grafo -> (versión, coincide) ya comparados
+
+    @classmethod
+    def build(cls, graph: TileGraph) -> "PathDatabase":
+        snapshot = graph if isinstance(graph, GridGraph) else GridGraph.from_graph(graph)
+        return cls(snapshot, build_path_tables(snapshot))
+
+    def save(self, directory: str, metadata: Optional[dict] = None):
+        # Reemplaza la tabla guardada antes en directory (la clave del mapa no cambia al reconstruirla)
+        shutil.rmtree(directory, ignore_errors=True)
+        arrays = {name: getattr(self.graph, name) for name in ARRAY_NAMES}
+        arrays.update(self.tables)
+        metadata = dict(metadata or {}, tile_size=self.graph.tile_size, wall_threshold=self.graph.wall_threshold,
+                        diagonal=self.graph.diagonal)
+        save_navigation_grid(directory, arrays, metadata, ARRAY_NAMES + TABLE_NAMES)
+
+    @classmethod
+    def load(cls, directory: str) -> "PathDatabase":
+        # Mapea en memoria todos los arreglos: solo se leen del disco las filas que tocan las consultas
+        with open(os.path.join(directory, "meta.json")) as meta_file:
+            metadata = json.load(meta_file)
+        arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+                  for name in ARRAY_NAMES + TABLE_NAMES}
+        graph = GridGraph.from_arrays(tile_size=metadata["tile_size"], wall_threshold=metadata["wall_threshold"],
+                                      diagonal=metadata["diagonal"], **{name: arrays[name] for name in ARRAY_NAMES})
+        return cls(graph, {name: arrays[name] for name in TABLE_NAMES})
+
+    def nbytes(self) -> int:
+        return sum(table.nbytes for table in self.tables.values())
+
+    def matches(self, graph: TileGraph) -> bool:
+        # True si graph tiene los mismos tiles y costos de conexión que el mapa de la tabla. La comparación se
+        # hace una vez por versión del grafo
+        if graph is self.graph:
+            return True
+        checked = self._matched.get(graph)
+        if checked is not None and checked[0] == graph.version:
+            return checked[1]
+        snapshot = graph if isinstance(graph, GridGraph) else GridGraph.from_graph(graph)
+        same = snapshot.diagonal == self.graph.diagonal and all(
+            np.array_equal(getattr(snapshot, name), getattr(self.graph, name))
+            for name in ("walkable", "offsets", "targets", "costs"))
+        self._matched[graph] = (graph.version, same)
+        return same
+
+    def next_move(self, source: int, target: int) -> int:
+        # Índice en MOVES del primer movimiento desde el tile source hacia el tile target (índices CSR)
+        begin, end = self._row_offsets[source], self._row_offsets[source + 1]
+        return self._run_moves[bisect.bisect_right(self._run_starts, target, begin, end) - 1]
+
+    def find_path(self, start: TileNode, goal: TileNode) -> Optional[List[Connection]]:
+        # Mismo formato que pathfind_astar: las conexiones de start a goal, o None si es inalcanzable
+        graph = self.graph
+        source, target = graph.tile_index(start.x, start.y), graph.tile_index(goal.x, goal.y)
+        if source < 0 or target < 0:
+            return None
+        path = []
+        x, y = int(graph.xs[source]), int(graph.ys[source])
+        while source != target:
+            move = self.next_move(source, target)
+            if move == NO_MOVE:
+                return None
+            dx, dy = MOVES[move]
+            following = graph.tile_index(x + dx, y + dy)
+            for k in range(graph.offsets[source], graph.offsets[source + 1]):
+                if graph.targets[k] == following:
+                    path.append(Connection(TileNode(x, y), TileNode(x + dx, y + dy), float(graph.costs[k])))
+                    break
+            source, x, y = following, x + dx, y + dy
+        return path
+
+
+def path_database_directory(image_path: str, zoom: float, tile_size: int, wall_threshold: int = WALL_THRESHOLD,
+                            cache_dir: str = CACHE_DIR, diagonal: bool = False,
+                            terrain_bands=DEFAULT_TERRAIN_BANDS) -> str:
+    """
+    Devuelve el directorio de la tabla de un mapa, junto a la grilla compilada del mismo mapa y con la misma clave.
+    Args:
+        image_path (str): La ruta de la imagen de fondo.
+        zoom (float): La escala con la que se dibuja el fondo.
+        tile_size (int): El tamaño de los tiles en píxeles.
+        wall_threshold (int): El umbral del canal rojo a partir del cual un tile es pared.
+        cache_dir (str): El directorio de la caché.
+        diagonal (bool): Si el grafo tiene movimiento en 8 direcciones.
+        terrain_bands: Las bandas de color de la capa de terreno.
+    Returns:
+        str: La ruta del directorio.
+    """
+    key = navigation_cache_key(image_path, zoom, tile_size, wall_threshold, diagonal, terrain_bands)
+    return os.path.join(cache_dir, key + "-paths")
+
+
+def load_path_database(image_path: str, zoom: float, tile_size: int, wall_threshold: int = WALL_THRESHOLD,
+                       cache_dir: str = CACHE_DIR, diagonal: bool = False,
+                       terrain_bands=DEFAULT_TERRAIN_BANDS) -> Optional[PathDatabase]:
+    """
+    Carga la tabla de un mapa. La tabla es opcional: si no se construyó para este mapa (ver el comando build) se
+    devuelve None.
+    Args:
+        image_path (str): La ruta de la imagen de fondo.
+        zoom (float): La escala con la que se dibuja el fondo.
+        tile_size (int): El tamaño de los tiles en píxeles.
+        wall_threshold (int): El umbral del canal rojo a partir del cual un tile es pared.
+        cache_dir (str): El directorio de la caché.
+        diagonal (bool): Si el grafo tiene movimiento en 8 direcciones.
+        terrain_bands: Las bandas de color de la capa de terreno.
+    Returns:
+        Optional[PathDatabase]: La tabla, o None si no existe.
+    """
+    directory = path_database_directory(image_path, zoom, tile_size, wall_threshold, cache_dir, diagonal, terrain_bands)
+    if not os.path.isdir(directory):
+        return None
+    return PathDatabase.load(directory)
+
+
+def validate_path_database(database: PathDatabase, samples: Optional[int] = None, seed: int = 0) -> List[tuple]:
+    """
+    Compara la tabla con pathfind_astar en pares de tiles al azar (todos los pares si samples es None). Si hay
+    conexiones más baratas que un paso simple, la estimación Manhattan u octil deja de ser admisible y A* ya no es
+    una referencia exacta, así que se compara con pathfind_dijkstra.
+    Args:
+        database (PathDatabase): La tabla a validar.
+        samples (Optional[int]): La cantidad de pares al azar, o None para todos los pares.
+        seed (int): La semilla de los pares al azar.
+    Returns:
+        List[tuple]: Las tuplas (inicio, objetivo, costo de la tabla, costo de referencia) que no coinciden; un
+                     costo None significa "sin camino".
+    """
+    graph = database.graph
+    tiles = [TileNode(int(x), int(y)) for x, y in zip(graph.xs, graph.ys)]
+    if samples is None:
+        pairs = [(start, goal) for start in tiles for goal in tiles]
+    else:
+        rng = random.Random(seed)
+        pairs = [(rng.choice(tiles), rng.choice(tiles)) for _ in range(samples)] if tiles else []
+    heuristic_class = OctileHeuristic if graph.diagonal else ManhattanHeuristic
+    admissible = heuristic_weight({name: getattr(graph, name) for name in GRAPH_ARRAYS}, graph.diagonal) >= 1
+    mismatches = []
+    for start, goal in pairs:
+        path = database.find_path(start, goal)
+        if admissible:
+            reference = pathfind_astar(graph, start, goal, heuristic_class(goal))
+        else:
+            reference = pathfind_dijkstra(graph, start, goal)
+        cost = None if path is None else sum(connection.get_cost() for connection in path)
+        reference_cost = None if reference is None else sum(connection.get_cost() for connection in reference)
+        valid = path is None or all(a.to_node == b.from_node for a, b in zip(path, path[1:]))
+        if not valid or (cost is None) != (reference_cost is None) or \
+                (cost is not None and not math.isclose(cost, reference_cost, rel_tol=1e-9, abs_tol=1e-9)):
+            mismatches.append((start, goal, cost, reference_cost))
+    return mismatches
+
+
+def parse_terrain_bands(text: str) -> tuple:
+    # Bandas de terreno desde la línea de comandos, en la misma forma JSON que guarda la caché de navegación:
+    # [["nombre", [r, g, b], [r, g, b], costo], ...]
+    try:
+        bands = tuple((str(name), tuple(low), tuple(high), float(cost)) for name, low, high, cost in json.loads(text))
+        terrain_bands_metadata(bands)
+    except (ValueError, TypeError) as error:
+        raise argparse.ArgumentTypeError(f"Bandas de terreno inválidas: {error}")
+    return bands
+
+
+def main():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description="Tablas precalculadas de primeros movimientos para una imagen de fondo")
+    parser.add_argument("command", choices=("build", "validate"))
+    parser.add_argument("--image", default=os.path.join(root, "Assets", "disenoFondo.png"))
+    parser.add_argument("--zoom", type=float, default=3)
+    parser.add_argument("--tile-size", type=int, default=66)
+    parser.add_argument("--wall-threshold", type=int, default=WALL_THRESHOLD)
+    parser.add_argument("--diagonal", action="store_true")
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--terrain-bands", type=parse_terrain_bands, default=DEFAULT_TERRAIN_BANDS,
+                        help='Bandas de la capa de terreno en JSON: [["nombre", [r, g, b], [r, g, b], costo], ...]')
+    parser.add_argument("--samples", type=int, default=2000, help="Pares comparados con A*, 0 para todos los pares")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    directory = path_database_directory(args.image, args.zoom, args.tile_size, args.wall_threshold,
+                                        args.cache_dir, args.diagonal, args.terrain_bands)
+    if args.command == "build":
+        arrays = compile_navigation_grid(args.image, args.zoom, args.tile_size, args.wall_threshold, args.diagonal,
+                                         args.terrain_bands)
+        graph = GridGraph.from_arrays(tile_size=args.tile_size, wall_threshold=args.wall_threshold,
+                                      diagonal=args.diagonal, **arrays)
+        database = PathDatabase.build(graph)
+        database.save(directory, {"image": os.path.basename(args.image), "zoom": args.zoom,
+                                  "terrain_bands": terrain_bands_metadata(args.terrain_bands)})
+        print(f"{len(graph.xs)} tiles, {len(database.tables['run_moves'])} rachas, "
+              f"{database.nbytes() / 1024:.1f} KiB (sin comprimir {len(graph.xs) ** 2 / 1024:.1f} KiB) -> {directory}")
+    elif not os.path.isdir(directory):
+        parser.error(f"No hay tabla de caminos para este mapa en {args.cache_dir}, ejecute primero el comando build")
+    database = PathDatabase.load(directory)
+    mismatches = validate_path_database(database, args.samples or None, args.seed)
+    for start, goal, cost, reference_cost in mismatches[:10]:
+        print(f"Diferencia {start} -> {goal}: tabla {cost}, A* {reference_cost}")
+    print(f"Validación contra la búsqueda de referencia: {len(mismatches)} diferencias")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
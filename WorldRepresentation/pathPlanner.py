@@ -0,0 +1,206 @@
+# @file pathPlanner.py
+# @brief Servicio que resuelve pedidos de caminos en un pool de procesos o hilos sobre una copia de solo lectura del grafo
+# @author Anya Marcano
+# @date 2026/10/18
+
+import os
+import sys
+import threading
+import numpy as np
+from concurrent.futures import Future, InvalidStateError, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Hashable, List, Optional, Type
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from tileGraph import TileGraph
+from gridGraph import GridGraph
+from nodes import TileNode
+from connection import Connection
+from heuristic import Heuristic
+from manhattanHeuristic import ManhattanHeuristic
+from octileHeuristic import OctileHeuristic
+from aStar import pathfind_astar
+from batchPathfinding import GRAPH_ARRAYS, share_arrays, attach_arrays
+
+_worker_graph: Optional[GridGraph] = None  # Copia del grafo de cada proceso del pool
+_worker_snapshot: Optional[str] = None  # Nombre del bloque de memoria compartida del que se cargó _worker_graph
+
+
+def _load_snapshot(snapshot: tuple):
+    # Carga en el proceso la copia del grafo si la tarea trae una versión distinta de la que ya tiene. Los arreglos
+    # se copian del bloque compartido y el bloque se cierra enseguida, así el padre lo puede liberar sin esperar
+    # a que los procesos cambien de versión
+    global _worker_graph, _worker_snapshot
+    name, layout, diagonal = snapshot
+    if name == _worker_snapshot:
+        return
+    memory = shared_memory.SharedMemory(name=name)
+    views = attach_arrays(memory, layout)
+    arrays = {key: np.array(view) for key, view in views.items()}
+    del views
+    memory.close()
+    _worker_graph = GridGraph.from_arrays(diagonal=diagonal, **arrays)
+    _worker_snapshot = name
+
+
+def _plan_in_worker(snapshot: tuple, start: tuple, goal: tuple, heuristic_class: Type[Heuristic]) -> Optional[list]:
+    # Corre en un proceso del pool; devuelve el camino como tuplas (from_x, from_y, to_x, to_y, costo),
+    # que se serializan mucho más rápido que los objetos Connection
+    _load_snapshot(snapshot)
+    goal_node = TileNode(*goal)
+    path = pathfind_astar(_worker_graph, TileNode(*start), goal_node, heuristic_class(goal_node))
+    if path is None:
+        return None
+    return [(c.from_node.x, c.from_node.y, c.to_node.x, c.to_node.y, c.get_cost()) for c in path]
+
+
+class PathPlanner:
+    """
+    Clase que resuelve pedidos de caminos con A* en un pool de procesos o hilos, sobre una copia de solo lectura
+    (GridGraph) del grafo vivo.
+    Cada pedido devuelve un Future. Un pedido nuevo de un agente reemplaza al anterior, que se cancela si no
+    empezó y se ignora si ya está corriendo; un pedido igual al que el agente tiene en curso (mismo inicio,
+    objetivo y versión del grafo) devuelve el mismo Future en lugar de encolar otra búsqueda. poll() se llama una
+    vez por frame, en un punto seguro del ciclo del juego, y devuelve el último camino terminado de cada agente.
+    La copia se reconstruye cuando cambia graph.version. Por defecto las búsquedas corren en procesos (el script
+    que crea el planificador debe estar protegido con if __name__ == "__main__"): el pool se crea una sola vez y
+    cada versión de la copia se escribe en un bloque de memoria compartida cuyo nombre viaja con cada tarea; un
+    proceso solo carga el bloque cuando la tarea trae una versión distinta de la que ya tiene, y el bloque de una
+    versión vieja se libera cuando terminan las tareas que lo usan. Con use_processes=False corren en hilos que comparten la copia:
+    A* es Python puro y retiene el GIL, así que los hilos solo sacan la búsqueda del código que la pide, no la
+    acortan ni corren varias búsquedas a la vez.
+    Attributes:
+        graph (TileGraph): El grafo vivo del juego.
+        workers (int): La cantidad de procesos o hilos del pool.
+        use_processes (bool): True para usar procesos y False para usar hilos.
+        heuristic_class (Type[Heuristic]): La heurística de A*, octil con 8 direcciones y Manhattan con 4.
+        snapshot (Optional[GridGraph]): La copia de solo lectura sobre la que se busca.
+        Methods:
+            refresh(self): Reconstruye la copia (y la comparte con el pool de procesos) si el grafo cambió.
+            request(self, agent: Hashable, start: TileNode, goal: TileNode) -> Future: Pide el camino de un agente.
+            poll(self) -> Dict[Hashable, Optional[List[Connection]]]: Devuelve los caminos terminados de cada agente.
+            pending(self, agent: Hashable) -> bool: Indica si un agente tiene un pedido sin recibir.
+            shutdown(self, wait: bool = True): Cancela los pedidos y detiene el pool.
+    """
+    def __init__(self, graph: TileGraph, workers: Optional[int] = None, use_processes: bool = True,
+                 heuristic_class: Optional[Type[Heuristic]] = None):
+        self.graph = graph
+        self.workers = workers or os.cpu_count() or 1
+        self.use_processes = use_processes
+        self.heuristic_class = heuristic_class or (OctileHeuristic if graph.diagonal else ManhattanHeuristic)
+        self.snapshot: Optional[GridGraph] = None
+        self._version = None
+        self._executor = None
+        self._latest: Dict[Hashable, Future] = {}
+        self._queries: Dict[Hashable, tuple] = {}  # (inicio, objetivo, versión del grafo) del último pedido de cada agente
+        self._shared: Dict[str, list] = {}  # Nombre del bloque -> [bloque, tareas pendientes que lo usan]
+        self._shared_lock = threading.Lock()  # Las tareas de procesos terminan en un hilo del pool
+        self._payload: Optional[tuple] = None  # (nombre del bloque, layout, diagonal) de la copia actual
+        self.refresh()
+
+    def refresh(self):
+        # Toma una copia nueva si el grafo vivo cambió desde la anterior; con procesos la escribe en un bloque de
+        # memoria compartida nuevo, sin reiniciar el pool
+        if self.snapshot is not None and self.graph.version == self._version:
+            return
+        self.snapshot = self.graph if isinstance(self.graph, GridGraph) else GridGraph.from_graph(self.graph)
+        self._version = self.graph.version
+        if self.use_processes:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self.workers)
+            memory, layout = share_arrays({name: getattr(self.snapshot, name) for name in GRAPH_ARRAYS})
+            with self._shared_lock:
+                previous = self._payload
+                self._shared[memory.name] = [memory, 0]
+                self._payload = (memory.name, layout, self.snapshot.diagonal)
+                if previous is not None:
+                    self._release_if_unused(previous[0])
+        elif self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="path-planner")
+
+    def request(self, agent: Hashable, start: TileNode, goal: TileNode) -> Future:
+        self.refresh()
+        query = (start, goal, self._version)
+        previous = self._latest.get(agent)
+        if previous is not None:
+            if self._queries.get(agent) == query and not previous.done():
+                return previous
+            del self._latest[agent]
+            previous.cancel()
+
+        future = Future()
+        self._latest[agent] = future
+        self._queries[agent] = query
+        if self.use_processes:
+            name = self._payload[0]
+            with self._shared_lock:
+                self._shared[name][1] += 1
+            task = self._executor.submit(_plan_in_worker, self._payload, (start.x, start.y), (goal.x, goal.y),
+                                         self.heuristic_class)
+            task.add_done_callback(lambda _: self._task_finished(name))
+        else:
+            task = self._executor.submit(pathfind_astar, self.snapshot, start, goal, self.heuristic_class(goal))
+        # Cancelar el future devuelto también cancela la búsqueda si sigue en la cola
+        future.add_done_callback(lambda f: task.cancel() if f.cancelled() else None)
+        task.add_done_callback(lambda task: self._deliver(future, task))
+        return future
+
+    def poll(self) -> Dict[Hashable, Optional[List[Connection]]]:
+        # Caminos terminados (None si el objetivo es inalcanzable) del último pedido de cada agente
+        results = {}
+        for agent, future in list(self._latest.items()):
+            if future.done():
+                del self._latest[agent]
+                if not future.cancelled():
+                    results[agent] = future.result()
+        return results
+
+    def pending(self, agent: Hashable) -> bool:
+        return agent in self._latest
+
+    def shutdown(self, wait: bool = True):
+        for future in self._latest.values():
+            future.cancel()
+        self._latest.clear()
+        self._queries.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+        with self._shared_lock:
+            for memory, _ in self._shared.values():
+                memory.close()
+                memory.unlink()
+            self._shared.clear()
+            self._payload = None
+        self.snapshot = None
+
+    def _task_finished(self, name: str):
+        with self._shared_lock:
+            if name in self._shared:
+                self._shared[name][1] -= 1
+                self._release_if_unused(name)
+
+    def _release_if_unused(self, name: str):
+        # Libera el bloque de una versión vieja cuando ya no queda ninguna tarea que lo vaya a abrir
+        # (se llama con _shared_lock tomado)
+        entry = self._shared.get(name)
+        if entry is not None and entry[1] == 0 and (self._payload is None or self._payload[0] != name):
+            entry[0].close()
+            entry[0].unlink()
+            del self._shared[name]
+
+    def _deliver(self, future: Future, task: Future):
+        if future.cancelled():
+            return
+        try:
+            if task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                future.set_exception(task.exception())
+            elif self.use_processes and task.result() is not None:
+                future.set_result([Connection(TileNode(fx, fy), TileNode(tx, ty), cost)
+                                   for fx, fy, tx, ty, cost in task.result()])
+            else:
+                future.set_result(task.result())
+        except InvalidStateError:
+            pass  # Reemplazado y cancelado mientras se entregaba el resultado
@@ -1,21 +1,184 @@
 import pygame
+import numpy as np
+import math
 import sys
 import os
+from contextlib import contextmanager
+from typing import Callable, Iterable, Optional
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Pathfinding"))
 
-from Pathfinding.nodes import TileNode
-from Pathfinding.graph import Graph
+# Same module names the Pathfinding package uses internally, so there is a single TileNode class
+from nodes import TileNode
+from graph import Graph
+from connection import Connection
+
+WALL_THRESHOLD = 246  # A tile is a wall when the red channel of its centre pixel is above this
+DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # 4-directional movement, in connection order
+DIAGONAL_DIRECTIONS = [(1, 1), (1, -1), (-1, 1), (-1, -1)]  # Extra moves with 8-connectivity, listed after DIRECTIONS
+DIAGONAL_COST = math.sqrt(2)
+# Terrain bands are (name, (r, g, b) low, (r, g, b) high, cost) tuples, e.g. ("mud", (90, 60, 20), (150, 110, 70), 3.0)
+DEFAULT_TERRAIN_BANDS = ()
+
+
+def sample_walkable_grid(maze_surface: pygame.Surface, tile_size: int, wall_threshold: int = WALL_THRESHOLD) -> np.ndarray:
+    # Reads the surface once and samples the centre pixel of every tile.
+    # Returns a (height, width) boolean array indexed [y, x], True for walkable tiles.
+    width = maze_surface.get_width() // tile_size
+    height = maze_surface.get_height() // tile_size
+    try:
+        red = pygame.surfarray.pixels_red(maze_surface)  # Zero-copy view, indexed [x, y]
+    except ValueError:
+        red = pygame.surfarray.array_red(maze_surface)  # Surfaces that can't be referenced directly (e.g. 8-bit)
+    centre = tile_size // 2
+    centres = red[centre:width * tile_size:tile_size, centre:height * tile_size:tile_size]
+    walkable = np.ascontiguousarray((centres <= wall_threshold).T)
+    del red, centres  # Release the surface lock taken by pixels_red
+    return walkable
+
+
+def build_cost_layer(maze_surface: pygame.Surface, tile_size: int, bands=DEFAULT_TERRAIN_BANDS) -> np.ndarray:
+    # Traversal cost of every tile from the colour of its centre pixel, in one vectorized pass per band.
+    # A tile takes the cost of the first band whose inclusive colour range contains it, and 1.0 otherwise.
+    # Returns a (height, width) float array indexed [y, x]; walls get a cost too but have no connections.
+    # Costs below 1 are rejected, since they would make the Manhattan and octile heuristics inadmissible.
+    width = maze_surface.get_width() // tile_size
+    height = maze_surface.get_height() // tile_size
+    costs = np.ones((height, width))
+    if not bands:
+        return costs
+    try:
+        rgb = pygame.surfarray.pixels3d(maze_surface)  # Zero-copy view, indexed [x, y, channel]
+    except ValueError:
+        rgb = pygame.surfarray.array3d(maze_surface)
+    centre = tile_size // 2
+    colours = rgb[centre:width * tile_size:tile_size, centre:height * tile_size:tile_size].transpose(1, 0, 2)
+    assigned = np.zeros((height, width), dtype=bool)
+    for name, low, high, cost in bands:
+        if not math.isfinite(cost) or cost < 1:
+            raise ValueError(f"Terrain band {name!r} must cost at least 1, got {cost}")
+        inside = np.all((colours >= np.array(low)) & (colours <= np.array(high)), axis=-1) & ~assigned
+        costs[inside] = cost
+        assigned |= inside
+    del rgb, colours  # Release the surface lock taken by pixels3d
+    return costs
+
+
+def build_adjacency(walkable: np.ndarray, diagonal: bool = False, tile_costs: Optional[np.ndarray] = None):
+    # Builds the adjacency of the walkable tiles in CSR form.
+    # Tiles are numbered in row-major order; the neighbours of tile i are targets[offsets[i]:offsets[i + 1]],
+    # listed in DIRECTIONS order (then DIAGONAL_DIRECTIONS with diagonal=True). A diagonal move is only allowed
+    # when both orthogonal tiles it passes next to are walkable, so paths never cut wall corners.
+    # With a (height, width) tile_costs layer, every move costs its step length times the cost of the tile it enters.
+    # Returns (ys, xs, offsets, targets, costs).
+    height, width = walkable.shape
+    ys, xs = np.nonzero(walkable)
+    index = np.full((height + 2, width + 2), -1, dtype=np.int32)
+    index[ys + 1, xs + 1] = np.arange(len(ys), dtype=np.int32)
+    columns = [index[ys + 1 + dy, xs + 1 + dx] for dx, dy in DIRECTIONS]
+    step_costs = [1.0] * len(DIRECTIONS)
+    if diagonal:
+        for dx, dy in DIAGONAL_DIRECTIONS:
+            corner_free = (index[ys + 1, xs + 1 + dx] >= 0) & (index[ys + 1 + dy, xs + 1] >= 0)
+            columns.append(np.where(corner_free, index[ys + 1 + dy, xs + 1 + dx], -1))
+        step_costs += [DIAGONAL_COST] * len(DIAGONAL_DIRECTIONS)
+    neighbours = np.stack(columns, axis=-1)
+    is_open = neighbours >= 0
+    offsets = np.zeros(len(ys) + 1, dtype=np.int32)
+    np.cumsum(is_open.sum(axis=1), out=offsets[1:])
+    targets = neighbours[is_open]  # Row-major, so grouped by tile and in direction order
+    costs = np.broadcast_to(np.array(step_costs), neighbours.shape)[is_open]
+    if tile_costs is not None:
+        costs = costs * np.asarray(tile_costs, dtype=np.float64)[ys, xs][targets]
+    return ys, xs, offsets, targets, costs
+
+
+def label_components(walkable: np.ndarray) -> np.ndarray:
+    # Labels the connected regions of walkable tiles: returns a (height, width) int32 array with labels
+    # 0..count-1 and -1 for walls. 8-connectivity gives the same regions as 4-connectivity, since a diagonal
+    # move needs both orthogonal tiles to be walkable, so only the 4-connected adjacency is used.
+    # Vectorized label propagation: every region root is hooked to the smallest root next to it, then pointer
+    # jumping makes every tile point at its root again, until no edge joins two different roots.
+    ys, xs, offsets, targets, _ = build_adjacency(walkable)
+    sources = np.repeat(np.arange(len(ys), dtype=np.int32), np.diff(offsets))
+    parent = np.arange(len(ys), dtype=np.int32)
+    while True:
+        hooked = parent.copy()
+        np.minimum.at(hooked, parent[sources], parent[targets])
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, parent):
+            break
+        parent = hooked
+    labels = np.full(walkable.shape, -1, dtype=np.int32)
+    labels[ys, xs] = np.unique(parent, return_inverse=True)[1]
+    return labels
 
 
 class TileGraph(Graph):
-    def __init__(self, maze_surface: pygame.Surface, tile_size: int = 32):
+    def __init__(self, maze_surface: pygame.Surface, tile_size: int = 32, wall_threshold: int = WALL_THRESHOLD,
+                 diagonal: bool = False, terrain_bands=DEFAULT_TERRAIN_BANDS):
         super().__init__()
         self.tile_size = tile_size
         self.maze_surface = maze_surface
+        self.wall_threshold = wall_threshold
+        self.diagonal = diagonal
+        self.terrain_bands = tuple(terrain_bands)
         self.nodes = {}
+        self._init_edits()
         self.create_graph_from_maze()
     
+    @classmethod
+    def from_walkable(cls, walkable: np.ndarray, tile_size: int = 32, wall_threshold: int = WALL_THRESHOLD,
+                      diagonal: bool = False, tile_costs: Optional[np.ndarray] = None):
+        # Builds the graph from a precomputed (height, width) walkability grid and optional cost layer, without a surface
+        graph = cls.__new__(cls)
+        Graph.__init__(graph)
+        graph.tile_size = tile_size
+        graph.maze_surface = None
+        graph.wall_threshold = wall_threshold
+        graph.diagonal = diagonal
+        graph.terrain_bands = ()
+        graph.nodes = {}
+        graph._init_edits()
+        graph.create_graph_from_walkable(np.array(walkable, dtype=bool, order="C"), tile_costs)  # Own copy, edits write to it
+        return graph
+    
     def create_graph_from_maze(self):
+        self.create_graph_from_walkable(sample_walkable_grid(self.maze_surface, self.tile_size, self.wall_threshold),
+                                        build_cost_layer(self.maze_surface, self.tile_size, self.terrain_bands))
+    
+    def create_graph_from_walkable(self, walkable: np.ndarray, tile_costs: Optional[np.ndarray] = None):
+        self.walkable = walkable
+        self._components_version = None
+        self.height, self.width = self.walkable.shape
+        # Cost of entering each tile, read by every connection builder (uniform 1.0 without a terrain layer)
+        self.tile_costs = np.ones(walkable.shape) if tile_costs is None else np.array(tile_costs, dtype=np.float64)
+        
+        ys, xs, offsets, targets, costs = build_adjacency(self.walkable, self.diagonal, self.tile_costs)
+        
+        # Create nodes for walkable tiles, in row-major order
+        node_list = [TileNode(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+        for node in node_list:
+            self.nodes[(node.x, node.y)] = node
+        
+        # Create connections between adjacent walkable tiles
+        targets = targets.tolist()
+        offsets = offsets.tolist()
+        costs = costs.tolist()
+        for i, current_node in enumerate(node_list):
+            begin, end = offsets[i], offsets[i + 1]
+            if begin != end:
+                self.connections[current_node] = [Connection(current_node, node_list[j], cost)
+                                                  for j, cost in zip(targets[begin:end], costs[begin:end])]
+    
+    def create_graph_from_maze_reference(self):
+        # Original per-tile builder through is_wall, kept to validate create_graph_from_maze
+        self.nodes = {}
+        self.connections = {}
         width = self.maze_surface.get_width() // self.tile_size
         height = self.maze_surface.get_height() // self.tile_size
         
@@ -32,24 +195,209 @@ class TileGraph(Graph):
                 if (x, y) in self.nodes:
                     self.add_connections_for_tile(x, y)
     
+    def get_node(self, x: int, y: int) -> Optional[TileNode]:
+        # Canonical node for a tile coordinate, None for walls and out-of-map tiles
+        return self.nodes.get((x, y))
+    
+    def _init_edits(self):
+        # State of the edit API: custom edge costs, change listeners and the changes of the current batch
+        self.edge_costs = {}
+        self.listeners = []
+        self._pending = set()
+        self._batch_depth = 0
+        # Walkability changes only: cost edits bump version but keep the component labels
+        self.topology_version = 0
+        self._components = None
+        self._components_version = None
+        self._next_label = 0
+    
+    def add_listener(self, listener: Callable[[frozenset], None]):
+        # listener(tiles) is called after every edit (once per batch) with the (x, y) tiles whose
+        # outgoing connections changed, e.g. HierarchicalPathfinder.rebuild_tiles
+        self.listeners.append(listener)
+    
+    def remove_listener(self, listener: Callable[[frozenset], None]):
+        self.listeners.remove(listener)
+    
+    def block_tile(self, x: int, y: int):
+        # Turns a walkable tile into a wall and drops every connection into or out of it
+        if (x, y) not in self.nodes:
+            return
+        self.walkable[y, x] = False
+        del self.nodes[(x, y)]
+        # A wall can split its region, which only a full relabel detects
+        self.topology_version += 1
+        self._reconnect_tiles(x, y)
+    
+    def unblock_tile(self, x: int, y: int):
+        # Turns a wall tile into a walkable tile connected to its walkable neighbours
+        if (x, y) in self.nodes or not (0 <= x < self.width and 0 <= y < self.height):
+            return
+        self.walkable[y, x] = True
+        self.nodes[(x, y)] = TileNode(x, y)
+        self._merge_components(x, y)
+        self._reconnect_tiles(x, y)
+    
+    def set_edge_cost(self, from_node: TileNode, to_node: TileNode, cost: float):
+        # Changes the cost of an existing connection (one direction only). The cost is kept if the tiles
+        # are later blocked and unblocked again
+        if not math.isfinite(cost) or cost < 0:
+            raise ValueError(f"Edge costs must be finite and non-negative, got {cost}")
+        connections = self.connections.get(from_node, [])
+        for i, connection in enumerate(connections):
+            if connection.to_node == to_node:
+                connections[i] = Connection(connection.from_node, connection.to_node, cost)
+                self.edge_costs[((from_node.x, from_node.y), (to_node.x, to_node.y))] = cost
+                self._mark_changed([(from_node.x, from_node.y)])
+                return
+        raise KeyError(f"No connection from {from_node} to {to_node}")
+    
+    @contextmanager
+    def batch(self):
+        # Groups several edits into a single version bump and a single notification
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending:
+                self._commit_changes()
+    
+    def _reconnect_tiles(self, x: int, y: int):
+        # Rebuilds the connections of (x, y) and of the neighbours whose moves depend on it. With 8-connectivity
+        # that includes the diagonal neighbours, since a diagonal move needs both orthogonal tiles to be walkable
+        changed = []
+        for dx, dy in [(0, 0)] + DIRECTIONS + (DIAGONAL_DIRECTIONS if self.diagonal else []):
+            tile = (x + dx, y + dy)
+            node = self.nodes.get(tile)
+            if node is None:
+                if tile == (x, y):
+                    self.connections.pop(TileNode(x, y), None)
+                    changed.append(tile)
+                continue
+            connections = self._tile_connections(*tile)
+            if connections:
+                self.connections[node] = connections
+            else:
+                self.connections.pop(node, None)
+            changed.append(tile)
+        self._mark_changed(changed)
+    
+    def _tile_connections(self, x: int, y: int) -> list:
+        # Outgoing connections of a walkable tile from the current walkability, using the custom edge costs
+        node = self.nodes[(x, y)]
+        connections = []
+        for dx, dy in DIRECTIONS:
+            neighbor_node = self.nodes.get((x + dx, y + dy))
+            if neighbor_node is not None:
+                cost = self.edge_costs.get(((x, y), (x + dx, y + dy)), float(self.tile_costs[y + dy, x + dx]))
+                connections.append(Connection(node, neighbor_node, cost))
+        if self.diagonal:
+            for dx, dy in DIAGONAL_DIRECTIONS:
+                neighbor_node = self.nodes.get((x + dx, y + dy))
+                if neighbor_node is not None and (x + dx, y) in self.nodes and (x, y + dy) in self.nodes:
+                    cost = self.edge_costs.get(((x, y), (x + dx, y + dy)),
+                                               DIAGONAL_COST * float(self.tile_costs[y + dy, x + dx]))
+                    connections.append(Connection(node, neighbor_node, cost))
+        return connections
+    
+    def _mark_changed(self, tiles: Iterable[tuple]):
+        self._pending.update(tiles)
+        if self._batch_depth == 0:
+            self._commit_changes()
+    
+    def _commit_changes(self):
+        # Publishes the pending changes: new version, stale reverse adjacency and listeners notified
+        tiles = frozenset(self._pending)
+        self._pending = set()
+        self.version += 1
+        self._incoming = None
+        for listener in list(self.listeners):
+            listener(tiles)
+    
+    def component_labels(self) -> np.ndarray:
+        # Connected-component label of every tile (see label_components), recomputed on the first query after
+        # a tile is blocked. Unblocked tiles are merged into the labels in place, so after that the labels
+        # are no longer consecutive
+        if self._components_version != self.topology_version:
+            labels = label_components(self.walkable)
+            self._components = (labels, memoryview(labels.ravel()))
+            self._components_version = self.topology_version
+            self._next_label = int(labels.max(initial=-1)) + 1
+        return self._components[0]
+    
+    def _merge_components(self, x: int, y: int):
+        # Labels a just unblocked tile: it joins the regions of its walkable orthogonal neighbours (the diagonal
+        # ones are connected only through them), which all take the smallest of their labels. An isolated tile
+        # gets a new label. Stale labels are left for component_labels to recompute
+        if self._components_version != self.topology_version:
+            self.topology_version += 1
+            return
+        labels = self._components[0]
+        neighbor_labels = {int(labels[y + dy, x + dx]) for dx, dy in DIRECTIONS
+                           if 0 <= x + dx < self.width and 0 <= y + dy < self.height and labels[y + dy, x + dx] >= 0}
+        if not neighbor_labels:
+            labels[y, x] = self._next_label
+            self._next_label += 1
+            return
+        label = min(neighbor_labels)
+        labels[y, x] = label
+        if len(neighbor_labels) > 1:
+            labels[np.isin(labels, list(neighbor_labels - {label}))] = label
+    
+    def is_reachable(self, from_node, to_node) -> bool:
+        # O(1) check before a search: tiles in different regions (or walls) can never be connected
+        if from_node == to_node or not isinstance(from_node, TileNode) or not isinstance(to_node, TileNode):
+            return True
+        self.component_labels()
+        labels, width, height = self._components[1], self.width, self.height
+        if not (0 <= from_node.x < width and 0 <= from_node.y < height and 0 <= to_node.x < width and 0 <= to_node.y < height):
+            return False
+        label = labels[from_node.y * width + from_node.x]
+        return label >= 0 and label == labels[to_node.y * width + to_node.x]
+    
+    def closest_reachable(self, from_node: TileNode, x: int, y: int) -> Optional[TileNode]:
+        # Tile of the same region as from_node closest (in straight line) to (x, y), e.g. to walk as near as
+        # possible to an unreachable goal. None if from_node is a wall or outside the map
+        labels = self.component_labels()
+        if not (0 <= from_node.x < self.width and 0 <= from_node.y < self.height):
+            return None
+        label = labels[from_node.y, from_node.x]
+        if label < 0:
+            return None
+        ys, xs = np.nonzero(labels == label)
+        closest = int(np.argmin((xs - x) ** 2 + (ys - y) ** 2))
+        return self.nodes[(int(xs[closest]), int(ys[closest]))]
+    
+    def has_uniform_costs(self) -> bool:
+        # True if every move costs its plain step length (no terrain layer and no custom edge costs)
+        return not self.edge_costs and bool(np.all(self.tile_costs == 1.0))
+    
     def is_wall(self, x: int, y: int) -> bool:
         pixel_x = x * self.tile_size + self.tile_size // 2
         pixel_y = y * self.tile_size + self.tile_size // 2
         try:
             color = self.maze_surface.get_at((pixel_x, pixel_y))
-            return color[0] > 246  # Using your existing collision logic
+            return color[0] > self.wall_threshold  # Using your existing collision logic
         except IndexError:
             return True
     
     def add_connections_for_tile(self, x: int, y: int):
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # 4-directional movement
         current_node = self.nodes[(x, y)]
         
-        for dx, dy in directions:
+        for dx, dy in DIRECTIONS:
             new_x, new_y = x + dx, y + dy
             if (new_x, new_y) in self.nodes:
                 neighbor_node = self.nodes[(new_x, new_y)]
-                self.add_connection(current_node, neighbor_node, 1.0)
+                self.add_connection(current_node, neighbor_node, float(self.tile_costs[new_y, new_x]))
+        
+        if self.diagonal:
+            # Diagonal moves can't squeeze between two walls touching at a corner
+            for dx, dy in DIAGONAL_DIRECTIONS:
+                new_x, new_y = x + dx, y + dy
+                if (new_x, new_y) in self.nodes and (x + dx, y) in self.nodes and (x, y + dy) in self.nodes:
+                    self.add_connection(current_node, self.nodes[(new_x, new_y)],
+                                        DIAGONAL_COST * float(self.tile_costs[new_y, new_x]))
     
     def draw_world_representation(self, surface: pygame.Surface, camera_x: int, camera_y: int):
         # Dibuja la cuadrícula
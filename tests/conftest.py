@@ -0,0 +1,14 @@
+# @file conftest.py
+# @brief Configuración de pytest: rutas de importación de los módulos del proyecto y pygame sin pantalla
+# @author Anya Marcano
+# @date 2026/10/18
+
+import os
+import sys
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, "Pathfinding"))
+sys.path.append(os.path.join(ROOT, "WorldRepresentation"))
+sys.path.append(os.path.join(ROOT, "Benchmarks"))
@@ -0,0 +1,106 @@
+# @file test_aStar.py
+# @brief Pruebas de A* (lista abierta con montículo y tabla cerrada) y A* bidireccional contra las implementaciones de referencia
+# @author Anya Marcano
+# @date 2026/10/18
+
+import numpy as np
+import pytest
+import aStar
+import pathfindingList
+from tileGraph import TileGraph
+from aStar import pathfind_astar, pathfind_bidirectional_astar
+from dijkstra import pathfind_dijkstra
+from manhattanHeuristic import ManhattanHeuristic
+from octileHeuristic import OctileHeuristic
+from searchStats import SearchStats
+from pathfindingBenchmark import path_cost
+from pathfindingSuite import maze_walkable, open_field_walkable, make_queries
+
+MAPS = [("maze", maze_walkable), ("open", open_field_walkable)]
+
+def build_graph(walkable, diagonal, seed):
+    # Capa de terreno aleatoria con costos de 1 a 3 para que los empates no oculten diferencias
+    tile_costs = np.random.default_rng(seed).integers(1, 4, walkable.shape).astype(float)
+    return TileGraph.from_walkable(walkable, diagonal=diagonal, tile_costs=tile_costs)
+
+def queries(walkable, seed):
+    return [pair for pairs in make_queries(walkable, 6, seed).values() for pair in pairs]
+
+def heuristic_for(graph, goal):
+    return OctileHeuristic(goal) if graph.diagonal else ManhattanHeuristic(goal)
+
+@pytest.mark.parametrize("name, make_map", MAPS)
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_matches_reference_list(monkeypatch, name, make_map, diagonal):
+    walkable = make_map(20, 1)
+    graph = build_graph(walkable, diagonal, 1)
+    pairs = queries(walkable, 1)
+    paths = [pathfind_astar(graph, start, goal, heuristic_for(graph, goal)) for start, goal in pairs]
+
+    # La versión de referencia usa la lista lineal de pathfindingList como lista abierta y cerrada
+    monkeypatch.setattr(aStar, "PathfindingHeap", pathfindingList.PathfindingList)
+    monkeypatch.setattr(aStar, "PathfindingTable", pathfindingList.PathfindingList)
+    for (start, goal), path in zip(pairs, paths):
+        reference = pathfind_astar(graph, start, goal, heuristic_for(graph, goal))
+        assert (path is None) == (reference is None)
+        if path is not None:
+            assert path_cost(path) == pytest.approx(path_cost(reference))
+
+@pytest.mark.parametrize("name, make_map", MAPS)
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_bidirectional_matches_dijkstra(name, make_map, diagonal):
+    walkable = make_map(48, 2)
+    graph = build_graph(walkable, diagonal, 2)
+    for start, goal in queries(walkable, 2):
+        path = pathfind_bidirectional_astar(graph, start, goal, heuristic_for(graph, goal))
+        reference = pathfind_dijkstra(graph, start, goal)
+        assert (path is None) == (reference is None)
+        if path is not None:
+            assert path_cost(path) == pytest.approx(path_cost(reference))
+            assert path == [] or (path[0].from_node == start and path[-1].to_node == goal)
+            assert all(a.to_node == b.from_node for a, b in zip(path, path[1:]))
+
+def test_stats_match_path():
+    walkable = maze_walkable(32, 3)
+    graph = TileGraph.from_walkable(walkable)
+    stats = SearchStats()
+    for start, goal in queries(walkable, 3):
+        path = pathfind_astar(graph, start, goal, ManhattanHeuristic(goal), stats)
+        expanded = []
+        assert pathfind_astar(graph, start, goal, ManhattanHeuristic(goal),
+                              on_expand=lambda node, cost: expanded.append(node)) == path
+        if path is None:
+            assert stats.path_cost is None
+        else:
+            assert stats.path_cost == pytest.approx(path_cost(path))
+            assert stats.expanded == len(expanded)
+
+class ScaledManhattan(ManhattanHeuristic):
+    # Heurística con un parámetro: dos instancias con distinta escala no deben compartir tabla
+    def __init__(self, goal_node, scale):
+        super().__init__(goal_node)
+        self.scale = scale
+
+    def estimate_between(self, from_node, to_node):
+        return self.scale * super().estimate_between(from_node, to_node)
+
+    def build_table(self, width, height):
+        return self.scale * super().build_table(width, height)
+
+def test_table_cache_key():
+    # La tabla se crea desde la segunda consulta hacia la misma clave; la clave incluye grafo, versión y parámetros
+    walkable = np.ones((8, 8), dtype=bool)
+    graph, other = TileGraph.from_walkable(walkable), TileGraph.from_walkable(walkable)
+    goal = graph.nodes[(5, 6)]
+    assert ScaledManhattan(goal, 1.0).estimate_table(graph) is None
+    table = ScaledManhattan(goal, 1.0).estimate_table(graph)
+    assert table is not None and table[0] == 11
+    assert ScaledManhattan(goal, 1.0).estimate_table(graph) is table
+    assert ScaledManhattan(goal, 2.0).estimate_table(graph) is None
+    assert ScaledManhattan(goal, 2.0).estimate_table(graph)[0] == 22
+    assert ScaledManhattan(goal, 1.0).estimate_table(other) is None
+    graph.block_tile(0, 0)
+    assert ScaledManhattan(goal, 1.0).estimate_table(graph) is None
+    # Las heurísticas sin parámetros siguen compartiendo la tabla entre instancias
+    assert ManhattanHeuristic(goal).estimate_table(other) is None
+    assert ManhattanHeuristic(goal).estimate_table(other) is ManhattanHeuristic(goal).estimate_table(other)
@@ -0,0 +1,84 @@
+# @file test_batchPathfinding.py
+# @brief Pruebas de pathfind_many contra A* corrido una vez por par, en serie y con el pool de procesos
+# @author Anya Marcano
+# @date 2026/10/18
+
+import random
+import numpy as np
+import pytest
+import batchPathfinding
+from tileGraph import TileGraph
+from batchPathfinding import MIN_PARALLEL_PAIRS, pathfind_many
+from aStar import pathfind_astar
+from manhattanHeuristic import ManhattanHeuristic
+from octileHeuristic import OctileHeuristic
+from pathfindingBenchmark import path_cost, random_walkable
+from pathfindingSuite import maze_walkable
+
+def random_pairs(walkable, count, seed):
+    # Pares (sx, sy, gx, gy) sobre tiles cualesquiera, así que algunos extremos caen en paredes
+    rng = random.Random(seed)
+    height, width = walkable.shape
+    return [(rng.randrange(width), rng.randrange(height), rng.randrange(width), rng.randrange(height))
+            for _ in range(count)]
+
+def assert_matches_astar(graph, walkable, pairs, batch):
+    heuristic_class = OctileHeuristic if graph.diagonal else ManhattanHeuristic
+    assert len(batch) == len(pairs)
+    for i, (sx, sy, gx, gy) in enumerate(pairs):
+        tiles = batch.path(i)
+        if not (walkable[sy, sx] and walkable[gy, gx]):
+            assert tiles is None
+            continue
+        start, goal = graph.nodes[(sx, sy)], graph.nodes[(gx, gy)]
+        reference = pathfind_astar(graph, start, goal, heuristic_class(goal))
+        if reference is None:
+            assert tiles is None and not batch.reachable()[i]
+            continue
+        assert batch.costs[i] == pytest.approx(path_cost(reference))
+        assert tuple(tiles[0]) == (sx, sy) and tuple(tiles[-1]) == (gx, gy)
+        # Cada paso del camino es una conexión del grafo y el costo es la suma de sus costos
+        cost = 0.0
+        for (ax, ay), (bx, by) in zip(tiles, tiles[1:]):
+            to_node = graph.nodes[(int(bx), int(by))]
+            connection = next(c for c in graph.get_connections(graph.nodes[(int(ax), int(ay))]) if c.to_node == to_node)
+            cost += connection.get_cost()
+        assert cost == pytest.approx(batch.costs[i])
+
+@pytest.mark.parametrize("diagonal", [False, True])
+@pytest.mark.parametrize("make_map", [maze_walkable, lambda size, seed: random_walkable(size, 0.4, seed)])
+def test_matches_sequential_astar(make_map, diagonal):
+    # Con 40% de paredes el mapa queda partido en muchas regiones, así que hay pares inalcanzables
+    walkable = make_map(32, 7)
+    graph = TileGraph.from_walkable(walkable, diagonal=diagonal)
+    pairs = random_pairs(walkable, 60, 7)
+    batch = pathfind_many(graph, pairs, workers=1)
+    assert_matches_astar(graph, walkable, pairs, batch)
+
+def test_unreachable_pairs_after_edits():
+    # Un muro que parte el mapa en dos: los pares que lo cruzan no tienen camino, y al abrir una puerta sí
+    walkable = np.ones((16, 16), dtype=bool)
+    walkable[:, 8] = False
+    graph = TileGraph.from_walkable(walkable)
+    pairs = [(0, 0, 15, 15), (1, 3, 2, 9), (12, 1, 14, 14)]
+    batch = pathfind_many(graph, pairs, workers=1)
+    assert batch.reachable().tolist() == [False, True, True]
+    assert batch.path(0) is None
+    graph.unblock_tile(8, 5)
+    walkable[5, 8] = True
+    batch = pathfind_many(graph, pairs, workers=1)
+    assert batch.reachable().tolist() == [True, True, True]
+    assert_matches_astar(graph, walkable, pairs, batch)
+
+def test_parallel_matches_serial(monkeypatch):
+    # Se simulan dos núcleos para pasar por el pool de procesos y la memoria compartida, etiquetas incluidas
+    monkeypatch.setattr(batchPathfinding.os, "cpu_count", lambda: 2)
+    walkable = random_walkable(32, 0.4, 9)
+    graph = TileGraph.from_walkable(walkable, diagonal=True)
+    pairs = random_pairs(walkable, MIN_PARALLEL_PAIRS * 2, 9)
+    serial = pathfind_many(graph, pairs, workers=1)
+    parallel = pathfind_many(graph, pairs, workers=2)
+    assert np.array_equal(serial.offsets, parallel.offsets)
+    assert np.array_equal(serial.tiles, parallel.tiles)
+    assert np.array_equal(serial.costs, parallel.costs)
+    assert_matches_astar(graph, walkable, pairs, parallel)
@@ -0,0 +1,61 @@
+# @file test_dStarLite.py
+# @brief Pruebas de D* Lite contra Dijkstra al mover el agente y el objetivo
+# @author Anya Marcano
+# @date 2026/10/18
+
+import random
+import pytest
+from tileGraph import TileGraph
+from nodes import TileNode
+from dStarLite import DStarLite
+from dijkstra import pathfind_dijkstra
+from manhattanHeuristic import ManhattanHeuristic
+from octileHeuristic import OctileHeuristic
+from pathfindingBenchmark import path_cost
+from pathfindingSuite import open_field_walkable
+
+@pytest.mark.parametrize("diagonal", [False, True])
+@pytest.mark.parametrize("seed", range(4))
+def test_goal_moves_match_dijkstra(diagonal, seed):
+    # Con 8 direcciones, la heurística octil y las sumas de costos √2 difieren en el último bit: las claves
+    # empatadas no deben detener la búsqueda antes de tiempo
+    graph = TileGraph.from_walkable(open_field_walkable(32, seed), diagonal=diagonal)
+    labels = graph.component_labels()
+    rng = random.Random(seed)
+    start = rng.choice(list(graph.nodes.values()))
+    tiles = [node for node in graph.nodes.values() if labels[node.y, node.x] == labels[start.y, start.x]]
+    goal = rng.choice(tiles)
+    heuristic_class = OctileHeuristic if diagonal else ManhattanHeuristic
+    planner = DStarLite(graph, start, goal, heuristic_class(goal))
+    for _ in range(60):
+        goal = rng.choice(tiles)
+        path = planner.replan(start, goal)
+        reference = pathfind_dijkstra(graph, start, goal)
+        assert path is not None
+        assert path_cost(path) == pytest.approx(path_cost(reference))
+        # A veces el agente avanza por su camino antes de que el objetivo vuelva a moverse
+        if path and rng.random() < 0.5:
+            start = path[min(len(path) - 1, rng.randrange(3))].to_node
+
+def test_blocked_tiles_match_dijkstra():
+    graph = TileGraph.from_walkable(open_field_walkable(32, 7), diagonal=True)
+    labels = graph.component_labels()
+    rng = random.Random(7)
+    start = rng.choice(list(graph.nodes.values()))
+    goal = max((node for node in graph.nodes.values() if labels[node.y, node.x] == labels[start.y, start.x]),
+               key=lambda node: abs(node.x - start.x) + abs(node.y - start.y))
+    planner = DStarLite(graph, start, goal, OctileHeuristic(goal))
+    changed = []
+    graph.add_listener(changed.extend)
+    for _ in range(10):
+        path = planner.path()
+        assert path_cost(path) == pytest.approx(path_cost(pathfind_dijkstra(graph, start, goal)))
+        # Bloquear un tile del camino (nunca el agente ni el objetivo) y avisar al planificador
+        middle = path[len(path) // 2].to_node
+        if middle in (start, goal) or not graph.is_reachable(start, goal):
+            break
+        changed.clear()
+        graph.block_tile(middle.x, middle.y)
+        if not graph.is_reachable(start, goal):
+            break
+        planner.update_nodes(graph.get_node(x, y) or TileNode(x, y) for x, y in changed)
@@ -0,0 +1,38 @@
+# @file test_dijkstra.py
+# @brief Pruebas de Dijkstra (lista abierta con montículo y tabla cerrada) contra la implementación de referencia
+# @author Anya Marcano
+# @date 2026/10/18
+
+import numpy as np
+import pytest
+import dijkstra
+from tileGraph import TileGraph
+from dijkstra import pathfind_dijkstra
+from pathfindingBenchmark import path_cost
+from pathfindingSuite import maze_walkable, open_field_walkable, make_queries
+
+class ReferenceList(dijkstra.PathfindingList):
+    # La lista de referencia de dijkstra.py como lista abierta: los registros se modifican en el lugar, así que
+    # reordenarlos no hace nada
+    def __init__(self, key=None):
+        super().__init__()
+
+    def update(self, record):
+        pass
+
+@pytest.mark.parametrize("make_map", [maze_walkable, open_field_walkable])
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_matches_reference_list(monkeypatch, make_map, diagonal):
+    walkable = make_map(20, 4)
+    tile_costs = np.random.default_rng(4).integers(1, 4, walkable.shape).astype(float)
+    graph = TileGraph.from_walkable(walkable, diagonal=diagonal, tile_costs=tile_costs)
+    pairs = [pair for pairs in make_queries(walkable, 6, 4).values() for pair in pairs]
+    paths = [pathfind_dijkstra(graph, start, goal) for start, goal in pairs]
+
+    monkeypatch.setattr(dijkstra, "PathfindingHeap", ReferenceList)
+    monkeypatch.setattr(dijkstra, "PathfindingTable", ReferenceList)
+    for (start, goal), path in zip(pairs, paths):
+        reference = pathfind_dijkstra(graph, start, goal)
+        assert (path is None) == (reference is None)
+        if path is not None:
+            assert path_cost(path) == pytest.approx(path_cost(reference))
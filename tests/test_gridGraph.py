@@ -0,0 +1,83 @@
+# @file test_gridGraph.py
+# @brief Pruebas del grafo compacto respaldado por arreglos contra el TileGraph del que se copia
+# @author Anya Marcano
+# @date 2026/10/18
+
+import numpy as np
+import pytest
+from tileGraph import TileGraph
+from gridGraph import GridGraph
+from aStar import pathfind_astar
+from manhattanHeuristic import ManhattanHeuristic
+from octileHeuristic import OctileHeuristic
+from pathfindingBenchmark import path_cost
+from pathfindingSuite import maze_walkable, open_field_walkable, make_queries
+
+def connection_set(connections):
+    return {(c.from_node.x, c.from_node.y, c.to_node.x, c.to_node.y, c.get_cost()) for c in connections}
+
+@pytest.fixture(params=[False, True], ids=["4-direcciones", "8-direcciones"])
+def graphs(request):
+    # Un TileGraph editado (con terreno, una pared nueva y un costo propio) y su copia compacta
+    walkable = open_field_walkable(32, 7)
+    tile_costs = np.random.default_rng(7).integers(1, 4, walkable.shape).astype(float)
+    graph = TileGraph.from_walkable(walkable, diagonal=request.param, tile_costs=tile_costs)
+    start = next(iter(graph.nodes.values()))
+    graph.set_edge_cost(start, graph.get_connections(start)[0].to_node, 9.0)
+    x, y = next(key for key in graph.nodes if key != (start.x, start.y))
+    graph.block_tile(x, y)
+    return graph, GridGraph.from_graph(graph)
+
+def test_same_tiles_and_connections(graphs):
+    graph, grid = graphs
+    assert set(grid.nodes) == set(graph.nodes)
+    for key, node in graph.nodes.items():
+        assert grid.nodes[key] == node
+        assert connection_set(grid.get_connections(node)) == connection_set(graph.get_connections(node))
+        assert connection_set(grid.get_incoming_connections(node)) == \
+            connection_set(graph.get_incoming_connections(node))
+    assert np.array_equal(grid.walkable, graph.walkable)
+    assert grid.has_uniform_costs() == graph.has_uniform_costs()
+
+def test_same_paths(graphs):
+    graph, grid = graphs
+    heuristic_class = OctileHeuristic if graph.diagonal else ManhattanHeuristic
+    for start, goal in [pair for pairs in make_queries(graph.walkable, 8, 7).values() for pair in pairs]:
+        path = pathfind_astar(grid, start, goal, heuristic_class(goal))
+        reference = pathfind_astar(graph, start, goal, heuristic_class(goal))
+        assert (path is None) == (reference is None)
+        if path is not None:
+            assert path_cost(path) == pytest.approx(path_cost(reference))
+
+def test_from_walkable_matches_tile_graph():
+    walkable = maze_walkable(24, 8)
+    graph = TileGraph.from_walkable(walkable, diagonal=True)
+    grid = GridGraph.from_walkable(walkable, diagonal=True)
+    for node in graph.nodes.values():
+        assert connection_set(grid.get_connections(node)) == connection_set(graph.get_connections(node))
+
+def test_read_only(graphs):
+    _, grid = graphs
+    node = next(iter(grid.nodes.values()))
+    with pytest.raises(TypeError):
+        grid.block_tile(node.x, node.y)
+    with pytest.raises(TypeError):
+        grid.set_edge_cost(node, grid.get_connections(node)[0].to_node, 2.0)
+
+@pytest.mark.parametrize("cache_size", [0, 16])
+def test_bounded_caches(graphs, cache_size):
+    # Con una caché pequeña, recorrer todo el mapa no conserva más de cache_size tiles y los resultados no cambian
+    graph, grid = graphs
+    grid.cache_size = cache_size
+    heuristic_class = OctileHeuristic if graph.diagonal else ManhattanHeuristic
+    for key, node in graph.nodes.items():
+        assert connection_set(grid.get_connections(node)) == connection_set(graph.get_connections(node))
+        assert connection_set(grid.get_incoming_connections(node)) == \
+            connection_set(graph.get_incoming_connections(node))
+    for start, goal in [pair for pairs in make_queries(graph.walkable, 8, 7).values() for pair in pairs]:
+        path = pathfind_astar(grid, start, goal, heuristic_class(goal))
+        reference = pathfind_astar(graph, start, goal, heuristic_class(goal))
+        assert (path is None) == (reference is None)
+        if path is not None:
+            assert path_cost(path) == pytest.approx(path_cost(reference))
+    assert max(len(grid._tile_nodes), len(grid._outgoing), len(grid._incoming_lists)) <= cache_size
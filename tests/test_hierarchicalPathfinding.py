@@ -0,0 +1,66 @@
+# @file test_hierarchicalPathfinding.py
+# @brief Pruebas de HPA* contra Dijkstra y de su reconstrucción local al editar el grafo de tiles
+# @author Anya Marcano
+# @date 2026/10/18
+
+import random
+import pytest
+from tileGraph import TileGraph
+from hierarchicalPathfinding import HierarchicalPathfinder
+from dijkstra import pathfind_dijkstra
+from pathfindingBenchmark import path_cost, random_walkable
+from pathfindingSuite import maze_walkable, open_field_walkable, make_queries
+
+def assert_valid_path(graph, path, start, goal):
+    # El camino refinado debe ser una cadena de conexiones reales del grafo de tiles entre start y goal
+    assert path[0].from_node == start and path[-1].to_node == goal
+    assert all(a.to_node == b.from_node for a, b in zip(path, path[1:]))
+    for connection in path:
+        assert any(c.to_node == connection.to_node for c in graph.get_connections(connection.from_node))
+
+def abstract_edges(hierarchical):
+    return sorted((c.from_node.x, c.from_node.y, c.to_node.x, c.to_node.y, round(c.get_cost(), 9))
+                  for connections in hierarchical.abstract.connections.values() for c in connections)
+
+@pytest.mark.parametrize("make_map", [maze_walkable, open_field_walkable, lambda size, seed: random_walkable(size, 0.3, seed)])
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_cost_against_dijkstra(make_map, diagonal):
+    # HPA* no es óptimo, pero debe encontrar camino si y solo si existe, y no alejarse mucho del óptimo en promedio
+    walkable = make_map(48, 9)
+    graph = TileGraph.from_walkable(walkable, diagonal=diagonal)
+    hierarchical = HierarchicalPathfinder(graph, 8)
+    ratios = []
+    for start, goal in [pair for pairs in make_queries(walkable, 10, 9).values() for pair in pairs]:
+        path = hierarchical.find_path(start, goal)
+        reference = pathfind_dijkstra(graph, start, goal)
+        assert (path is None) == (reference is None)
+        if path:
+            assert_valid_path(graph, path, start, goal)
+            assert path_cost(path) >= path_cost(reference) - 1e-9
+            ratios.append(path_cost(path) / path_cost(reference))
+    assert ratios and sum(ratios) / len(ratios) < 1.2
+
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_rebuild_tiles_after_edits(diagonal):
+    # Tras bloquear y desbloquear tiles, el grafo abstracto parcheado debe ser igual al de un HPA* construido desde cero
+    walkable = open_field_walkable(40, 4)
+    graph = TileGraph.from_walkable(walkable, diagonal=diagonal)
+    hierarchical = HierarchicalPathfinder(graph, 8)
+    graph.add_listener(hierarchical.rebuild_tiles)
+    rng = random.Random(4)
+    blocked = []
+    for step in range(40):
+        if blocked and rng.random() < 0.3:
+            graph.unblock_tile(*blocked.pop(rng.randrange(len(blocked))))
+        else:
+            x, y = rng.randrange(40), rng.randrange(40)
+            if graph.get_node(x, y) is not None:
+                graph.block_tile(x, y)
+                blocked.append((x, y))
+        if step % 10 == 9:
+            assert abstract_edges(hierarchical) == abstract_edges(HierarchicalPathfinder(graph, 8))
+    for start, goal in [pair for pairs in make_queries(graph.walkable, 8, 4).values() for pair in pairs]:
+        path = hierarchical.find_path(start, goal)
+        assert (path is None) == (pathfind_dijkstra(graph, start, goal) is None)
+        if path:
+            assert_valid_path(graph, path, start, goal)
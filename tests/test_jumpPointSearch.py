@@ -0,0 +1,45 @@
+# @file test_jumpPointSearch.py
+# @brief Pruebas de Jump Point Search contra Dijkstra con 4 y 8 direcciones
+# @author Anya Marcano
+# @date 2026/10/18
+
+import pytest
+from tileGraph import TileGraph
+from jumpPointSearch import pathfind_jps
+from dijkstra import pathfind_dijkstra
+from pathfindingBenchmark import path_cost
+from pathfindingSuite import maze_walkable, open_field_walkable, make_queries
+
+@pytest.mark.parametrize("make_map", [maze_walkable, open_field_walkable])
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_matches_dijkstra(make_map, diagonal):
+    walkable = make_map(48, 5)
+    graph = TileGraph.from_walkable(walkable, diagonal=diagonal)
+    for start, goal in [pair for pairs in make_queries(walkable, 8, 5).values() for pair in pairs]:
+        path = pathfind_jps(graph, start, goal)
+        reference = pathfind_dijkstra(graph, start, goal)
+        assert (path is None) == (reference is None)
+        if path is not None:
+            assert path_cost(path) == pytest.approx(path_cost(reference))
+            assert all(a.to_node == b.from_node for a, b in zip(path, path[1:]))
+
+def test_rejects_mismatched_connectivity():
+    graph = TileGraph.from_walkable(open_field_walkable(16, 0), diagonal=True)
+    start = next(iter(graph.nodes.values()))
+    with pytest.raises(ValueError):
+        pathfind_jps(graph, start, start, diagonal=False)
+
+def test_grid_follows_edits():
+    # La grilla con borde se guarda por versión del grafo: bloquear tiles del camino debe cambiar el resultado
+    graph = TileGraph.from_walkable(open_field_walkable(32, 6), diagonal=True)
+    start, goal = next((s, g) for pairs in make_queries(graph.walkable, 8, 6).values() for s, g in pairs
+                       if pathfind_dijkstra(graph, s, g) and len(pathfind_dijkstra(graph, s, g)) > 4)
+    for _ in range(5):
+        path = pathfind_jps(graph, start, goal)
+        reference = pathfind_dijkstra(graph, start, goal)
+        assert (path is None) == (reference is None)
+        if path is None:
+            break
+        assert path_cost(path) == pytest.approx(path_cost(reference))
+        middle = path[len(path) // 2].to_node
+        graph.block_tile(middle.x, middle.y)
@@ -0,0 +1,63 @@
+# @file test_landmarkHeuristic.py
+# @brief Pruebas de la heurística ALT contra Dijkstra y del rechazo de tablas de un grafo editado
+# @author Anya Marcano
+# @date 2026/10/18
+
+import numpy as np
+import pytest
+from tileGraph import TileGraph
+from landmarkHeuristic import LandmarkTables
+from aStar import pathfind_astar
+from dijkstra import pathfind_dijkstra, dijkstra_all
+from pathfindingBenchmark import path_cost, random_walkable
+from pathfindingSuite import maze_walkable, make_queries
+
+def terrain_graph(walkable, diagonal, seed):
+    # Costos de terreno no enteros, para los que unas tablas redondeadas dejarían de ser admisibles
+    tile_costs = np.random.default_rng(seed).choice([1.0, 1.3, 2.7], size=walkable.shape)
+    return TileGraph.from_walkable(walkable, diagonal=diagonal, tile_costs=tile_costs)
+
+@pytest.mark.parametrize("diagonal", [False, True])
+@pytest.mark.parametrize("make_map", [maze_walkable, lambda size, seed: random_walkable(size, 0.25, seed)])
+def test_astar_matches_dijkstra(make_map, diagonal):
+    walkable = make_map(40, 2)
+    graph = terrain_graph(walkable, diagonal, 2)
+    tables = LandmarkTables.build(graph, 6)
+    for start, goal in [pair for pairs in make_queries(walkable, 10, 2).values() for pair in pairs]:
+        path = pathfind_astar(graph, start, goal, tables.heuristic(goal, graph))
+        reference = pathfind_dijkstra(graph, start, goal)
+        assert (path is None) == (reference is None)
+        if path is not None:
+            assert path_cost(path) == pytest.approx(path_cost(reference))
+
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_heuristic_is_admissible(diagonal):
+    # La estimación nunca supera el costo exacto de Dijkstra, sin tolerancia
+    walkable = random_walkable(32, 0.2, 5)
+    graph = terrain_graph(walkable, diagonal, 5)
+    tables = LandmarkTables.build(graph, 8)
+    goal = graph.get_node(*tables.landmarks[-1])
+    exact, _ = dijkstra_all(graph, goal, reverse=True)
+    heuristic = tables.heuristic(goal)
+    assert all(heuristic.estimate(node) <= cost for node, cost in exact.items())
+    table = heuristic.build_table(graph.width, graph.height)
+    assert all(table[node.y * graph.width + node.x] <= cost for node, cost in exact.items())
+
+def test_rejects_stale_tables(tmp_path):
+    graph = terrain_graph(random_walkable(24, 0.2, 7), True, 7)
+    tables = LandmarkTables.build(graph, 4)
+    assert tables.matches(graph)
+    tables.save(str(tmp_path / "landmarks.npz"))
+    loaded = LandmarkTables.load(str(tmp_path / "landmarks.npz"))
+    assert loaded.matches(graph) and loaded.from_landmark.dtype == np.float64
+
+    node = next(node for node in graph.nodes.values() if (node.x, node.y) not in map(tuple, tables.landmarks))
+    graph.block_tile(node.x, node.y)
+    assert not tables.matches(graph) and not loaded.matches(graph)
+    with pytest.raises(ValueError):
+        tables.heuristic(node, graph)
+    graph.unblock_tile(node.x, node.y)
+    assert tables.matches(graph)
+    neighbour = graph.get_connections(node)[0].to_node
+    graph.set_edge_cost(node, neighbour, 0.5)
+    assert not tables.matches(graph)
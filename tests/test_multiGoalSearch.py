@@ -0,0 +1,79 @@
+# @file test_multiGoalSearch.py
+# @brief Pruebas de la búsqueda de los objetivos más cercanos contra Dijkstra corrido una vez por objetivo
+# @author Anya Marcano
+# @date 2026/10/18
+
+import random
+import numpy as np
+import pytest
+from tileGraph import TileGraph
+from multiGoalSearch import pathfind_k_nearest, pathfind_nearest
+from dijkstra import pathfind_dijkstra
+from pathfindingBenchmark import path_cost, random_walkable
+from pathfindingSuite import maze_walkable
+
+def reference_costs(graph, start, goals):
+    # Costo de Dijkstra hasta cada objetivo alcanzable
+    costs = {}
+    for goal in goals:
+        path = pathfind_dijkstra(graph, start, goal)
+        if path is not None:
+            costs[goal] = path_cost(path)
+    return costs
+
+def assert_valid_path(path, start, goal):
+    if not path:
+        assert start == goal
+        return
+    assert path[0].from_node == start and path[-1].to_node == goal
+    assert all(a.to_node == b.from_node for a, b in zip(path, path[1:]))
+
+@pytest.mark.parametrize("diagonal", [False, True])
+@pytest.mark.parametrize("make_map", [maze_walkable, lambda size, seed: random_walkable(size, 0.4, seed)])
+def test_k_nearest_matches_dijkstra(make_map, diagonal):
+    # Con 40% de paredes el mapa queda partido en muchas regiones, así que hay objetivos inalcanzables
+    graph = TileGraph.from_walkable(make_map(32, 4), diagonal=diagonal)
+    nodes = list(graph.nodes.values())
+    rng = random.Random(4)
+    for _ in range(8):
+        start = rng.choice(nodes)
+        goals = rng.sample(nodes, 12)
+        reference = reference_costs(graph, start, goals)
+        for k in (1, 3, len(goals)):
+            found = pathfind_k_nearest(graph, start, goals, k)
+            assert len(found) == min(k, len(reference))
+            costs = [path_cost(path) for path, _ in found]
+            assert costs == pytest.approx(sorted(reference.values())[:k])
+            for path, goal in found:
+                assert goal in reference
+                assert path_cost(path) == pytest.approx(reference[goal])
+                assert_valid_path(path, start, goal)
+        nearest = pathfind_nearest(graph, start, goals)
+        if reference:
+            assert path_cost(nearest[0]) == pytest.approx(min(reference.values()))
+        else:
+            assert nearest is None
+
+def test_ties_and_unreachable_goals():
+    # Cuatro objetivos a la misma distancia del centro y uno encerrado entre paredes
+    walkable = np.ones((11, 11), dtype=bool)
+    walkable[0:3, 0:3] = False
+    walkable[1, 1] = True
+    graph = TileGraph.from_walkable(walkable)
+    start = graph.get_node(5, 5)
+    tied = [graph.get_node(5, 2), graph.get_node(8, 5), graph.get_node(5, 8), graph.get_node(2, 5)]
+    isolated = graph.get_node(1, 1)
+    found = pathfind_k_nearest(graph, start, [isolated] + tied, 10)
+    assert [path_cost(path) for path, _ in found] == [3, 3, 3, 3]
+    assert {goal for _, goal in found} == set(tied)
+    path, goal = pathfind_nearest(graph, start, [isolated] + tied)
+    assert goal in tied and path_cost(path) == 3
+    assert pathfind_nearest(graph, start, [isolated]) is None
+    assert pathfind_k_nearest(graph, start, [isolated], 3) == []
+
+def test_start_among_goals():
+    graph = TileGraph.from_walkable(np.ones((6, 6), dtype=bool))
+    start = graph.get_node(2, 2)
+    found = pathfind_k_nearest(graph, start, [graph.get_node(4, 2), start], 2)
+    assert found[0] == ([], start)
+    assert path_cost(found[1][0]) == 2
@@ -0,0 +1,66 @@
+# @file test_pathCache.py
+# @brief Pruebas de la caché de caminos: aciertos, capacidad e invalidación al editar el grafo de tiles
+# @author Anya Marcano
+# @date 2026/10/18
+
+import pytest
+from tileGraph import TileGraph
+from pathCache import PathCache
+from aStar import pathfind_astar
+from dijkstra import pathfind_dijkstra
+from manhattanHeuristic import ManhattanHeuristic
+from pathfindingBenchmark import path_cost
+from pathfindingSuite import open_field_walkable
+
+@pytest.fixture
+def graph():
+    return TileGraph.from_walkable(open_field_walkable(20, 2))
+
+def cached_astar(cache, graph, start, goal):
+    return cache.find(graph, start, goal, (pathfind_astar, ManhattanHeuristic),
+                      lambda: pathfind_astar(graph, start, goal, ManhattanHeuristic(goal)))
+
+def corners(graph):
+    nodes = sorted(graph.nodes.values(), key=lambda node: (node.y, node.x))
+    return nodes[0], nodes[-1]
+
+def test_hits_and_capacity(graph):
+    cache = PathCache(capacity=2)
+    start, goal = corners(graph)
+    first = cached_astar(cache, graph, start, goal)
+    assert cached_astar(cache, graph, start, goal) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    others = list(graph.nodes.values())[1:3]
+    for other in others:
+        cached_astar(cache, graph, start, other)
+    assert len(cache) == 2
+    # La entrada usada hace más tiempo fue la primera
+    assert cached_astar(cache, graph, start, goal) is not first
+
+@pytest.mark.parametrize("edit", ["block", "unblock", "cost"])
+def test_invalidated_by_tile_graph_edits(graph, edit):
+    cache = PathCache()
+    start, goal = corners(graph)
+    path = cached_astar(cache, graph, start, goal)
+    middle = path[len(path) // 2].to_node
+    if edit == "block":
+        graph.block_tile(middle.x, middle.y)
+    elif edit == "unblock":
+        wall = next((x, y) for y in range(graph.height) for x in range(graph.width) if graph.get_node(x, y) is None)
+        graph.unblock_tile(*wall)
+    else:
+        graph.set_edge_cost(path[0].from_node, path[0].to_node, 50.0)
+    assert len(cache) == 1
+    fresh = cached_astar(cache, graph, start, goal)
+    assert fresh is not path and cache.misses == 2
+    assert path_cost(fresh) == pytest.approx(path_cost(pathfind_dijkstra(graph, start, goal)))
+    if edit == "block":
+        assert all(connection.to_node != middle for connection in fresh)
+
+def test_other_graph_invalidates(graph):
+    cache = PathCache()
+    start, goal = corners(graph)
+    cached_astar(cache, graph, start, goal)
+    other = TileGraph.from_walkable(graph.walkable)
+    assert cached_astar(cache, other, start, goal) is not None
+    assert cache.misses == 2 and len(cache) == 1
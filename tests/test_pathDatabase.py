@@ -0,0 +1,65 @@
+# @file test_pathDatabase.py
+# @brief Pruebas de la tabla precalculada de primeros movimientos contra A*
+# @author Anya Marcano
+# @date 2026/10/18
+
+import json
+import sys
+import numpy as np
+import pygame
+import pytest
+from tileGraph import TileGraph
+from pathDatabase import PathDatabase, main, path_database_directory, validate_path_database
+from aStar import pathfind_astar
+from manhattanHeuristic import ManhattanHeuristic
+from pathfindingBenchmark import path_cost
+from pathfindingSuite import maze_walkable, open_field_walkable, make_queries
+
+@pytest.mark.parametrize("make_map", [maze_walkable, open_field_walkable])
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_matches_astar(make_map, diagonal):
+    walkable = make_map(20, 9)
+    tile_costs = np.random.default_rng(9).integers(1, 4, walkable.shape).astype(float)
+    database = PathDatabase.build(TileGraph.from_walkable(walkable, diagonal=diagonal, tile_costs=tile_costs))
+    assert validate_path_database(database, samples=400, seed=9) == []
+
+def test_save_and_load(tmp_path):
+    walkable = maze_walkable(20, 10)
+    graph = TileGraph.from_walkable(walkable)
+    database = PathDatabase.build(graph)
+    database.save(str(tmp_path / "paths"))
+    loaded = PathDatabase.load(str(tmp_path / "paths"))
+    assert loaded.matches(graph)
+    for start, goal in [pair for pairs in make_queries(walkable, 8, 10).values() for pair in pairs]:
+        path = loaded.find_path(start, goal)
+        reference = pathfind_astar(graph, start, goal, ManhattanHeuristic(goal))
+        assert (path is None) == (reference is None)
+        if path is not None:
+            assert path_cost(path) == pytest.approx(path_cost(reference))
+            assert path == [] or (path[0].from_node == start and path[-1].to_node == goal)
+
+def test_cli_terrain_bands(tmp_path, monkeypatch):
+    # Un fondo de 10x10 tiles de 4 px con una franja de barro (verde) en la mitad izquierda
+    surface = pygame.Surface((40, 40))
+    surface.fill((0, 0, 0))
+    surface.fill((0, 200, 0), pygame.Rect(0, 0, 20, 40))
+    image = str(tmp_path / "fondo.png")
+    pygame.image.save(surface, image)
+    bands = [["barro", [0, 150, 0], [50, 255, 50], 3.0]]
+    argv = ["pathDatabase.py", "build", "--image", image, "--zoom", "1", "--tile-size", "4",
+            "--cache-dir", str(tmp_path), "--samples", "0"]
+    for extra in ([], ["--terrain-bands", json.dumps(bands)]):
+        monkeypatch.setattr(sys, "argv", argv + extra)
+        with pytest.raises(SystemExit) as exit_info:
+            main()
+        assert exit_info.value.code == 0
+    plain = PathDatabase.load(path_database_directory(image, 1.0, 4, cache_dir=str(tmp_path)))
+    muddy = PathDatabase.load(path_database_directory(image, 1.0, 4, cache_dir=str(tmp_path),
+                                                      terrain_bands=[tuple(band) for band in bands]))
+    # La tabla guarda los costos de las conexiones: entrar al barro cuesta 3 y al resto 1
+    assert set(np.unique(plain.graph.costs)) == {1}
+    assert set(np.unique(muddy.graph.costs)) == {1, 3}
+    monkeypatch.setattr(sys, "argv", argv + ["--terrain-bands", "[1, 2]"])
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+    assert exit_info.value.code == 2
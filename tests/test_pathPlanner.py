@@ -0,0 +1,97 @@
+# @file test_pathPlanner.py
+# @brief Pruebas del planificador de caminos: reemplazo y unión de pedidos, descarte de resultados viejos y pool de procesos
+# @author Anya Marcano
+# @date 2026/10/18
+
+import threading
+import time
+import pytest
+from tileGraph import TileGraph
+from pathPlanner import PathPlanner
+from dijkstra import pathfind_dijkstra
+from pathfindingBenchmark import path_cost
+from pathfindingSuite import open_field_walkable
+
+@pytest.fixture
+def graph():
+    return TileGraph.from_walkable(open_field_walkable(24, 3))
+
+def tiles(graph):
+    nodes = sorted(graph.nodes.values(), key=lambda node: (node.y, node.x))
+    return nodes[0], nodes[-1], nodes[len(nodes) // 2]
+
+def poll_until(planner, agent, timeout=30.0):
+    # Llama a poll como lo haría el juego, una vez por "frame", hasta recibir el camino del agente
+    results = {}
+    deadline = time.monotonic() + timeout
+    while agent not in results and time.monotonic() < deadline:
+        results.update(planner.poll())
+        time.sleep(0.005)
+    return results
+
+@pytest.fixture
+def blocked_planner(graph):
+    # Planificador de un hilo con el hilo ocupado, para que los pedidos queden en la cola
+    planner = PathPlanner(graph, workers=1, use_processes=False)
+    release = threading.Event()
+    planner._executor.submit(release.wait)
+    yield planner, release
+    release.set()
+    planner.shutdown()
+
+def test_same_request_is_coalesced(graph, blocked_planner):
+    planner, release = blocked_planner
+    start, goal, _ = tiles(graph)
+    first = planner.request("npc", start, goal)
+    assert planner.request("npc", start, goal) is first
+    release.set()
+    results = poll_until(planner, "npc")
+    assert path_cost(results["npc"]) == pytest.approx(path_cost(pathfind_dijkstra(graph, start, goal)))
+    # Terminado el pedido, repetirlo busca de nuevo
+    assert planner.request("npc", start, goal) is not first
+
+def test_new_request_supersedes_previous(graph, blocked_planner):
+    planner, release = blocked_planner
+    start, goal, other = tiles(graph)
+    first = planner.request("npc", start, goal)
+    second = planner.request("npc", start, other)
+    assert first.cancelled()
+    release.set()
+    results = poll_until(planner, "npc")
+    assert results["npc"][-1].to_node == other
+    assert not planner.pending("npc")
+
+def test_result_of_old_version_is_dropped(graph, blocked_planner):
+    # Un pedido igual después de editar el grafo no se une al anterior, y solo llega el camino de la versión nueva
+    planner, release = blocked_planner
+    start, goal, _ = tiles(graph)
+    first = planner.request("npc", start, goal)
+    middle = pathfind_dijkstra(graph, start, goal)[5].to_node
+    graph.block_tile(middle.x, middle.y)
+    second = planner.request("npc", start, goal)
+    assert second is not first and first.cancelled()
+    release.set()
+    results = poll_until(planner, "npc")
+    assert all(connection.to_node != middle for connection in results["npc"])
+    assert path_cost(results["npc"]) == pytest.approx(path_cost(pathfind_dijkstra(graph, start, goal)))
+
+def test_process_pool_survives_edits(graph):
+    # Con procesos, cada versión viaja en memoria compartida a los mismos procesos y las viejas se liberan
+    planner = PathPlanner(graph, workers=1)
+    try:
+        executor = planner._executor
+        start, goal, _ = tiles(graph)
+        blocked = set()
+        for _ in range(3):
+            planner.request("npc", start, goal)
+            path = poll_until(planner, "npc")["npc"]
+            assert path_cost(path) == pytest.approx(path_cost(pathfind_dijkstra(graph, start, goal)))
+            assert not blocked & {(connection.to_node.x, connection.to_node.y) for connection in path}
+            middle = path[len(path) // 2].to_node
+            graph.block_tile(middle.x, middle.y)
+            blocked.add((middle.x, middle.y))
+        assert planner._executor is executor
+        assert len(planner._shared) == 1
+    finally:
+        planner.shutdown()
+    assert not planner._shared
@@ -0,0 +1,90 @@
+# @file test_pathSmoothing.py
+# @brief Pruebas de la línea de visión y del suavizado de caminos: sin atajos por paredes ni por otro terreno
+# @author Anya Marcano
+# @date 2026/10/18
+
+import math
+import numpy as np
+import pytest
+from tileGraph import TileGraph
+from pathSmoothing import LineOfSight, smooth_path
+from aStar import pathfind_astar
+from manhattanHeuristic import ManhattanHeuristic
+from octileHeuristic import OctileHeuristic
+from pathfindingBenchmark import path_cost, random_walkable
+from pathfindingSuite import maze_walkable, make_queries
+
+def tiles_crossed(x0, y0, x1, y1, samples_per_tile=64):
+    # Los tiles que toca la recta entre los centros de dos tiles, muestreada densamente y un poco a cada lado
+    # para contar también los tiles que la recta solo roza en una esquina
+    steps = max(1, int(math.hypot(x1 - x0, y1 - y0) * samples_per_tile))
+    tiles = set()
+    for i in range(steps + 1):
+        px, py = x0 + 0.5 + (x1 - x0) * i / steps, y0 + 0.5 + (y1 - y0) * i / steps
+        for ox, oy in [(0, 0), (1e-6, 1e-6), (-1e-6, -1e-6), (1e-6, -1e-6), (-1e-6, 1e-6)]:
+            tiles.add((math.floor(px + ox), math.floor(py + oy)))
+    return tiles
+
+def terrain_costs(shape, seed):
+    # Bloques de terreno de costo 1 y 3
+    rng = np.random.default_rng(seed)
+    blocks = rng.choice([1.0, 3.0], size=(shape[0] // 6 + 1, shape[1] // 6 + 1))
+    return np.kron(blocks, np.ones((6, 6)))[:shape[0], :shape[1]]
+
+def smoothed_paths(graph, walkable, seed):
+    heuristic_class = OctileHeuristic if graph.diagonal else ManhattanHeuristic
+    for start, goal in [pair for pairs in make_queries(walkable, 10, seed).values() for pair in pairs]:
+        path = pathfind_astar(graph, start, goal, heuristic_class(goal))
+        if path:
+            yield path, smooth_path(graph, path)
+
+def test_line_of_sight_blocked_by_walls_and_corners():
+    walkable = np.ones((5, 5), dtype=bool)
+    walkable[2, 2] = False
+    line_of_sight = LineOfSight(walkable)
+    assert line_of_sight.clear(0, 0, 4, 0)
+    assert not line_of_sight.clear(0, 2, 4, 2)
+    assert not line_of_sight.clear(0, 0, 4, 4)
+    # La recta de (1, 1) a (3, 3) pasa justo por la esquina del tile (2, 2) al salir de (1, 1)
+    walkable = np.ones((4, 4), dtype=bool)
+    walkable[0, 1] = False
+    line_of_sight = LineOfSight(walkable)
+    assert not line_of_sight.clear(0, 0, 1, 1)
+    assert line_of_sight.clear(0, 1, 3, 1)
+
+def test_line_of_sight_blocked_by_cost_change():
+    walkable = np.ones((3, 6), dtype=bool)
+    tile_costs = np.ones((3, 6))
+    tile_costs[:, 3:] = 2.0
+    line_of_sight = LineOfSight(walkable, tile_costs)
+    assert line_of_sight.clear(0, 1, 2, 1)
+    assert line_of_sight.clear(3, 0, 5, 2)
+    assert not line_of_sight.clear(0, 1, 5, 1)
+    assert line_of_sight.cost(4, 1) == 2.0
+
+@pytest.mark.parametrize("diagonal", [False, True])
+@pytest.mark.parametrize("make_map", [maze_walkable, lambda size, seed: random_walkable(size, 0.25, seed)])
+def test_smoothing_never_crosses_walls_or_terrain(make_map, diagonal):
+    walkable = make_map(40, 3)
+    tile_costs = terrain_costs(walkable.shape, 3)
+    graph = TileGraph.from_walkable(walkable, diagonal=diagonal, tile_costs=tile_costs)
+    for path, smoothed in smoothed_paths(graph, walkable, 3):
+        assert smoothed[0].from_node == path[0].from_node and smoothed[-1].to_node == path[-1].to_node
+        assert all(a.to_node == b.from_node for a, b in zip(smoothed, smoothed[1:]))
+        for segment in smoothed:
+            start, end = segment.from_node, segment.to_node
+            if segment in path:
+                continue
+            crossed = tiles_crossed(start.x, start.y, end.x, end.y)
+            assert all(walkable[y, x] for x, y in crossed)
+            assert {tile_costs[y, x] for x, y in crossed} == {tile_costs[start.y, start.x]}
+
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_smoothing_never_costs_more(diagonal):
+    walkable = random_walkable(48, 0.2, 8)
+    graph = TileGraph.from_walkable(walkable, diagonal=diagonal, tile_costs=terrain_costs(walkable.shape, 8))
+    shortened = 0
+    for path, smoothed in smoothed_paths(graph, walkable, 8):
+        assert path_cost(smoothed) <= path_cost(path) + 1e-9
+        shortened += len(smoothed) < len(path)
+    assert shortened > 0
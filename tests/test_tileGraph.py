@@ -0,0 +1,49 @@
+# @file test_tileGraph.py
+# @brief Pruebas del grafo de tiles: constructor vectorizado contra el de referencia y ediciones contra reconstruir el grafo
+# @author Anya Marcano
+# @date 2026/10/18
+
+import os
+import numpy as np
+import pygame
+import pytest
+from tileGraph import TileGraph, label_components
+from pathfindingSuite import maze_walkable
+
+BACKGROUND_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Assets", "disenoFondo.png")
+
+def connection_set(graph):
+    return {(c.from_node.x, c.from_node.y, c.to_node.x, c.to_node.y, c.get_cost())
+            for connections in graph.connections.values() for c in connections}
+
+@pytest.fixture(scope="module")
+def background():
+    # El fondo del juego escalado como en main.py (ZOOM = 3)
+    image = pygame.image.load(BACKGROUND_PATH)
+    return pygame.transform.scale(image, (image.get_width() * 3, image.get_height() * 3))
+
+@pytest.mark.parametrize("tile_size", [66, 33])
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_vectorized_builder_matches_reference(background, tile_size, diagonal):
+    graph = TileGraph(background, tile_size, diagonal=diagonal)
+    reference = TileGraph(background, tile_size, diagonal=diagonal)
+    reference.create_graph_from_maze_reference()
+    assert set(graph.nodes) == set(reference.nodes)
+    assert connection_set(graph) == connection_set(reference)
+
+def test_edits_match_rebuilt_graph():
+    # Bloquear y desbloquear tiles deja las mismas conexiones y regiones que construir el grafo desde cero
+    graph = TileGraph.from_walkable(maze_walkable(24, 6), diagonal=True)
+    rng = np.random.default_rng(6)
+    for _ in range(60):
+        x, y = (int(v) for v in rng.integers(0, 24, 2))
+        if rng.random() < 0.4:
+            graph.block_tile(x, y)
+        else:
+            graph.unblock_tile(x, y)
+        rebuilt = TileGraph.from_walkable(graph.walkable, diagonal=True)
+        assert connection_set(graph) == connection_set(rebuilt)
+        labels, expected = graph.component_labels(), label_components(graph.walkable)
+        assert np.array_equal(labels >= 0, expected >= 0)
+        pairs = {(int(a), int(b)) for a, b in zip(labels[labels >= 0], expected[expected >= 0])}
+        assert len(pairs) == len({a for a, _ in pairs}) == len({b for _, b in pairs})
@@ -0,0 +1,69 @@
+# @file test_timeSlicedAStar.py
+# @brief Pruebas de A* repartido entre frames: con cualquier presupuesto da el mismo resultado que pathfind_astar
+# @author Anya Marcano
+# @date 2026/10/18
+
+import pytest
+from tileGraph import TileGraph
+from timeSlicedAStar import TimeSlicedAStar
+from aStar import pathfind_astar
+from manhattanHeuristic import ManhattanHeuristic
+from octileHeuristic import OctileHeuristic
+from pathfindingBenchmark import path_cost
+from pathfindingSuite import maze_walkable, open_field_walkable, make_queries
+
+def assert_starts_at(path, start):
+    if path:
+        assert path[0].from_node == start
+        assert all(a.to_node == b.from_node for a, b in zip(path, path[1:]))
+
+@pytest.mark.parametrize("make_map", [maze_walkable, open_field_walkable])
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_budgets_match_astar(make_map, diagonal):
+    walkable = make_map(40, 6)
+    graph = TileGraph.from_walkable(walkable, diagonal=diagonal)
+    heuristic_class = OctileHeuristic if diagonal else ManhattanHeuristic
+    for start, goal in [pair for pairs in make_queries(walkable, 6, 6).values() for pair in pairs]:
+        reference = pathfind_astar(graph, start, goal, heuristic_class(goal))
+        whole = TimeSlicedAStar(graph, start, goal, heuristic_class(goal))
+        whole.run()
+        for max_nodes in (1, 7, 64):
+            search = TimeSlicedAStar(graph, start, goal, heuristic_class(goal))
+            steps = 0
+            while not search.step(max_nodes=max_nodes):
+                steps += 1
+                assert_starts_at(search.partial_path(), start)
+            assert search.expanded == whole.expanded
+            assert steps >= (search.expanded - 1) // max_nodes
+            path = search.path()
+            assert (path is None) == (reference is None)
+            if path is not None:
+                assert path_cost(path) == pytest.approx(path_cost(reference))
+                assert_starts_at(path, start)
+                assert path[-1].to_node == goal
+
+def test_time_budget_always_progresses():
+    # Un presupuesto de tiempo menor que una expansión igual avanza un nodo por llamada hasta terminar
+    walkable = maze_walkable(24, 2)
+    graph = TileGraph.from_walkable(walkable)
+    start, goal = max((pair for pairs in make_queries(walkable, 6, 2).values() for pair in pairs),
+                      key=lambda pair: abs(pair[0].x - pair[1].x) + abs(pair[0].y - pair[1].y))
+    search = TimeSlicedAStar(graph, start, goal, ManhattanHeuristic(goal))
+    calls = 1
+    while not search.step(max_time_us=0.001):
+        calls += 1
+    reference = pathfind_astar(graph, start, goal, ManhattanHeuristic(goal))
+    assert (search.path() is None) == (reference is None)
+    if reference is not None:
+        assert path_cost(search.path()) == pytest.approx(path_cost(reference))
+    assert calls >= search.expanded
+
+def test_unreachable_goal_finishes_immediately():
+    walkable = open_field_walkable(16, 1)
+    walkable[:, 8] = False
+    graph = TileGraph.from_walkable(walkable)
+    start = next(node for node in graph.nodes.values() if node.x < 8)
+    goal = next(node for node in graph.nodes.values() if node.x > 8)
+    search = TimeSlicedAStar(graph, start, goal, ManhattanHeuristic(goal))
+    assert search.finished and search.step(max_nodes=1)
+    assert search.path() is None and search.expanded == 0